@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+#
+# Author: Taylor Smith <taylor.smith@alkaline-ml.com>
+#
+# Benchmark the accuracy and time of SelectiveImputer's approximate median
+# and mode strategies against the exact ones on a single large column. The
+# median's error is the distance of its rank from the middle rank, as a
+# fraction of the number of values; the mode's is how many fewer times its
+# value occurs than the true mode's. Usage:
+#
+#     $ python benchmarks/bench_approx_strategies.py [n_samples] [n_jobs]
+
+from __future__ import print_function, division, absolute_import
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from skoot.impute import SelectiveImputer
+
+
+def timed_fit(X, strategy, n_jobs):
+    start = time.time()
+    imputer = SelectiveImputer(strategy=strategy, n_jobs=n_jobs).fit(X)
+    return imputer.statistics_['x'], time.time() - start
+
+
+def main(n_samples, n_jobs):
+    rs = np.random.RandomState(42)
+    x = np.concatenate([rs.lognormal(size=n_samples // 2),
+                        rs.zipf(1.3, n_samples - n_samples // 2) * 1.])
+    x[rs.rand(n_samples) < 0.05] = np.nan
+    X = pd.DataFrame({'x': x})
+
+    present = np.sort(x[~np.isnan(x)])
+    counts = pd.Series(present).value_counts()
+
+    print("SelectiveImputer.fit, 1 column of %i rows, n_jobs=%i"
+          % (n_samples, n_jobs))
+    print("%-22s%12s%12s%10s%16s" % ("strategy", "exact (s)", "approx (s)",
+                                     "speedup", "error"))
+
+    exact, t_exact = timed_fit(X, "median", n_jobs)
+    approx, t_approx = timed_fit(X, "approx_median", n_jobs)
+    rank = np.searchsorted(present, approx)
+    error = abs(rank - present.shape[0] / 2.) / present.shape[0]
+    print("%-22s%12.3f%12.3f%10.2f%15.4f%%"
+          % ("median", t_exact, t_approx, t_exact / t_approx, error * 100))
+
+    exact, t_exact = timed_fit(X, "most_frequent", n_jobs)
+    approx, t_approx = timed_fit(X, "approx_most_frequent", n_jobs)
+    error = counts[exact] - counts.get(approx, 0)
+    print("%-22s%12.3f%12.3f%10.2f%16i"
+          % ("most_frequent", t_exact, t_approx, t_exact / t_approx, error))
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 20000000,
+         int(args[1]) if len(args) > 1 else 1)
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+#
+# Author: Taylor Smith <taylor.smith@alkaline-ml.com>
+#
+# Benchmark the per-call ``transform`` latency of the ndarray-native fast
+# path (``as_df=False`` with array input) against the pandas path for the
+# small batch sizes typical of online scoring. Usage:
+#
+#     $ python benchmarks/bench_array_path.py
+
+from __future__ import print_function, division, absolute_import
+
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from skoot.decomposition import SelectivePCA
+from skoot.feature_selection import NearZeroVarianceFilter
+from skoot.impute import SelectiveImputer
+from skoot.preprocessing import SelectiveStandardScaler
+
+
+def make_data(n_samples, n_features, random_state=42):
+    rs = np.random.RandomState(random_state)
+    X = rs.rand(n_samples, n_features)
+    X[rs.rand(n_samples, n_features) < 0.1] = np.nan
+    return X
+
+
+def per_call_us(transformer, X, n_calls=50):
+    # the best of several repeats, in microseconds per call
+    times = timeit.repeat(lambda: transformer.transform(X), number=n_calls,
+                          repeat=3)
+    return min(times) / n_calls * 1e6
+
+
+def main():
+    n_features = 20
+    X_train = make_data(5000, n_features)
+    X_train_filled = np.nan_to_num(X_train)
+    half = list(range(n_features // 2))
+
+    transformers = [
+        ("SelectiveImputer", SelectiveImputer(as_df=False), X_train),
+        ("SelectiveStandardScaler",
+         SelectiveStandardScaler(cols=half, as_df=False), X_train_filled),
+        ("SelectivePCA", SelectivePCA(cols=half, n_components=3,
+                                      as_df=False), X_train_filled),
+        ("NearZeroVarianceFilter", NearZeroVarianceFilter(as_df=False),
+         X_train_filled)
+    ]
+
+    print("Per-call transform latency (us), n_features=%i" % n_features)
+    print("%-26s%8s%14s%14s%10s" % ("transformer", "rows", "pandas",
+                                    "ndarray", "speedup"))
+
+    for name, transformer, X in transformers:
+        transformer.fit(X)
+        for n_rows in (1, 10, 100):
+            batch = X[:n_rows]
+            frame = pd.DataFrame.from_records(batch)
+            t_pd = per_call_us(transformer, frame)
+            t_np = per_call_us(transformer, batch)
+            print("%-26s%8i%14.1f%14.1f%9.1fx"
+                  % (name, n_rows, t_pd, t_np, t_pd / t_np))
+
+
+if __name__ == "__main__":
+    main()
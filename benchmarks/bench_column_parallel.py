@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+#
+# Author: Taylor Smith <taylor.smith@alkaline-ml.com>
+#
+# Benchmark how the column-parallel ``transform`` of the column-independent
+# transformers scales from 1 to N cores. The default frame is 1M x 500
+# (~4GB of float64), so make sure there is enough memory, or pass a smaller
+# shape. Usage:
+#
+#     $ python benchmarks/bench_column_parallel.py [n_samples] [n_features]
+
+from __future__ import print_function, division, absolute_import
+
+import multiprocessing
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from skoot.impute import SelectiveImputer
+from skoot.preprocessing import BinningTransformer, YeoJohnsonTransformer
+
+
+def make_data(n_samples, n_features, random_state=42):
+    # build column-by-column to avoid holding two copies of the data
+    rs = np.random.RandomState(random_state)
+    X = pd.DataFrame(index=np.arange(n_samples))
+    for i in range(n_features):
+        x = rs.lognormal(size=n_samples)  # skewed, for the YJ transform
+        x[rs.rand(n_samples) < 0.05] = np.nan
+        X["x%i" % i] = x
+    return X
+
+
+def n_jobs_range(max_jobs):
+    # 1, 2, 4, ... up to and including the number of cores
+    n_jobs = [1]
+    while n_jobs[-1] * 2 < max_jobs:
+        n_jobs.append(n_jobs[-1] * 2)
+    if max_jobs > 1:
+        n_jobs.append(max_jobs)
+    return n_jobs
+
+
+def best_time(func, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.time()
+        func()
+        times.append(time.time() - start)
+    return min(times)
+
+
+def main(n_samples, n_features):
+    X = make_data(n_samples, n_features)
+    X_filled = X.fillna(1.)
+
+    # fit on a sample, since we are only timing transform
+    sample = X_filled.iloc[:10000]
+    cols = X.columns.tolist()
+    with np.errstate(all="ignore"):  # the lambda search may overflow
+        transformers = [
+            ("SelectiveImputer", SelectiveImputer().fit(X.iloc[:10000]), X),
+            ("BinningTransformer",
+             BinningTransformer(cols=cols, n_bins=10,
+                                return_bin_label=False).fit(sample),
+             X_filled),
+            ("YeoJohnsonTransformer",
+             YeoJohnsonTransformer(backend="threading").fit(sample),
+             X_filled)
+        ]
+
+    n_cores = multiprocessing.cpu_count()
+    print("Column-parallel transform, X.shape=(%i, %i), %i cores"
+          % (n_samples, n_features, n_cores))
+    print("%-24s%8s%12s%10s" % ("transformer", "n_jobs", "time (s)",
+                                "speedup"))
+
+    for name, transformer, X_trans in transformers:
+        serial = None
+        for n_jobs in n_jobs_range(n_cores):
+            transformer.set_params(n_jobs=n_jobs)
+            elapsed = best_time(lambda: transformer.transform(X_trans))
+            if serial is None:
+                serial = elapsed
+            print("%-24s%8i%12.3f%10.2f"
+                  % (name, n_jobs, elapsed, serial / elapsed))
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 1000000,
+         int(args[1]) if len(args) > 1 else 500)
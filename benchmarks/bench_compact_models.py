@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+#
+# Author: Taylor Smith <taylor.smith@alkaline-ml.com>
+#
+# Benchmark BaggedRegressorImputer's compact models: the pickled size of the
+# fitted imputer, the time to load it, and the time to transform with the
+# bagging models vs. their flat node tables. Usage:
+#
+#     $ python benchmarks/bench_compact_models.py [n_samples] [n_features]
+
+from __future__ import print_function, division, absolute_import
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from sklearn.externals.six.moves import cPickle as pickle
+
+from skoot.impute import BaggedRegressorImputer
+
+
+def best_time(func, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.time()
+        func()
+        times.append(time.time() - start)
+    return min(times)
+
+
+def main(n_samples, n_features):
+    rs = np.random.RandomState(42)
+    z = rs.rand(n_samples, 1)
+    X = z + rs.rand(n_samples, n_features) * 0.1
+    X[rs.rand(n_samples, n_features) < 0.1] = np.nan
+    X = pd.DataFrame.from_records(
+        X, columns=["x%i" % i for i in range(n_features)])
+
+    print("BaggedRegressorImputer, %i rows x %i columns"
+          % (n_samples, n_features))
+    print("%-10s%14s%12s%16s" % ("models", "pickled (MB)", "load (s)",
+                                 "transform (s)"))
+
+    for compact in (False, True):
+        imputer = BaggedRegressorImputer(random_state=42, compact=compact)
+        imputer.fit(X)
+        dumped = pickle.dumps(imputer, protocol=pickle.HIGHEST_PROTOCOL)
+
+        t_load = best_time(lambda: pickle.loads(dumped))
+        t_trans = best_time(lambda: imputer.transform(X))
+        print("%-10s%14.2f%12.3f%16.3f"
+              % ("compact" if compact else "bagging", len(dumped) / 2. ** 20,
+                 t_load, t_trans))
+
+    before, after = imputer.model_nbytes_
+    print("\nmodel_nbytes_: %i -> %i bytes (%.1fx smaller)"
+          % (before, after, before / after))
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 100000,
+         int(args[1]) if len(args) > 1 else 10)
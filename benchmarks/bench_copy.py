@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+#
+# Author: Taylor Smith <taylor.smith@alkaline-ml.com>
+#
+# Benchmark the peak memory and wall time of a long pipeline of skoot
+# transformers with ``copy=True`` (the default) vs. ``copy=False``.
+#
+# Each configuration is run in a fresh subprocess so the peak resident set
+# size (RSS) reported by ``resource.getrusage`` is not polluted by the other
+# run. Usage:
+#
+#     $ python benchmarks/bench_copy.py [n_samples] [n_features]
+
+from __future__ import print_function, division, absolute_import
+
+import subprocess
+import resource
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from sklearn.pipeline import Pipeline
+
+from skoot.impute import SelectiveImputer
+from skoot.preprocessing import BinningTransformer, SchemaNormalizer
+from skoot.feature_selection import SparseFeatureFilter
+
+
+def make_data(n_samples, n_features, random_state=42):
+    # build column-by-column so generating the data does not inflate the
+    # peak RSS beyond the size of the frame itself
+    rs = np.random.RandomState(random_state)
+    X = pd.DataFrame(index=np.arange(n_samples))
+    for i in range(n_features):
+        x = rs.rand(n_samples)
+        x[rs.rand(n_samples) < 0.05] = np.nan
+        X["x%i" % i] = x
+    return X
+
+
+def make_pipeline(cols, copy):
+    # The first step always copies so the caller's frame is left untouched;
+    # every subsequent step owns its input and may work in place.
+    return Pipeline([
+        ("filter", SparseFeatureFilter(threshold=0.5)),
+        ("mean", SelectiveImputer(strategy="mean")),
+        ("median", SelectiveImputer(strategy="median", copy=copy)),
+        ("schema", SchemaNormalizer(
+            schema={c: np.float32 for c in cols[::2]}, copy=copy)),
+        ("bin", BinningTransformer(cols=cols[:5], n_bins=5,
+                                   return_bin_label=False, copy=copy))
+    ])
+
+
+def _peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on OS X and kilobytes on Linux
+    if sys.platform == "darwin":
+        return peak / (1024. ** 2)
+    return peak / 1024.
+
+
+def run_one(copy, n_samples, n_features):
+    X = make_data(n_samples, n_features)
+    baseline = _peak_rss_mb()
+
+    pipe = make_pipeline(X.columns.tolist(), copy)
+    start = time.time()
+    pipe.fit(X)
+    for _ in range(3):
+        pipe.transform(X)
+    elapsed = time.time() - start
+
+    print("%s,%.3f,%.1f,%.1f" % (copy, elapsed, baseline, _peak_rss_mb()))
+
+
+def main(n_samples, n_features):
+    print("Pipeline of 5 transformers, X.shape=(%i, %i)"
+          % (n_samples, n_features))
+    print("%-8s%12s%18s%18s" % ("copy", "time (s)", "data RSS (MB)",
+                                "peak RSS (MB)"))
+
+    for copy in (True, False):
+        out = subprocess.check_output(
+            [sys.executable, __file__, "--child", str(int(copy)),
+             str(n_samples), str(n_features)])
+        line = out.decode("utf-8").strip().splitlines()[-1]
+        cp, elapsed, baseline, peak = line.split(",")
+        print("%-8s%12s%18s%18s" % (cp, elapsed, baseline, peak))
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if args and args[0] == "--child":
+        run_one(bool(int(args[1])), int(args[2]), int(args[3]))
+    else:
+        main(int(args[0]) if args else 200000,
+             int(args[1]) if len(args) > 1 else 50)
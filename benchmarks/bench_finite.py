@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+#
+# Author: Taylor Smith <taylor.smith@alkaline-ml.com>
+#
+# Microbenchmark the ``assert_all_finite`` check in ``check_dataframe``
+# against the previous per-Series ``apply`` implementation on frames of
+# increasing width. Usage:
+#
+#     $ python benchmarks/bench_finite.py
+
+from __future__ import print_function, division, absolute_import
+
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from skoot.utils.validation import _assert_all_finite
+
+
+def legacy_check(X, cols):
+    # the implementation this replaced
+    if X[cols].apply(lambda x: (~np.isfinite(x)).sum()).sum() > 0:
+        raise ValueError('Expected all entries in specified columns '
+                         'to be finite')
+
+
+def make_data(n_samples, n_features, random_state=42):
+    rs = np.random.RandomState(random_state)
+    X = pd.DataFrame.from_records(rs.rand(n_samples, n_features))
+
+    # add an integer block, which the new check can skip
+    X["ints"] = rs.randint(0, 10, n_samples)
+    return X
+
+
+def bench(func, X, cols, n_repeat=5):
+    return min(timeit.repeat(lambda: func(X, cols), number=1,
+                             repeat=n_repeat))
+
+
+def main():
+    n_samples = 1000
+    print("n_samples=%i" % n_samples)
+    print("%-12s%14s%14s%10s" % ("n_features", "legacy (s)", "blocked (s)",
+                                 "speedup"))
+
+    for n_features in (10, 100, 1000, 10000):
+        X = make_data(n_samples, n_features)
+        cols = X.columns.tolist()
+        t_legacy = bench(legacy_check, X, cols)
+        t_new = bench(_assert_all_finite, X, cols)
+        print("%-12i%14.5f%14.5f%9.1fx" % (n_features, t_legacy, t_new,
+                                           t_legacy / t_new))
+
+    # the worst case for the new check is a NaN in the last column, since
+    # it has to scan everything before it
+    X = make_data(n_samples, 10000)
+    X.iloc[-1, -2] = np.nan
+    cols = X.columns.tolist()
+
+    def _raises(func):
+        def _inner(X, cols):
+            try:
+                func(X, cols)
+            except ValueError:
+                return
+            raise AssertionError("Expected a ValueError")
+        return _inner
+
+    print("\nNaN in the last float column (n_features=10000)")
+    print("legacy:  %.5f s" % bench(_raises(legacy_check), X, cols))
+    print("blocked: %.5f s" % bench(_raises(_assert_all_finite), X, cols))
+
+
+if __name__ == "__main__":
+    main()
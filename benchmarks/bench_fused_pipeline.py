@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+#
+# Author: Taylor Smith <taylor.smith@alkaline-ml.com>
+#
+# Benchmark the ``transform`` of a FusedPipeline against the equivalent
+# sklearn Pipeline on the usual SchemaNormalizer -> DateTransformer ->
+# DateFactorizer -> SelectiveImputer -> DummyEncoder -> MultiCorrFilter
+# chain. The outputs are checked for equality first. Usage:
+#
+#     $ python benchmarks/bench_fused_pipeline.py [n_samples] [n_features]
+
+from __future__ import print_function, division, absolute_import
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from pandas.util.testing import assert_frame_equal
+
+from sklearn.pipeline import Pipeline
+
+from skoot.feature_extraction import DateFactorizer
+from skoot.feature_selection import MultiCorrFilter
+from skoot.impute import SelectiveImputer
+from skoot.pipeline import FusedPipeline
+from skoot.preprocessing import (DateTransformer, DummyEncoder,
+                                 SchemaNormalizer)
+
+
+def make_data(n_samples, n_features, random_state=42):
+    # numeric features (some read as strings, some correlated, with NaNs),
+    # two string dates and a few categorical features
+    rs = np.random.RandomState(random_state)
+    X = pd.DataFrame(index=np.arange(n_samples))
+    for i in range(n_features):
+        x = rs.rand(n_samples)
+        if i % 5 == 4:  # highly correlated with the previous one
+            x = X["x%i" % (i - 1)].values * 2. + rs.rand(n_samples) * 1e-3
+        x[rs.rand(n_samples) < 0.05] = np.nan
+        X["x%i" % i] = x
+
+    for i in range(0, n_features, 10):
+        X["x%i" % i] = X["x%i" % i].astype(str)
+
+    start = np.datetime64("2018-01-01T00:00")
+    for name in ("created", "updated"):
+        minutes = rs.randint(0, 60 * 24 * 365, n_samples)
+        X[name] = pd.Series(start + minutes.astype("timedelta64[m]")) \
+            .dt.strftime("%Y-%m-%d %H:%M")
+
+    for i in range(4):
+        X["cat%i" % i] = rs.choice(["a", "b", "c", "d", "e"], n_samples)
+    return X
+
+
+def best_time(func, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.time()
+        func()
+        times.append(time.time() - start)
+    return min(times)
+
+
+def main(n_samples, n_features):
+    X = make_data(n_samples, n_features)
+    dates = ["created", "updated"]
+    factorized = ["%s_%s" % (d, f) for d in dates
+                  for f in ("year", "month", "day", "hour")]
+    numeric = ["x%i" % i for i in range(n_features)]
+
+    pipe = Pipeline([
+        ("schema", SchemaNormalizer(schema={"x%i" % i: float
+                                            for i in range(0, n_features,
+                                                           10)})),
+        ("dates", DateTransformer(cols=dates,
+                                  date_format="%Y-%m-%d %H:%M")),
+        ("factorize", DateFactorizer(cols=dates)),
+        ("impute", SelectiveImputer(cols=numeric + factorized)),
+        ("dummy", DummyEncoder(cols=["cat%i" % i for i in range(4)])),
+        ("corr", MultiCorrFilter(threshold=0.9))
+    ]).fit(X)
+    fused = FusedPipeline(pipe.steps)
+
+    # the outputs must be identical
+    expected = pipe.transform(X)
+    assert_frame_equal(fused.transform(X), expected)
+
+    print("Pipeline transform, X.shape=(%i, %i) -> %r"
+          % (X.shape + (expected.shape,)))
+    t_pipe = best_time(lambda: pipe.transform(X))
+    t_fused = best_time(lambda: fused.transform(X))
+    print("%-16s%12s" % ("pipeline", "time (s)"))
+    print("%-16s%12.3f" % ("Pipeline", t_pipe))
+    print("%-16s%12.3f" % ("FusedPipeline", t_fused))
+    print("speedup: %.2fx" % (t_pipe / t_fused))
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 1000000,
+         int(args[1]) if len(args) > 1 else 50)
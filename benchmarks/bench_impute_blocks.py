@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+#
+# Author: Taylor Smith <taylor.smith@alkaline-ml.com>
+#
+# Benchmark SelectiveImputer.transform filling each column with its own
+# masked assignment vs. filling same-dtype columns as 2-D blocks, across
+# frame widths. Usage:
+#
+#     $ python benchmarks/bench_impute_blocks.py [n_samples]
+
+from __future__ import print_function, division, absolute_import
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from skoot.impute import SelectiveImputer, _impute_column
+
+
+def best_time(func, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.time()
+        func()
+        times.append(time.time() - start)
+    return min(times)
+
+
+def make_data(n_samples, n_features, random_state=42):
+    rs = np.random.RandomState(random_state)
+    X = rs.rand(n_samples, n_features)
+    X[rs.rand(n_samples, n_features) < 0.05] = np.nan
+    return pd.DataFrame.from_records(
+        X, columns=["x%i" % i for i in range(n_features)])
+
+
+def per_column(imputer, X):
+    # the column-at-a-time fill the bulk path replaces
+    X = X.copy()
+    for c, value in imputer.statistics_.items():
+        X[c] = _impute_column(X[c], value, imputer.missing_values)
+    return X
+
+
+def main(n_samples):
+    print("SelectiveImputer.transform, %i rows" % n_samples)
+    print("%-12s%16s%16s%10s" % ("n_features", "per-column (s)",
+                                 "blocks (s)", "speedup"))
+
+    for n_features in (10, 100, 500, 2000):
+        X = make_data(n_samples, n_features)
+        imputer = SelectiveImputer().fit(X)
+
+        # make sure they agree before timing them
+        pd.util.testing.assert_frame_equal(per_column(imputer, X),
+                                           imputer.transform(X))
+
+        t_col = best_time(lambda: per_column(imputer, X))
+        t_block = best_time(lambda: imputer.transform(X))
+        print("%-12i%16.3f%16.3f%10.2f"
+              % (n_features, t_col, t_block, t_col / t_block))
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 10000)
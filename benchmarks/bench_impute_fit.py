@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+#
+# Author: Taylor Smith <taylor.smith@alkaline-ml.com>
+#
+# Benchmark SelectiveImputer.fit computing each column's statistic from a
+# Series of its present values vs. computing the mean and median strategies
+# in one vectorized pass over the numeric block. Usage:
+#
+#     $ python benchmarks/bench_impute_fit.py [n_samples] [n_features]
+
+from __future__ import print_function, division, absolute_import
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from skoot.impute import SelectiveImputer, _get_mask
+
+
+def best_time(func, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.time()
+        func()
+        times.append(time.time() - start)
+    return min(times)
+
+
+def per_column(imputer, X):
+    # the column-at-a-time fit the bulk path replaces
+    cols, strategy = imputer._validate_strategy(X.columns.tolist())
+    mask = _get_mask(X, imputer.missing_values)
+    return {c: strat(X[c], mask[c]) for c, strat in strategy.items()}
+
+
+def main(n_samples, n_features):
+    rs = np.random.RandomState(42)
+    X = rs.rand(n_samples, n_features)
+    X[rs.rand(n_samples, n_features) < 0.05] = np.nan
+    X = pd.DataFrame.from_records(
+        X, columns=["x%i" % i for i in range(n_features)])
+
+    print("SelectiveImputer.fit, %i rows x %i columns"
+          % (n_samples, n_features))
+    print("%-10s%16s%12s%10s" % ("strategy", "per-column (s)", "bulk (s)",
+                                 "speedup"))
+
+    for strategy in ("mean", "median"):
+        imputer = SelectiveImputer(strategy=strategy)
+        t_col = best_time(lambda: per_column(imputer, X))
+        t_bulk = best_time(lambda: imputer.fit(X))
+        print("%-10s%16.3f%12.3f%10.2f"
+              % (strategy, t_col, t_bulk, t_col / t_bulk))
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 100000,
+         int(args[1]) if len(args) > 1 else 200)
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+#
+# Author: Taylor Smith <taylor.smith@alkaline-ml.com>
+#
+# Benchmark the per-row latency of a compiled row transformer against
+# calling ``Pipeline.transform`` on a one-row frame. Usage:
+#
+#     $ python benchmarks/bench_row_transformer.py
+
+from __future__ import print_function, division, absolute_import
+
+from collections import OrderedDict
+import timeit
+
+import numpy as np
+
+from sklearn.pipeline import Pipeline
+
+from skoot.datasets import load_iris_df
+from skoot.impute import SelectiveImputer
+from skoot.pipeline import to_row_transformer
+from skoot.preprocessing import (BinningTransformer, DummyEncoder,
+                                 SelectiveStandardScaler,
+                                 YeoJohnsonTransformer)
+
+
+def make_data(random_state=42):
+    rs = np.random.RandomState(random_state)
+    X = load_iris_df(include_tgt=False, names=['a', 'b', 'c', 'd'])
+    X.loc[rs.rand(X.shape[0]) < 0.1, 'a'] = np.nan
+    X['e'] = rs.choice(['x', 'y', 'z'], X.shape[0])
+    return X
+
+
+def main(n_rows=150):
+    X = make_data()
+    pipe = Pipeline([
+        ('impute', SelectiveImputer(cols=['a'])),
+        ('yj', YeoJohnsonTransformer(cols=['b', 'c'])),
+        ('bin', BinningTransformer(cols=['d'], n_bins=3)),
+        ('dummy', DummyEncoder(cols=['e', 'd'])),
+        ('scale', SelectiveStandardScaler(cols=['a', 'b', 'c'],
+                                          as_df=False))
+    ]).fit(X)
+    compiled = to_row_transformer(pipe)
+
+    frames = [X.iloc[[i]] for i in range(n_rows)]
+    records = [OrderedDict(zip(X.columns, X.values[i]))
+               for i in range(n_rows)]
+
+    # sanity check that they match before timing anything
+    for frame, record in zip(frames, records):
+        np.testing.assert_array_almost_equal(
+            pipe.transform(frame)[0].astype(float),
+            compiled(record).astype(float))
+
+    def _transform():
+        for frame in frames:
+            pipe.transform(frame)
+
+    def _compiled():
+        for record in records:
+            compiled(record)
+
+    t_pipe = min(timeit.repeat(_transform, number=1, repeat=3)) / n_rows
+    t_comp = min(timeit.repeat(_compiled, number=1, repeat=3)) / n_rows
+
+    print("Per-row latency over %i rows (5-step pipeline)" % n_rows)
+    print("Pipeline.transform:  %10.1f us" % (t_pipe * 1e6))
+    print("compiled:            %10.1f us" % (t_comp * 1e6))
+    print("speedup:             %10.1fx" % (t_pipe / t_comp))
+
+
+if __name__ == "__main__":
+    main()
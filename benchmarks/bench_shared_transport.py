@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+#
+# Author: Taylor Smith <taylor.smith@alkaline-ml.com>
+#
+# Benchmark how columns are sent to a process pool by the column-parallel
+# executor: pickled to every worker, or written once to a shared
+# memory-mapped file of which the workers receive only descriptors. This
+# times the per-column work of the Box-Cox lambda estimation
+# and the DummyEncoder fit/transform. Usage:
+#
+#     $ python benchmarks/bench_shared_transport.py [n_samples] [n_features]
+
+from __future__ import print_function, division, absolute_import
+
+import multiprocessing
+import sys
+import time
+
+import numpy as np
+
+from skoot.base import _column_parallel
+from skoot.preprocessing.encode import (_fit_transform_one_encoder,
+                                        _le_transform)
+from skoot.preprocessing.skewness import _BCEstimator
+
+
+def best_time(func, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.time()
+        func()
+        times.append(time.time() - start)
+    return min(times)
+
+
+def main(n_samples, n_features):
+    rs = np.random.RandomState(42)
+    continuous = [rs.lognormal(size=n_samples) for _ in range(n_features)]
+    levels = [rs.randint(0, 20, n_samples) for _ in range(n_features)]
+    n_jobs = max(2, multiprocessing.cpu_count())
+
+    # the per-column work each transformer hands to the executor
+    encoders = [le for _, le, _ in _column_parallel(
+        _fit_transform_one_encoder, list(enumerate(levels)))]
+    tasks = [
+        ("Box-Cox lambda estimation", _BCEstimator(1e-12),
+         [(x, np.float32) for x in continuous],
+         {"suppress_warnings": True}),
+        ("DummyEncoder fit", _fit_transform_one_encoder,
+         list(enumerate(levels)), {}),
+        ("DummyEncoder transform", _le_transform,
+         [(i, x, le) for i, (x, le) in enumerate(zip(levels, encoders))],
+         {"handle": "ignore", "sep": "_"})
+    ]
+
+    print("Process-parallel column transport, %i columns of %i rows, "
+          "n_jobs=%i (loky)" % (n_features, n_samples, n_jobs))
+    print("%-26s%12s%12s%10s" % ("task", "pickle (s)", "shared (s)",
+                                 "speedup"))
+
+    for name, func, args, kwargs in tasks:
+        times = [
+            best_time(lambda: _column_parallel(
+                func, args, n_jobs=n_jobs, backend="loky",
+                transport=transport, **kwargs))
+            for transport in ("pickle", "shared")]
+
+        print("%-26s%12.3f%12.3f%10.2f"
+              % (name, times[0], times[1], times[0] / times[1]))
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 1000000,
+         int(args[1]) if len(args) > 1 else 20)
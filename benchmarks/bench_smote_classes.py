@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+#
+# Author: Taylor Smith <taylor.smith@alkaline-ml.com>
+#
+# Benchmark smote_balance with many minority classes, synthesizing the
+# classes serially vs. concurrently (n_jobs_classes) in threads or
+# processes. Usage:
+#
+#     $ python benchmarks/bench_smote_classes.py [n_classes] [n_per_class]
+
+from __future__ import print_function, division, absolute_import
+
+import sys
+import time
+
+import numpy as np
+
+from skoot.balance import smote_balance
+
+
+def best_time(func, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.time()
+        func()
+        times.append(time.time() - start)
+    return min(times)
+
+
+def main(n_classes, n_per_class):
+    rs = np.random.RandomState(42)
+    n_features = 20
+
+    # one big majority class, and minority classes of varying sizes
+    sizes = [n_per_class * 20] + list(
+        rs.randint(n_per_class // 4, n_per_class, n_classes - 1))
+    y = np.repeat(np.arange(n_classes), sizes)
+    X = rs.rand(y.shape[0], n_features) + y[:, np.newaxis]
+
+    print("smote_balance, %i classes, %i rows x %i features"
+          % (n_classes, X.shape[0], n_features))
+    print("%-12s%10s%10s%10s" % ("backend", "n_jobs", "time (s)",
+                                 "speedup"))
+
+    serial = best_time(lambda: smote_balance(X, y, balance_ratio=0.5,
+                                             random_state=42))
+    print("%-12s%10i%10.3f%10.2f" % ("serial", 1, serial, 1.))
+
+    for backend in ("threading", "loky"):
+        for n_jobs in (2, 4, -1):
+            t = best_time(lambda: smote_balance(
+                X, y, balance_ratio=0.5, random_state=42,
+                n_jobs_classes=n_jobs, backend=backend))
+            print("%-12s%10i%10.3f%10.2f" % (backend, n_jobs, t, serial / t))
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 100,
+         int(args[1]) if len(args) > 1 else 5000)
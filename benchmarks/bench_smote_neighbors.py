@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+#
+# Author: Taylor Smith <taylor.smith@alkaline-ml.com>
+#
+# Benchmark the nearest neighbor searches smote_balance can use on
+# high-dimensional (embedding-like) data: the time to fit and query each
+# minority observation's neighbors, and the recall of the approximate
+# search relative to the exact ones. Usage:
+#
+#     $ python benchmarks/bench_smote_neighbors.py [n_samples] [n_features]
+
+from __future__ import print_function, division, absolute_import
+
+import sys
+import time
+
+import numpy as np
+
+from skoot.balance.smote import _neighbors_model
+
+
+def timed_search(algorithm, X, k, **kwargs):
+    start = time.time()
+    model = _neighbors_model(algorithm=algorithm, n_neighbors=k,
+                             leaf_size=kwargs.pop('leaf_size', 30), p=2,
+                             metric='minkowski', metric_params=None,
+                             n_jobs=1, random_state=np.random.RandomState(0))
+    model.set_params(**kwargs)
+    ind = model.fit(X).kneighbors(X, n_neighbors=k, return_distance=False)
+    return ind, time.time() - start
+
+
+def recall(ind, exact):
+    return np.mean([np.intersect1d(a, b).shape[0] / a.shape[0]
+                    for a, b in zip(ind, exact)])
+
+
+def main(n_samples, n_features):
+    rs = np.random.RandomState(42)
+
+    # clustered points, like embeddings
+    centers = rs.randn(50, n_features)
+    X = centers[rs.randint(0, 50, n_samples)] + \
+        rs.randn(n_samples, n_features) * 0.5
+    k = 6  # n_neighbors=5, plus the observation itself
+
+    print("%i-nearest neighbors of %i points x %i features"
+          % (k, n_samples, n_features))
+    print("%-26s%12s%10s" % ("algorithm", "time (s)", "recall"))
+
+    exact, t_exact = timed_search('brute', X, k)
+    print("%-26s%12.3f%10.3f" % ("brute", t_exact, 1.))
+
+    for algorithm in ('kd_tree', 'blocked'):
+        ind, t = timed_search(algorithm, X, k)
+        print("%-26s%12.3f%10.3f" % (algorithm, t, recall(ind, exact)))
+
+    for n_trees, leaf_size in ((5, 30), (10, 30), (10, 60), (20, 60)):
+        ind, t = timed_search('rp_forest', X, k, n_trees=n_trees,
+                              leaf_size=leaf_size)
+        print("%-26s%12.3f%10.3f"
+              % ("rp_forest (%i trees, %i)" % (n_trees, leaf_size), t,
+                 recall(ind, exact)))
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 20000,
+         int(args[1]) if len(args) > 1 else 300)
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+#
+# Author: Taylor Smith <taylor.smith@alkaline-ml.com>
+#
+# Benchmark smote_balance as the majority class grows (with a 1% minority
+# class). The "vstack" column times only the copying the balancer used to
+# do, growing X by stacking each batch of synthetic samples onto it, which
+# the preallocated output replaces. Usage:
+#
+#     $ python benchmarks/bench_smote_scaling.py [max_majority]
+
+from __future__ import print_function, division, absolute_import
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from skoot.balance import smote_balance
+from skoot.utils import safe_vstack
+
+
+def best_time(func, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.time()
+        func()
+        times.append(time.time() - start)
+    return min(times)
+
+
+def vstack_growth(X, n_minority, n_synthetic, n_neighbors=5):
+    # stack batches the size the old loop drew (at most n_neighbors samples
+    # per minority observation) onto X, as pd.DataFrames
+    columns = X.columns
+    while n_synthetic > 0:
+        batch = min(n_synthetic,
+                    n_neighbors * min(n_minority,
+                                      max(1, int(round(n_synthetic /
+                                                       n_neighbors)))))
+        X = safe_vstack(X, pd.DataFrame.from_records(
+            np.zeros((batch, X.shape[1])), columns=columns))
+        n_synthetic -= batch
+    return X
+
+
+def main(max_majority):
+    rs = np.random.RandomState(42)
+    n_features = 10
+
+    print("smote_balance, %i features, 1%% minority, balance_ratio=0.2"
+          % n_features)
+    print("%-12s%12s%12s%12s" % ("n_majority", "vstack (s)", "smote (s)",
+                                 "rows/s"))
+
+    n_majority = 10000
+    while n_majority <= max_majority:
+        n_minority = n_majority // 100
+        X = pd.DataFrame.from_records(
+            rs.rand(n_majority + n_minority, n_features),
+            columns=["x%i" % i for i in range(n_features)])
+        y = np.concatenate([np.zeros(n_majority, dtype=int),
+                            np.ones(n_minority, dtype=int)])
+        n_synthetic = int(0.2 * n_majority) - n_minority
+
+        t_stack = best_time(lambda: vstack_growth(X, n_minority,
+                                                  n_synthetic), repeat=1)
+        t_smote = best_time(lambda: smote_balance(
+            X, y, balance_ratio=0.2, random_state=42), repeat=1)
+        print("%-12i%12.3f%12.3f%12.0f"
+              % (n_majority, t_stack, t_smote, n_synthetic / t_smote))
+        n_majority *= 10
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(int(float(args[0])) if args else 10000000)
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+#
+# Author: Taylor Smith <taylor.smith@alkaline-ml.com>
+#
+# Benchmark SMOTE's synthesis step (given the nearest neighbors) on large
+# minority classes: the per-observation list comprehension it used to run
+# vs. drawing all of the (observation, neighbor) pairs as index arrays and
+# synthesizing them in batches. Usage:
+#
+#     $ python benchmarks/bench_smote_synthesis.py [n_minority] [n_features]
+
+from __future__ import print_function, division, absolute_import
+
+import sys
+import time
+
+import numpy as np
+
+from skoot.balance.smote import STRATEGIES, _synthesize
+
+
+def best_time(func, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.time()
+        func()
+        times.append(time.time() - start)
+    return min(times)
+
+
+def per_observation(X_sub, neighbors, out, func, random_state):
+    # the loop _synthesize replaces
+    n_neighbors = neighbors.shape[1]
+    amt_required = out.shape[0]
+    indices = np.arange(X_sub.shape[0])
+    n_filled = 0
+    while n_filled < amt_required:
+        remaining = amt_required - n_filled
+        draw_count = max(1, int(round(remaining / n_neighbors)))
+        random_indices = random_state.permutation(indices)[:draw_count]
+        synthetic = random_state.permutation(np.vstack([
+            func(X_sub[c, :], X_sub[neighbors[c], :], random_state)
+            for c in random_indices]))[:remaining]
+        out[n_filled:n_filled + synthetic.shape[0]] = synthetic
+        n_filled += synthetic.shape[0]
+
+
+def main(n_minority, n_features):
+    rs = np.random.RandomState(42)
+    X_sub = rs.rand(n_minority, n_features)
+
+    # random stand-ins for the nearest neighbors; only the gather matters
+    neighbors = rs.randint(0, n_minority, (n_minority, 5))
+
+    print("SMOTE synthesis, %i minority samples x %i features"
+          % (n_minority, n_features))
+    print("%-14s%12s%16s%12s%10s" % ("strategy", "n_synthetic",
+                                     "per-obs (s)", "batched (s)",
+                                     "speedup"))
+
+    for strategy in ("perturb", "interpolate"):
+        func = STRATEGIES[strategy]
+        for multiple in (1, 4):
+            out = np.empty((n_minority * multiple, n_features))
+            t_loop = best_time(lambda: per_observation(
+                X_sub, neighbors, out, func, np.random.RandomState(0)))
+            t_vec = best_time(lambda: _synthesize(
+                X_sub, neighbors, out, func, np.random.RandomState(0)))
+            print("%-14s%12i%16.3f%12.3f%10.2f"
+                  % (strategy, out.shape[0], t_loop, t_vec, t_loop / t_vec))
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 200000,
+         int(args[1]) if len(args) > 1 else 20)
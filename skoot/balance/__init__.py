@@ -3,6 +3,7 @@
 # Author: Taylor Smith <taylor.smith@alkaline-ml.com>
 """Methods for addressing class imbalance."""
 
+from .neighbors import *
 from .over import *
 from .smote import *
 from .under import *
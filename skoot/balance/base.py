@@ -16,12 +16,21 @@ MIN_N_SAMPLES = 2  # min allowed ever.
 NPDTYPE = np.float64
 
 
-def _reorder(X, y, random_state, shuffle):
-    # reorder if needed
-    order = np.arange(X.shape[0])
+def _balanced_indices(indices, n_samples, random_state, shuffle,
+                      as_weights):
+    # Return a balanced sample, given as the rows of the input it's drawn
+    # from, either as the row indices (reordered if needed), or as the
+    # number of times each row appears in it (i.e., sample weights)
+    if as_weights:
+        return np.bincount(indices, minlength=n_samples)
     if shuffle:
-        order = random_state.permutation(order)
-    return safe_indexing(X, order), y[order]
+        indices = indices[random_state.permutation(indices.shape[0])]
+    return indices
+
+
+def _take_samples(X, y, indices):
+    # materialize the balanced (X, y) from the row indices
+    return safe_indexing(X, indices), column_or_1d(y, warn=False)[indices]
 
 
 def validate_float(ratio, name, upper_bound=1., ltet=True):
@@ -37,6 +46,12 @@ def _validate_X_y_ratio_classes(X, y, ratio):
 
     # validate arrays
     X, y = indexable(X, y)  # want to allow pd.DataFrame
+    return (X,) + _validate_y_ratio_classes(y, ratio)
+
+
+def _validate_y_ratio_classes(y, ratio):
+    # validate the labels alone, for the balancers that only need y
+    validate_float(ratio, 'balance_ratio')
     y = column_or_1d(y, warn=False)  # type: np.ndarray
 
     # get n classes in y, ensure they are <= MAX_N_CLASSES, but first
@@ -81,5 +96,5 @@ def _validate_X_y_ratio_classes(X, y, ratio):
     if any(i < MIN_N_SAMPLES for i in counts):
         raise ValueError('All label counts must be >= %i' % MIN_N_SAMPLES)
 
-    return (X, y, n_classes, present_classes, counts,
+    return (y, n_classes, present_classes, counts,
             majority_label, target_count)
@@ -0,0 +1,363 @@
+# -*- coding: utf-8 -*-
+#
+# Author: Taylor Smith <taylor.smith@alkaline-ml.com>
+#
+# Nearest neighbor searches for the SMOTE balancer, which (unlike the trees
+# behind sklearn's NearestNeighbors) hold up in many dimensions
+
+from __future__ import division, absolute_import
+
+import numpy as np
+
+from sklearn.base import BaseEstimator
+from sklearn.metrics import pairwise_distances
+from sklearn.utils.validation import (check_array, check_is_fitted,
+                                      check_random_state)
+
+__all__ = [
+    'BlockedNearestNeighbors',
+    'RandomProjectionForest'
+]
+
+# The most bytes of distances (or differences) computed at once in a query
+_BLOCK_BYTES = 2 ** 27
+
+
+def _k_smallest(dist, k):
+    # The columns of the k smallest distances in each row, in order of
+    # distance, and the distances. Only the k smallest are sorted.
+    rows = np.arange(dist.shape[0])[:, np.newaxis]
+    if k < dist.shape[1]:
+        ind = np.argpartition(dist, k - 1, axis=1)[:, :k]
+    else:
+        ind = np.tile(np.arange(dist.shape[1]), (dist.shape[0], 1))
+
+    dist = dist[rows, ind]
+    order = np.argsort(dist, axis=1, kind='mergesort')
+    return dist[rows, order], ind[rows, order]
+
+
+def _check_n_neighbors(n_neighbors, n_fit):
+    if n_neighbors > n_fit:
+        raise ValueError("Expected n_neighbors <= n_samples, but "
+                         "n_samples = %i, n_neighbors = %i"
+                         % (n_fit, n_neighbors))
+
+
+class BlockedNearestNeighbors(BaseEstimator):
+    """Exact nearest neighbors by brute force, in blocks of queries.
+
+    The distances from a block of query points to every fit point are
+    computed at once (so the search is as fast as a brute-force search in
+    high dimensions, where trees degrade to it anyway), but only for as
+    many queries as fit in a bounded amount of memory. Only the nearest
+    neighbors of each block are kept.
+
+    Parameters
+    ----------
+    n_neighbors : int, optional (default=5)
+        The number of neighbors to use by default for ``kneighbors``.
+
+    metric : string or callable, optional (default='minkowski')
+        The distance metric, any metric accepted by
+        ``sklearn.metrics.pairwise_distances``.
+
+    p : integer, optional (default=2)
+        The power of the Minkowski metric.
+
+    metric_params : dict, optional (default=None)
+        Additional keyword arguments for the metric function.
+
+    block_size : int or None, optional (default=None)
+        The number of query points whose distances are computed at once. If
+        None, as many as fit in 128MB of distances.
+
+    n_jobs : int, optional (default=1)
+        The number of jobs used to compute the distances of each block.
+    """
+    def __init__(self, n_neighbors=5, metric='minkowski', p=2,
+                 metric_params=None, block_size=None, n_jobs=1):
+        self.n_neighbors = n_neighbors
+        self.metric = metric
+        self.p = p
+        self.metric_params = metric_params
+        self.block_size = block_size
+        self.n_jobs = n_jobs
+
+    def fit(self, X, y=None):
+        """Fit the search on the points in X.
+
+        Parameters
+        ----------
+        X : array-like, shape=(n_samples, n_features)
+            The points to search.
+
+        y : array-like or None, optional (default=None)
+            Pass-through for API consistency.
+        """
+        self.fit_X_ = check_array(X, dtype=np.float64)
+        return self
+
+    def kneighbors(self, X, n_neighbors=None, return_distance=True):
+        """Find the nearest fit points of each query point.
+
+        Parameters
+        ----------
+        X : array-like, shape=(n_queries, n_features)
+            The query points. If they are the fit points, each point is
+            its own nearest neighbor.
+
+        n_neighbors : int or None, optional (default=None)
+            The number of neighbors to find. If None, ``n_neighbors``.
+
+        return_distance : bool, optional (default=True)
+            Whether to return the distances along with the indices.
+
+        Returns
+        -------
+        dist : np.ndarray, shape=(n_queries, n_neighbors)
+            The distances to the neighbors, if ``return_distance``.
+
+        ind : np.ndarray, shape=(n_queries, n_neighbors)
+            The indices of the neighbors in the fit points, nearest first.
+        """
+        check_is_fitted(self, 'fit_X_')
+        X = check_array(X, dtype=np.float64)
+        fit_X = self.fit_X_
+        k = self.n_neighbors if n_neighbors is None else n_neighbors
+        _check_n_neighbors(k, fit_X.shape[0])
+
+        metric, kwds = self.metric, dict(self.metric_params or {})
+        if metric == 'minkowski':
+            if self.p == 2:
+                metric = 'euclidean'
+            else:
+                kwds['p'] = self.p
+
+        block = self.block_size or max(1, _BLOCK_BYTES // (8 * fit_X.shape[0]))
+        dist = np.empty((X.shape[0], k), dtype=np.float64)
+        ind = np.empty((X.shape[0], k), dtype=np.intp)
+        for i in range(0, X.shape[0], block):
+            dist[i:i + block], ind[i:i + block] = _k_smallest(
+                pairwise_distances(X[i:i + block], fit_X, metric=metric,
+                                   n_jobs=self.n_jobs, **kwds), k)
+
+        if return_distance:
+            return dist, ind
+        return ind
+
+
+class RandomProjectionForest(BaseEstimator):
+    """Approximate nearest neighbors from a forest of random projection trees.
+
+    Each tree recursively splits the fit points in half by their projection
+    onto the line through two random points of the node, until no leaf has
+    more than ``leaf_size`` points. A query is routed down every tree, and
+    its neighbors are the nearest of the points sharing a leaf with it in
+    any tree. All of the queries descend the trees together (one level per
+    step), and the distances to the candidates are computed in blocks, so
+    the search is vectorized and needs nothing but numpy.
+
+    The neighbors found are exact for points that fall in the same leaf as
+    their true neighbors in some tree, which grows likelier with more trees
+    (``n_trees``) and bigger leaves (``leaf_size``), at the cost of slower
+    queries.
+
+    Parameters
+    ----------
+    n_neighbors : int, optional (default=5)
+        The number of neighbors to use by default for ``kneighbors``. The
+        leaves hold at least this many points, so that many candidates are
+        always found.
+
+    n_trees : int, optional (default=10)
+        The number of trees in the forest.
+
+    leaf_size : int, optional (default=30)
+        The most points in a leaf (raised to ``2 * n_neighbors`` if lower).
+
+    p : integer, optional (default=2)
+        The power of the Minkowski distance.
+
+    random_state : int, RandomState instance or None, optional (default=None)
+        The seed (or random state) used to draw the projections.
+    """
+    def __init__(self, n_neighbors=5, n_trees=10, leaf_size=30, p=2,
+                 random_state=None):
+        self.n_neighbors = n_neighbors
+        self.n_trees = n_trees
+        self.leaf_size = leaf_size
+        self.p = p
+        self.random_state = random_state
+
+    def _build_tree(self, X, leaf_size, random_state, tables, leaves):
+        # Split the points into a tree, appending its nodes to the tables
+        # (which are shared across trees) and its leaves' points to leaves
+        left, right, threshold, hyperplane, leaf = tables
+        n_samples, n_features = X.shape
+
+        def _new_node():
+            for table in (left, right, leaf):
+                table.append(-1)
+            threshold.append(0.)
+            hyperplane.append(None)
+            return len(left) - 1
+
+        root = _new_node()
+        stack = [(root, np.arange(n_samples))]
+        while stack:
+            node, idcs = stack.pop()
+            if idcs.shape[0] <= leaf_size:
+                leaf[node] = len(leaves)
+                leaves.append(idcs)
+                continue
+
+            # the line through two random points of the node, or a random
+            # direction if they coincide
+            a, b = random_state.choice(idcs, 2, replace=False)
+            direction = X[a] - X[b]
+            if not direction.any():
+                direction = random_state.randn(n_features)
+
+            # split at the median projection, by rank so ties still split
+            proj = X[idcs].dot(direction)
+            order = np.argsort(proj, kind='mergesort')
+            half = idcs.shape[0] // 2
+            threshold[node] = (proj[order[half - 1]] + proj[order[half]]) / 2.
+            hyperplane[node] = direction
+
+            left[node], right[node] = _new_node(), _new_node()
+            stack.append((left[node], idcs[order[:half]]))
+            stack.append((right[node], idcs[order[half:]]))
+        return root
+
+    def fit(self, X, y=None):
+        """Build the forest on the points in X.
+
+        Parameters
+        ----------
+        X : array-like, shape=(n_samples, n_features)
+            The points to search.
+
+        y : array-like or None, optional (default=None)
+            Pass-through for API consistency.
+        """
+        X = check_array(X, dtype=np.float64)
+        random_state = check_random_state(self.random_state)
+        if self.n_trees < 1:
+            raise ValueError("n_trees must be at least 1")
+        leaf_size = max(self.leaf_size, 2 * self.n_neighbors, 1)
+
+        tables = ([], [], [], [], [])
+        leaves = []
+        roots = [self._build_tree(X, leaf_size, random_state, tables, leaves)
+                 for _ in range(self.n_trees)]
+        left, right, threshold, hyperplane, leaf = tables
+
+        # the leaves' points, padded with -1 to the size of the largest
+        max_leaf = max(idcs.shape[0] for idcs in leaves)
+        members = np.full((len(leaves), max_leaf), -1, dtype=np.intp)
+        for i, idcs in enumerate(leaves):
+            members[i, :idcs.shape[0]] = idcs
+
+        zeros = np.zeros(X.shape[1])
+        self.fit_X_ = X
+        self.roots_ = np.asarray(roots, dtype=np.intp)
+        self.left_ = np.asarray(left, dtype=np.intp)
+        self.right_ = np.asarray(right, dtype=np.intp)
+        self.threshold_ = np.asarray(threshold, dtype=np.float64)
+        self.hyperplanes_ = np.vstack([zeros if h is None else h
+                                       for h in hyperplane])
+        self.leaf_ = np.asarray(leaf, dtype=np.intp)
+        self.leaf_members_ = members
+        self.min_leaf_size_ = min(idcs.shape[0] for idcs in leaves)
+        return self
+
+    def _leaves(self, X):
+        # The leaf (row of leaf_members_) of each query in each tree, shape
+        # (n_queries, n_trees)
+        n_queries, n_trees = X.shape[0], self.roots_.shape[0]
+        left, right = self.left_, self.right_
+        nodes = np.tile(self.roots_, n_queries)
+        rows = np.repeat(np.arange(n_queries), n_trees)
+
+        active = np.flatnonzero(left[nodes] != -1)
+        while active.shape[0]:
+            node = nodes[active]
+            proj = np.einsum('ij,ij->i', X[rows[active]],
+                             self.hyperplanes_[node])
+            node = np.where(proj <= self.threshold_[node], left[node],
+                            right[node])
+            nodes[active] = node
+            active = active[left[node] != -1]
+
+        return self.leaf_[nodes].reshape(n_queries, n_trees)
+
+    def _candidates(self, X):
+        # The distinct fit points sharing a leaf with each query in any
+        # tree, padded with -1, shape (n_queries, n_candidates)
+        cand = self.leaf_members_[self._leaves(X)].reshape(X.shape[0], -1)
+        cand.sort(axis=1)
+        cand[:, 1:][cand[:, 1:] == cand[:, :-1]] = -1
+        return cand
+
+    def kneighbors(self, X, n_neighbors=None, return_distance=True):
+        """Find the (approximate) nearest fit points of each query point.
+
+        Parameters
+        ----------
+        X : array-like, shape=(n_queries, n_features)
+            The query points. If they are the fit points, each point is
+            its own nearest neighbor.
+
+        n_neighbors : int or None, optional (default=None)
+            The number of neighbors to find. If None, ``n_neighbors``. It
+            may not be more than the size of the smallest leaf.
+
+        return_distance : bool, optional (default=True)
+            Whether to return the distances along with the indices.
+
+        Returns
+        -------
+        dist : np.ndarray, shape=(n_queries, n_neighbors)
+            The distances to the neighbors, if ``return_distance``.
+
+        ind : np.ndarray, shape=(n_queries, n_neighbors)
+            The indices of the neighbors in the fit points, nearest first.
+        """
+        check_is_fitted(self, 'leaf_members_')
+        X = check_array(X, dtype=np.float64)
+        fit_X = self.fit_X_
+        k = self.n_neighbors if n_neighbors is None else n_neighbors
+        _check_n_neighbors(k, fit_X.shape[0])
+        if k > self.min_leaf_size_:
+            raise ValueError("n_neighbors=%i is more than the smallest leaf "
+                             "(%i points). Fit with a larger n_neighbors or "
+                             "leaf_size." % (k, self.min_leaf_size_))
+
+        n_candidates = self.roots_.shape[0] * self.leaf_members_.shape[1]
+        block = max(1, _BLOCK_BYTES // (8 * n_candidates * fit_X.shape[1]))
+        p = self.p
+
+        dist = np.empty((X.shape[0], k), dtype=np.float64)
+        ind = np.empty((X.shape[0], k), dtype=np.intp)
+        for i in range(0, X.shape[0], block):
+            query = X[i:i + block]
+            cand = self._candidates(query)
+            valid = cand != -1
+
+            diff = np.abs(fit_X[np.where(valid, cand, 0)] -
+                          query[:, np.newaxis, :])
+            if p == 2:
+                d = np.sqrt((diff ** 2).sum(axis=2))
+            else:
+                d = (diff ** p).sum(axis=2) ** (1. / p)
+            d[~valid] = np.inf
+
+            d, cols = _k_smallest(d, k)
+            rows = np.arange(cand.shape[0])[:, np.newaxis]
+            dist[i:i + block], ind[i:i + block] = d, cand[rows, cols]
+
+        if return_distance:
+            return dist, ind
+        return ind
@@ -6,19 +6,97 @@
 
 from __future__ import division, absolute_import, division
 
-from sklearn.preprocessing import LabelEncoder
+from sklearn.utils import indexable
 from sklearn.utils.validation import check_random_state
-from sklearn.utils import safe_indexing
 
-from .base import _validate_X_y_ratio_classes, _reorder
-from ..utils import safe_vstack
+from .base import (_validate_y_ratio_classes, _balanced_indices,
+                   _take_samples)
 import numpy as np
 
 __all__ = [
-    'over_sample_balance'
+    'over_sample_balance',
+    'over_sample_indices'
 ]
 
 
+def over_sample_indices(y, balance_ratio=0.2, random_state=None,
+                        shuffle=True, as_weights=False):
+    """Over sample a minority class to a specified ratio, by index.
+
+    The index-only counterpart of :func:`over_sample_balance`, which draws
+    the same balanced sample, but returns the rows of ``X`` it is made of
+    (with the minority rows repeated) rather than a copy of them, so no
+    rows are ever duplicated in memory.
+
+    Parameters
+    ----------
+    y : array-like, shape (n_samples,)
+        Training labels corresponding to the samples in ``X``.
+
+    balance_ratio : float, optional (default=0.2)
+        The minimum acceptable ratio of ``$MINORITY_CLASS : $MAJORITY_CLASS``
+        representation, where 0 < ``ratio`` <= 1
+
+    random_state : int, None or numpy RandomState, optional (default=None)
+        The seed to construct the random state to generate random selections.
+
+    shuffle : bool, optional (default=True)
+        Whether to shuffle the indices. Ignored if ``as_weights`` is True.
+
+    as_weights : bool, optional (default=False)
+        Whether to return the balanced sample as weights rather than
+        indices: the number of times each row appears in it, which can be
+        passed as a model's ``sample_weight``.
+
+    Returns
+    -------
+    indices : np.ndarray, shape (n_balanced,) or (n_samples,)
+        The rows of ``X`` (and ``y``) in the balanced sample, or their
+        weights if ``as_weights`` is True.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> y = np.array([0] * 10 + [1] * 2)
+    >>> indices = over_sample_indices(y, balance_ratio=0.5, random_state=42)
+    >>> np.bincount(y[indices]).tolist()
+    [10, 5]
+    """
+    random_state = check_random_state(random_state)
+
+    # validate before drawing anything...
+    y, n_classes, present_classes, \
+        counts, majority_label, target_count = \
+        _validate_y_ratio_classes(y, balance_ratio)
+    n_samples = y.shape[0]
+
+    # the sample is all of the rows, and the minority rows drawn again
+    indices = [np.arange(n_samples)]
+
+    # iterate the present classes
+    for label in present_classes:
+        if label == majority_label:
+            continue
+
+        # the class' rows, including the ones drawn so far. Since we're
+        # oversampling, it doesn't matter if we redraw a drawn row
+        label_rows = np.flatnonzero(y == label)
+        n_req = target_count - label_rows.shape[0]
+
+        while n_req > 0:
+            # draw a sample, take first n_req:
+            drawn = label_rows[
+                random_state.permutation(label_rows.shape[0])[:n_req]]
+            label_rows = np.concatenate([label_rows, drawn])
+            indices.append(drawn)
+
+            # use the drawn length, since it might be < n_req
+            n_req -= drawn.shape[0]
+
+    return _balanced_indices(np.concatenate(indices), n_samples,
+                             random_state, shuffle, as_weights)
+
+
 def over_sample_balance(X, y, balance_ratio=0.2, random_state=None,
                         shuffle=True):
     """Over sample a minority class to a specified ratio.
@@ -48,6 +126,10 @@ def over_sample_balance(X, y, balance_ratio=0.2, random_state=None,
     shuffle : bool, optional (default=True)
         Whether to shuffle the output.
 
+    See Also
+    --------
+    over_sample_indices : The rows of the balanced sample, without copying
+
     Examples
     --------
     >>> from sklearn.datasets import make_classification
@@ -62,51 +144,8 @@ def over_sample_balance(X, y, balance_ratio=0.2, random_state=None,
 
     >>> assert X_bal.shape[0] > 1000
     """
-    random_state = check_random_state(random_state)
-
-    # validate before copying arrays around...
-    X, y, n_classes, present_classes, \
-        counts, majority_label, target_count = \
-        _validate_X_y_ratio_classes(X, y, balance_ratio)
-
-    # encode y, in case they are not numeric (we need them to be for np.ones)
-    le = LabelEncoder()
-    le.fit(present_classes)
-    y_transform = le.transform(y)  # make numeric
-
-    # we'll vstack/concatenate to these
-    out_X, out_y = X.copy(), y_transform.copy()
-
-    # iterate the present classes
-    for label in present_classes:
-        if label == majority_label:
-            continue
-
-        # get the transformed label
-        label_transform = le.transform([label])[0]
-
-        while True:
-            # use the out_X, out_y copies. Since we're oversamping,
-            # it doesn't matter if we're drawing from the out_X matrix.
-            # also, this way we can better keep track of how many we've drawn.
-            mask = out_y == label_transform
-            n_req = target_count - mask.sum()
-
-            # terminal case
-            if n_req == 0:
-                break
-
-            # draw a sample, take first n_req:
-            idcs = np.arange(out_X.shape[0])[mask]  # get the idcs, mask them
-            sample = safe_indexing(out_X,
-                                   random_state.permutation(idcs)[:n_req])
-
-            # vstack
-            out_X = safe_vstack(out_X, sample)
-
-            # concatenate. Use sample length, since it might be < n_req
-            out_y = np.concatenate([
-                out_y, np.ones(sample.shape[0],
-                               dtype=np.int16) * label_transform])
-
-    return _reorder(out_X, le.inverse_transform(out_y), random_state, shuffle)
+    X, y = indexable(X, y)  # want to allow pd.DataFrame
+    indices = over_sample_indices(y, balance_ratio=balance_ratio,
+                                  random_state=random_state,
+                                  shuffle=shuffle)
+    return _take_samples(X, y, indices)
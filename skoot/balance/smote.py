@@ -6,22 +6,37 @@
 
 from __future__ import division, absolute_import, division
 
+import numbers
+
 import numpy as np
 import pandas as pd
 
+from collections import OrderedDict
+
+from sklearn.base import clone
 from sklearn.neighbors import NearestNeighbors
+from sklearn.externals import six
 from sklearn.preprocessing import LabelEncoder
 from sklearn.utils.validation import check_random_state
 from sklearn.utils import safe_indexing
 
 from .base import _validate_X_y_ratio_classes
-from ..utils import safe_vstack, safe_mask_samples
+from ..base import _column_parallel, _nested_n_jobs
+from .neighbors import BlockedNearestNeighbors, RandomProjectionForest
 
 __all__ = [
-    'smote_balance'
+    'smote_balance',
+    'smote_samples'
 ]
 
 
+# The number of synthetic samples gathered and computed at once, which
+# bounds the temporary arrays of the synthesis
+SYNTHESIS_BATCH_SIZE = 65536
+
+
+# Each strategy computes a batch of synthetic samples from the paired rows
+# of the vectors under consideration and their nearest neighbors
 def _perturb(consider_vector, nearest, random_state):
     return (consider_vector - nearest) * \
            random_state.rand(nearest.shape[0], 1) + consider_vector
@@ -39,97 +54,283 @@ STRATEGIES = {
     'interpolate': _interpolate
 }
 
-
-def _nearest_neighbors_for_class(X, label, label_encoder, y_transform,
-                                 target_count, random_state, strategy,
+# The neighbor searches of sklearn's NearestNeighbors, and our own
+SKLEARN_ALGORITHMS = ('auto', 'ball_tree', 'kd_tree', 'brute')
+ALGORITHMS = SKLEARN_ALGORITHMS + ('blocked', 'rp_forest')
+
+
+def _validate_algorithm(algorithm, metric):
+    if isinstance(algorithm, six.string_types):
+        if algorithm not in ALGORITHMS:
+            raise ValueError('algorithm must be one of %r, or an estimator, '
+                             'but got %r' % (ALGORITHMS, algorithm))
+        if algorithm == 'rp_forest' and \
+                metric not in ('minkowski', 'euclidean'):
+            raise ValueError("algorithm='rp_forest' only supports the "
+                             "'minkowski' and 'euclidean' metrics, but got "
+                             "%r" % metric)
+    elif not all(hasattr(algorithm, a) for a in ('fit', 'kneighbors')):
+        raise TypeError('algorithm must be a string, or an estimator with '
+                        'fit and kneighbors methods, but got %s'
+                        % type(algorithm).__name__)
+
+
+def _neighbors_model(algorithm, n_neighbors, leaf_size, p, metric,
+                     metric_params, n_jobs, random_state):
+    # Create the (unfit) neighbor search for a class. n_neighbors includes
+    # the observation itself
+    if algorithm == 'blocked':
+        return BlockedNearestNeighbors(
+            n_neighbors=n_neighbors, metric=metric, p=p,
+            metric_params=metric_params, n_jobs=n_jobs)
+
+    if algorithm == 'rp_forest':
+        return RandomProjectionForest(
+            n_neighbors=n_neighbors, leaf_size=leaf_size,
+            p=2 if metric == 'euclidean' else p,
+            random_state=random_state.randint(np.iinfo(np.int32).max))
+
+    if algorithm in SKLEARN_ALGORITHMS:
+        return NearestNeighbors(n_neighbors=n_neighbors, algorithm=algorithm,
+                                leaf_size=leaf_size, p=p, metric=metric,
+                                metric_params=metric_params, n_jobs=n_jobs)
+
+    # otherwise it's an estimator of the user's own
+    return clone(algorithm)
+
+
+def _nearest_neighbors_for_class(X_sub, out, random_state, strategy,
                                  n_neighbors, algorithm, leaf_size, p,
                                  metric, metric_params, n_jobs):
+    # Fill ``out`` (a view of the output buffer, with one row for each
+    # synthetic sample the class needs) with samples synthesized from the
+    # class' observations, X_sub, and return the fit neighbors model
     func = STRATEGIES[strategy]
 
-    # transform the label, get the subset
-    transformed_label = label_encoder.transform([label])[0]
-    X_sub = safe_mask_samples(X, y_transform == transformed_label)
-
-    # make sure it's a numpy array for all of this...
-    if isinstance(X_sub, pd.DataFrame):
-        X_sub = X_sub.values
-
-    # if the count >= the ratio, skip this label
-    count = X_sub.shape[0]
-    if count >= target_count:
-        return X, y_transform, None
-
-    # define the nearest neighbors model
-    model = NearestNeighbors(n_neighbors=n_neighbors, algorithm=algorithm,
-                             leaf_size=leaf_size, p=p, metric=metric,
-                             metric_params=metric_params, n_jobs=n_jobs)
-
-    # get the observations that map to the transformed label
-    amt_required = target_count - count
-
     # fit the model once, query the tree once. n_neighbors MUST
     # be ONE PLUS n_neighbors, since the zero'th index will always
     # be the index of the observation itself (i.e., obs 0 is its own
     # nearest neighbor).
+    k_neighbors = min(X_sub.shape[0], n_neighbors + 1)
+    model = _neighbors_model(algorithm=algorithm, n_neighbors=k_neighbors,
+                             leaf_size=leaf_size, p=p, metric=metric,
+                             metric_params=metric_params, n_jobs=n_jobs,
+                             random_state=random_state)
     model.fit(X_sub)
 
     # draw the nearest neighbors ONCE. There is an interesting corner
-    # case here... sklearn's nearest neighbors will draw the actual
-    # observation as its own nearest neighbor so we need to query for k + 1,
-    # and remove the first index (handled in the while loop)
-    k_neighbors = min(X_sub.shape[0], n_neighbors + 1)
+    # case here... the search will draw the actual observation as its own
+    # nearest neighbor so we need to query for k + 1, and remove the first
+    # index (the 0th column)
     nearest = model.kneighbors(X_sub, n_neighbors=k_neighbors,
                                return_distance=False)  # type: np.ndarray
-    indices = np.arange(count)
-
-    # append the labels to y_transform - do this once to avoid the
-    # overhead of repeated concatenations
-    y_transform = np.concatenate([
-        y_transform,
-        np.ones(amt_required, dtype=np.int16) * transformed_label])
-
-    # sample while under the requisite ratio
-    while amt_required > 0:
-        # randomly select some observations. since each selection will produce
-        # n_neighbors synthetic points, take the first
-        # amt_required // n_neighbors
-        draw_count = max(1, int(round(amt_required / n_neighbors)))
-        random_indices = random_state.permutation(indices)[:draw_count]
-
-        # select the random sample, get nearest neighbors for the
-        # sample indices. SHUFFLE, because of the next draw step.
-        synthetic = random_state.permutation(np.vstack([
-            func(X_sub[consideration, :],
-
-                 # take 0th out (the observation vector under consideration):
-                 X_sub[nearest[consideration][1:], :],
-                 random_state)
-
-            # using the language of smote... ("vector under consideration")
-            for consideration in random_indices
-        ]))
-
-        # append to X. Since the round up earlier might cause a slight
-        # error in count, make sure to truncate the synthetically-drawn
-        # examples to amt_required
-        if isinstance(X, pd.DataFrame):
-            synthetic = pd.DataFrame.from_records(
-                synthetic, columns=X.columns).iloc[:amt_required]
-        else:
-            synthetic = synthetic[:amt_required]
-        X = safe_vstack(X, synthetic)
-
-        # determine whether we need to recurse for this class (if
-        # there were too few samples)
-        amt_required -= synthetic.shape[0]
-
-    return X, y_transform, model
+    _synthesize(X_sub, nearest[:, 1:], out, func, random_state)
+    return model
+
+
+def _synthesize(X_sub, neighbors, out, func, random_state):
+    # Fill ``out`` with synthetic samples, each made from an observation
+    # (the "vector under consideration") and one of its nearest neighbors.
+    # The observations are drawn in random order without replacement (in
+    # as many rounds as needed), each producing one sample per neighbor,
+    # and the (observation, neighbor) pairs are shuffled and truncated to
+    # the rows of ``out``. All of the pairs are drawn as index arrays up
+    # front, then gathered and synthesized in batches of rows.
+    count, n_per_seed = neighbors.shape
+    amt_required = out.shape[0]
+
+    n_seeds = -(-amt_required // n_per_seed)  # ceil
+    n_rounds = -(-n_seeds // count)
+    seeds = np.concatenate([random_state.permutation(count)
+                            for _ in range(n_rounds)])[:n_seeds]
+
+    # pair each seed with each of its neighbors, then shuffle the pairs
+    order = random_state.permutation(n_seeds * n_per_seed)[:amt_required]
+    seed_idcs = np.repeat(seeds, n_per_seed)[order]
+    neighbor_idcs = neighbors[seeds].ravel()[order]
+
+    for i in range(0, amt_required, SYNTHESIS_BATCH_SIZE):
+        batch = slice(i, i + SYNTHESIS_BATCH_SIZE)
+        out[batch] = func(X_sub[seed_idcs[batch]],
+                          X_sub[neighbor_idcs[batch]], random_state)
+
+
+def _smote_class(X_sub, out, seed, n_jobs_search, **kwargs):
+    # Synthesize one class' samples from its own random stream. ``out`` is
+    # either the class' rows of the output, filled in place, or the number
+    # of rows, which are returned (from a process)
+    rows = None
+    if isinstance(out, numbers.Integral):
+        out = rows = np.empty((out, X_sub.shape[1]), dtype=np.float64)
+
+    model = _nearest_neighbors_for_class(
+        X_sub=X_sub, out=out, random_state=np.random.RandomState(seed),
+        n_jobs=n_jobs_search, **kwargs)
+    return rows, model
+
+
+def _smote(X, y, include_original, balance_ratio, strategy, n_neighbors,
+           algorithm, leaf_size, p, metric, metric_params, n_jobs,
+           random_state, n_jobs_classes, backend):
+    # Synthesize the samples the minority classes need, and return them
+    # (after the original samples, if include_original), their labels, and
+    # the nearest neighbor model of each class. Nothing is shuffled
+
+    # validate the cheap stuff before copying arrays around...
+    X, y, n_classes, present_classes, \
+        counts, majority_label, target_count = \
+        _validate_X_y_ratio_classes(X, y, balance_ratio)
+
+    # validate n_neighbors is at least one
+    if n_neighbors < 1:
+        raise ValueError('n_neighbors must be at least 1')
+    if strategy not in STRATEGIES:
+        raise ValueError('strategy must be one of %r' % STRATEGIES)
+    _validate_algorithm(algorithm, metric)
+
+    # encode y, in case they are not numeric
+    le = LabelEncoder()
+    le.fit(present_classes)
+    y_transform = le.transform(y)  # make numeric
+
+    # the number of synthetic samples each minority class needs is known up
+    # front, so the output is allocated once and each class' samples are
+    # written into their own rows of it (after the original rows, if they
+    # are included), rather than growing X by stacking
+    n_samples = X.shape[0]
+    n_original = n_samples if include_original else 0
+    required = OrderedDict(
+        (label, target_count - count)
+        for label, count in zip(present_classes, counts)
+        if label != majority_label and count < target_count)
+    n_synthetic = sum(required.values())
+
+    X_values = X.values if isinstance(X, pd.DataFrame) else np.asarray(X)
+    X_out = np.empty((n_original + n_synthetic, X_values.shape[1]),
+                     dtype=np.result_type(X_values.dtype, np.float64))
+    y_out = np.empty(n_original + n_synthetic, dtype=y_transform.dtype)
+    if include_original:
+        X_out[:n_samples] = X_values
+        y_out[:n_samples] = y_transform
+
+    # each class gets its own random stream, seeded in the order of the
+    # classes, so the samples don't depend on how the classes are split
+    # between the jobs. The cores are split between the classes and the
+    # neighbor searches
+    seeds = random_state.randint(np.iinfo(np.int32).max, size=len(required))
+    n_jobs_classes, n_jobs = _nested_n_jobs(n_jobs, n_jobs_classes,
+                                            len(required))
+
+    # threads write each class' samples into its rows of the output, while
+    # processes return them to be copied in
+    in_place = n_jobs_classes == 1 or backend == "threading"
+    class_args, bounds = [], []
+    start = n_original
+    for (label, amt), seed in zip(six.iteritems(required), seeds):
+        transformed_label = le.transform([label])[0]
+        stop = start + amt
+        y_out[start:stop] = transformed_label
+        class_args.append((X_values[y_transform == transformed_label],
+                           X_out[start:stop] if in_place else amt, seed))
+        bounds.append((start, stop))
+        start = stop
+
+    results = _column_parallel(
+        _smote_class, class_args, n_jobs=n_jobs_classes, backend=backend,
+        strategy=strategy, n_neighbors=n_neighbors, algorithm=algorithm,
+        leaf_size=leaf_size, p=p, metric=metric,
+        metric_params=metric_params, n_jobs_search=n_jobs)
+
+    # the majority class and any class already at the ratio get no
+    # synthetic samples, nor a nearest neighbor model
+    models = dict((label, None) for label in present_classes)
+    for label, (start, stop), (rows, model) in zip(required, bounds,
+                                                   results):
+        if rows is not None:
+            X_out[start:stop] = rows
+        models[label] = model
+
+    # now that X, y_transform have been assembled, inverse_transform
+    # the y_t back to its original state. The synthetic rows of a frame are
+    # indexed after the original ones
+    if isinstance(X, pd.DataFrame):
+        index = pd.RangeIndex(n_synthetic)
+        if include_original:
+            index = X.index.append(index)
+        X_out = pd.DataFrame(X_out, columns=X.columns, index=index)
+    return X_out, le.inverse_transform(y_out), models
+
+
+def smote_samples(X, y, return_estimators=False, balance_ratio=0.2,
+                  strategy='perturb', n_neighbors=5, algorithm='kd_tree',
+                  leaf_size=30, p=2, metric='minkowski', metric_params=None,
+                  n_jobs=1, random_state=None, n_jobs_classes=1,
+                  backend="threading"):
+    """Synthesize the new minority class samples SMOTE would add.
+
+    The counterpart of :func:`smote_balance` that returns only the new,
+    synthetic samples (and their labels) rather than a copy of the input
+    with them appended. Training on ``X`` and the synthetic samples (i.e.,
+    with a lazily-chained iterator) then never copies ``X``.
+
+    Parameters
+    ----------
+    X : array-like, shape (n_samples, n_features)
+        The training array. Samples from the minority class(es) in this array
+        will be interpolated until they are represented at ``balance_ratio``.
+
+    y : array-like, shape (n_samples,)
+        Training labels corresponding to the samples in ``X``.
+
+    return_estimators : bool, optional (default=False)
+        Whether or not to also return the dictionary of fit nearest neighbor
+        searches for each class.
+
+    balance_ratio : float, optional (default=0.2)
+        The minimum acceptable ratio of ``$MINORITY_CLASS : $MAJORITY_CLASS``
+        representation, where 0 < ``ratio`` <= 1
+
+    strategy, n_neighbors, algorithm, leaf_size, p, metric, metric_params,
+    n_jobs, random_state, n_jobs_classes, backend
+        See :func:`smote_balance`.
+
+    Returns
+    -------
+    X_new : array-like, shape (n_synthetic, n_features)
+        The synthetic samples, grouped by class (in the order of the
+        classes). A ``pd.DataFrame`` if ``X`` is one, indexed from 0.
+
+    y_new : np.ndarray, shape (n_synthetic,)
+        The labels of the synthetic samples.
+
+    Examples
+    --------
+    >>> from sklearn.datasets import make_classification
+    >>> X, y = make_classification(n_samples=1000, random_state=42,
+    ...                            n_classes=2, weights=[0.99, 0.01])
+    >>> X_new, y_new = smote_samples(X, y, balance_ratio=0.2,
+    ...                              random_state=42)
+    >>> assert (y_new == 1).all()
+    >>> assert (y == 1).sum() + y_new.shape[0] == int(0.2 * (y == 0).sum())
+    """
+    X_new, y_new, models = _smote(
+        X, y, include_original=False, balance_ratio=balance_ratio,
+        strategy=strategy, n_neighbors=n_neighbors, algorithm=algorithm,
+        leaf_size=leaf_size, p=p, metric=metric,
+        metric_params=metric_params, n_jobs=n_jobs,
+        random_state=check_random_state(random_state),
+        n_jobs_classes=n_jobs_classes, backend=backend)
+
+    if return_estimators:
+        return X_new, y_new, models
+    return X_new, y_new
 
 
 def smote_balance(X, y, return_estimators=False, balance_ratio=0.2,
                   strategy='perturb', n_neighbors=5, algorithm='kd_tree',
                   leaf_size=30, p=2, metric='minkowski', metric_params=None,
-                  n_jobs=1, random_state=None, shuffle=True):
+                  n_jobs=1, random_state=None, shuffle=True,
+                  n_jobs_classes=1, backend="threading"):
     """Balance a dataset using SMOTE to synthetically create new
     minority class samples.
 
@@ -156,8 +357,8 @@ def smote_balance(X, y, return_estimators=False, balance_ratio=0.2,
         Training labels corresponding to the samples in ``X``.
 
     return_estimators : bool, optional (default=False)
-        Whether or not to return the dictionary of fit
-        :class:``sklearn.neighbors.NearestNeighbors`` instances. If True,
+        Whether or not to return the dictionary of fit nearest neighbor
+        searches (see ``algorithm``) for each class. If True,
         the return value will be a tuple, with the first index being the
         balanced ``X`` matrix, the second index being the ``y`` values, and
         the third index being a dictionary of the fit estimators. If False,
@@ -187,22 +388,39 @@ def smote_balance(X, y, return_estimators=False, balance_ratio=0.2,
         Number of neighbors to use by default for ``kneighbors`` queries.
         This parameter is passed to each respective ``NearestNeighbors call.``
 
-    algorithm : str or unicode, optional (default='kd_tree')
+    algorithm : str, unicode or estimator, optional (default='kd_tree')
         Algorithm used to compute the nearest neighbors. One of
-        {'auto', 'ball_tree', 'kd_tree', 'brute'}:
+        {'auto', 'ball_tree', 'kd_tree', 'brute', 'blocked', 'rp_forest'},
+        or an estimator:
 
         - 'ball_tree' will use ``sklearn.neighbors.BallTree``
         - 'kd_tree' will use ``sklearn.neighbors.KDtree``
         - 'brute' will use a brute-force search.
         - 'auto' will attempt to decide the most appropriate algorithm
           based on the values passed to ``fit`` method.
+        - 'blocked' will use an exact brute-force search that computes
+          the distances for blocks of observations at a time, which keeps
+          memory bounded
+          (:class:``skoot.balance.BlockedNearestNeighbors``).
+        - 'rp_forest' will use an approximate search over a forest of
+          random projection trees
+          (:class:``skoot.balance.RandomProjectionForest``), which is much
+          faster in high dimensions, where the trees of 'kd_tree' and
+          'ball_tree' degrade to brute force. Only the 'minkowski' and
+          'euclidean' metrics are supported, and its trees are seeded from
+          ``random_state``.
+        - An estimator with ``fit`` and ``kneighbors`` methods (like
+          ``sklearn.neighbors.NearestNeighbors``) will be cloned and fit
+          for each class. The neighbor parameters below are not passed to
+          it.
 
         Note: fitting on sparse input will override the setting of
-        this parameter, using brute force. This parameter
-        is passed to each respective ``NearestNeighbors`` call.
+        this parameter, using brute force. The first four are passed to
+        each respective ``NearestNeighbors`` call.
 
     leaf_size : int, optional (default=30)
-        Leaf size passed to ``BallTree`` or ``KDTree``.  This can affect the
+        Leaf size passed to ``BallTree``, ``KDTree`` or
+        ``RandomProjectionForest``.  This can affect the
         speed of the construction and query, as well as the memory
         required to store the tree.  The optimal value depends on the
         nature of the problem.
@@ -243,13 +461,35 @@ def smote_balance(X, y, return_estimators=False, balance_ratio=0.2,
     n_jobs : int, optional (default = 1)
         The number of parallel jobs to run for neighbors search.
         If ``-1``, then the number of jobs is set to the number of CPU cores.
-        Affects only ``kneighbors`` and ``kneighbors_graph`` methods.
+        Affects only ``kneighbors`` and ``kneighbors_graph`` methods. When
+        ``n_jobs_classes`` is not 1, the jobs are divided between the
+        classes, so each search uses ``n_jobs // n_jobs_classes`` jobs (at
+        least 1).
 
     shuffle : bool, optional (default=True)
         Whether to shuffle the output.
 
     random_state : int or None, optional (default=None)
         The seed to construct the random state to generate random selections.
+        Each minority class draws its samples from its own random state,
+        seeded from this one, so the output doesn't depend on
+        ``n_jobs_classes``.
+
+    n_jobs_classes : int, optional (default=1)
+        The number of minority classes whose neighbor searches are fit and
+        whose samples are synthesized concurrently. If -1, all CPUs are
+        used.
+
+    backend : str or unicode, optional (default="threading")
+        The joblib backend used when ``n_jobs_classes`` is not 1.
+        "threading" suits the numpy-heavy synthesis and writes the samples
+        straight into the output, while "loky" or "multiprocessing" use a
+        process pool (which must be sent each class' observations, and
+        return its samples).
+
+    See Also
+    --------
+    smote_samples : Only the synthetic samples, without copying ``X``
 
     Examples
     --------
@@ -270,55 +510,21 @@ def smote_balance(X, y, return_estimators=False, balance_ratio=0.2,
            "SMOTE: Synthetic Minority Over-sampling Technique"
            https://www.jair.org/media/953/live-953-2037-jair.pdf
     """
-    # validate the cheap stuff before copying arrays around...
-    X, y, n_classes, present_classes, \
-        counts, majority_label, target_count = \
-        _validate_X_y_ratio_classes(X, y, balance_ratio)
-
-    # validate n_neighbors is at least one
-    if n_neighbors < 1:
-        raise ValueError('n_neighbors must be at least 1')
-    if strategy not in STRATEGIES:
-        raise ValueError('strategy must be one of %r' % STRATEGIES)
-
     # get the random state
     random_state = check_random_state(random_state)
-
-    # encode y, in case they are not numeric (we need them to be for np.ones)
-    le = LabelEncoder()
-    le.fit(present_classes)
-    y_transform = le.transform(y)  # make numeric
-
-    # get the nearest neighbor models
-    models = dict()
-    for label in present_classes:
-
-        # skip the pass to the method and continue if label is majority
-        if label == majority_label:
-            models[label] = None
-            continue
-
-        # X and y_transform will progressively be updated throughout the runs
-        X, y_transform, models[label] = \
-            _nearest_neighbors_for_class(
-                X=X, label=label, label_encoder=le,
-                y_transform=y_transform, target_count=target_count,
-                random_state=random_state, strategy=strategy,
-                n_neighbors=n_neighbors, algorithm=algorithm,
-                leaf_size=leaf_size, p=p, metric=metric,
-                metric_params=metric_params, n_jobs=n_jobs)
-
-    # now that X, y_transform have been assembled, inverse_transform
-    # the y_t back to its original state:
-    y = le.inverse_transform(y_transform)
-
-    # finally, shuffle both and return
-    output_order = np.arange(X.shape[0])
+    X_out, y, models = _smote(
+        X, y, include_original=True, balance_ratio=balance_ratio,
+        strategy=strategy, n_neighbors=n_neighbors, algorithm=algorithm,
+        leaf_size=leaf_size, p=p, metric=metric,
+        metric_params=metric_params, n_jobs=n_jobs,
+        random_state=random_state, n_jobs_classes=n_jobs_classes,
+        backend=backend)
+
+    # finally, shuffle both (if needed) and return
     if shuffle:
-        output_order = random_state.permutation(output_order)
+        output_order = random_state.permutation(X_out.shape[0])
+        X_out, y = safe_indexing(X_out, output_order), y[output_order]
 
-    # select the output order, then return
-    X, y = safe_indexing(X, output_order), y[output_order]
     if return_estimators:
-        return X, y, models
-    return X, y
+        return X_out, y, models
+    return X_out, y
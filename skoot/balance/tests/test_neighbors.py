@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+#
+# Author: Taylor Smith <taylor.smith@alkaline-ml.com>
+#
+# Test the nearest neighbor searches
+
+from __future__ import division, absolute_import
+
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+from sklearn.neighbors import NearestNeighbors
+
+from skoot.balance import BlockedNearestNeighbors, RandomProjectionForest
+from skoot.utils.testing import assert_raises
+
+import numpy as np
+
+rs = np.random.RandomState(42)
+X = rs.rand(300, 20)
+X_query = rs.rand(50, 20)
+
+exact_dist, exact_ind = NearestNeighbors(n_neighbors=6).fit(X).kneighbors(
+    X_query)
+
+
+def test_blocked_nearest_neighbors():
+    # small blocks give the same neighbors as one big block
+    for block_size in (None, 7):
+        nn = BlockedNearestNeighbors(n_neighbors=6, block_size=block_size)
+        dist, ind = nn.fit(X).kneighbors(X_query)
+        assert_array_equal(ind, exact_ind)
+        assert_array_almost_equal(dist, exact_dist)
+
+    # other metrics go through pairwise_distances
+    manhattan = NearestNeighbors(n_neighbors=3, p=1).fit(X)
+    ind = BlockedNearestNeighbors(p=1).fit(X).kneighbors(
+        X_query, n_neighbors=3, return_distance=False)
+    assert_array_equal(ind, manhattan.kneighbors(X_query,
+                                                 return_distance=False))
+
+    assert_raises(ValueError, nn.kneighbors, X_query, 301)
+
+
+def test_random_projection_forest():
+    forest = RandomProjectionForest(n_neighbors=6, n_trees=20,
+                                    random_state=42).fit(X)
+    assert forest.min_leaf_size_ >= 6
+
+    dist, ind = forest.kneighbors(X_query)
+    assert ind.shape == (50, 6)
+
+    # the distances are true, sorted, and the neighbors distinct
+    assert_array_almost_equal(
+        dist, np.sqrt(((X[ind] - X_query[:, np.newaxis]) ** 2).sum(axis=2)))
+    assert (np.diff(dist, axis=1) >= 0).all()
+    assert all(np.unique(row).shape[0] == 6 for row in ind)
+
+    # most of the neighbors are the true ones, and the fit points are their
+    # own nearest neighbors
+    recall = np.mean([np.intersect1d(a, b).shape[0] / 6.
+                      for a, b in zip(ind, exact_ind)])
+    assert recall > 0.7, recall
+    assert_array_equal(forest.kneighbors(X, 1, return_distance=False)[:, 0],
+                       np.arange(300))
+
+    # the same seed builds the same forest
+    same = RandomProjectionForest(n_neighbors=6, n_trees=20,
+                                  random_state=42).fit(X)
+    assert_array_equal(same.kneighbors(X_query, return_distance=False), ind)
+
+    assert_raises(ValueError, forest.kneighbors, X_query,
+                  forest.min_leaf_size_ + 1)
+    assert_raises(ValueError, RandomProjectionForest(n_trees=0).fit, X)
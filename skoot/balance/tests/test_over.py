@@ -7,7 +7,8 @@
 from __future__ import division, absolute_import, division
 
 from sklearn.datasets import load_iris
-from skoot.balance import over_sample_balance
+from skoot.balance import over_sample_balance, over_sample_indices
+from numpy.testing import assert_array_almost_equal
 
 import numpy as np
 import pandas as pd
@@ -49,3 +50,27 @@ def test_over_pandas():
     assert isinstance(X_bal, pd.DataFrame)
     assert X_bal is not X_pd
     assert X_bal.columns.tolist() == X_pd.columns.tolist()
+
+
+def test_over_indices():
+    # the indices are the rows of the balanced sample
+    idcs = over_sample_indices(y, balance_ratio=1.0, random_state=42)
+    X_bal, y_bal = over_sample_balance(X, y, balance_ratio=1.0,
+                                       random_state=42)
+    assert_array_almost_equal(X_bal, X[idcs])
+    assert (y_bal == y[idcs]).all()
+
+    # as weights, each row counts the times it was drawn
+    weights = over_sample_indices(y, balance_ratio=1.0, random_state=42,
+                                  as_weights=True)
+    assert weights.sum() == 150
+    assert (weights[y == 0] == 1).all()
+    assert (weights >= 1).all()
+    assert (np.bincount(idcs, minlength=y.shape[0]) == weights).all()
+
+    # a minority class already past the ratio isn't drawn
+    y_over = np.array([0] * 50 + [1] * 10 + [2] * 40)
+    weights = over_sample_indices(y_over, balance_ratio=0.5, random_state=42,
+                                  as_weights=True)
+    assert (weights[y_over == 2] == 1).all()
+    assert weights[y_over == 1].sum() == 25
@@ -8,7 +8,7 @@ from __future__ import division, absolute_import, division
 
 from numpy.testing import assert_array_almost_equal
 from sklearn.datasets import load_iris
-from skoot.balance import smote_balance
+from skoot.balance import smote_balance, smote_samples
 
 import numpy as np
 import pandas as pd
@@ -54,3 +54,126 @@ def test_smote_pandas():
     # assert 50 of each label
     _, counts = np.unique(y_bal, return_counts=True)
     assert all(c == 50 for c in counts)
+
+
+def test_smote_output_layout():
+    X_pd = pd.DataFrame.from_records(X, columns=['a', 'b', 'c', 'd'])
+    X_bal, y_bal = smote_balance(X, y, balance_ratio=0.5, random_state=42,
+                                 shuffle=False)
+    X_bal_pd, y_bal_pd = smote_balance(X_pd, y, balance_ratio=0.5,
+                                       random_state=42, shuffle=False)
+
+    # class 1 needs 15 synthetic samples, and class 2 (with 20) needs 5,
+    # appended after the original rows in the order of the classes
+    assert X_bal.shape == (100, 4)
+    assert y_bal[80:].tolist() == [1] * 15 + [2] * 5
+
+    # the frame's synthetic rows are the same, indexed after the original
+    assert_array_almost_equal(X_bal_pd.values, X_bal)
+    assert (y_bal_pd == y_bal).all()
+    assert X_bal_pd.index[:80].tolist() == list(range(80))
+    assert X_bal_pd.index[80:].tolist() == list(range(20))
+
+    # a class already at the ratio is left alone
+    X_bal, y_bal, models = smote_balance(X, y, balance_ratio=0.2,
+                                         random_state=42,
+                                         return_estimators=True)
+    assert X_bal.shape[0] == 80
+    assert models == {0: None, 1: None, 2: None}
+
+
+def test_smote_vectorized_synthesis():
+    # the same random_state synthesizes the same samples
+    X_a, y_a = smote_balance(X, y, balance_ratio=1.0, random_state=7)
+    X_b, y_b = smote_balance(X, y, balance_ratio=1.0, random_state=7)
+    assert_array_almost_equal(X_a, X_b)
+    assert (y_a == y_b).all()
+
+    # each interpolated sample is the midpoint of an observation of its
+    # class and another, so it lies within the class' bounding box
+    X_bal, y_bal = smote_balance(X, y, balance_ratio=1.0, random_state=42,
+                                 strategy='interpolate', shuffle=False)
+    for label in (1, 2):
+        orig = X[y == label]
+        synthetic = X_bal[80:][y_bal[80:] == label]
+        assert ((synthetic >= orig.min(axis=0)) &
+                (synthetic <= orig.max(axis=0))).all()
+
+    # more synthetic samples than (observation, neighbor) pairs takes
+    # several rounds of observations
+    X_bal, y_bal = smote_balance(X, y, balance_ratio=1.0, random_state=42,
+                                 n_neighbors=1)
+    _, counts = np.unique(y_bal, return_counts=True)
+    assert all(c == 50 for c in counts)
+
+
+def test_smote_algorithms():
+    from sklearn.neighbors import NearestNeighbors
+    from skoot.balance import BlockedNearestNeighbors, RandomProjectionForest
+    from skoot.utils.testing import assert_raises
+
+    X_tree, y_tree = smote_balance(X, y, balance_ratio=1.0, random_state=42)
+    for algorithm, model_class in (('blocked', BlockedNearestNeighbors),
+                                   ('rp_forest', RandomProjectionForest)):
+        X_bal, y_bal, models = smote_balance(
+            X, y, balance_ratio=1.0, random_state=42, algorithm=algorithm,
+            return_estimators=True)
+        assert X_bal.shape == X_tree.shape
+        assert isinstance(models[1], model_class)
+        assert isinstance(models[2], model_class)
+        _, counts = np.unique(y_bal, return_counts=True)
+        assert all(c == 50 for c in counts)
+
+    # an estimator is cloned for each class, and searches as its string
+    # counterpart does
+    nn = NearestNeighbors(algorithm='kd_tree')
+    X_bal, y_bal, models = smote_balance(
+        X, y, balance_ratio=1.0, random_state=42, algorithm=nn,
+        return_estimators=True)
+    assert_array_almost_equal(X_bal, X_tree)
+    assert models[1] is not nn and models[1] is not models[2]
+
+    assert_raises(ValueError, smote_balance, X, y, algorithm='annoy')
+    assert_raises(ValueError, smote_balance, X, y, algorithm='rp_forest',
+                  metric='cosine')
+    assert_raises(TypeError, smote_balance, X, y, algorithm=object())
+
+
+def test_smote_parallel_classes():
+    X_pd = pd.DataFrame.from_records(X, columns=['a', 'b', 'c', 'd'])
+    X_ser, y_ser, models = smote_balance(X_pd, y, balance_ratio=1.0,
+                                         random_state=42,
+                                         return_estimators=True)
+
+    # the samples don't depend on the number of jobs, nor the backend
+    for backend in ("threading", "loky"):
+        X_par, y_par, par_models = smote_balance(
+            X_pd, y, balance_ratio=1.0, random_state=42, n_jobs_classes=2,
+            backend=backend, return_estimators=True)
+        assert_array_almost_equal(X_par.values, X_ser.values)
+        assert (y_par == y_ser).all()
+        assert par_models[0] is None
+        assert sorted(par_models) == sorted(models)
+
+
+def test_smote_samples():
+    # only the synthetic samples smote_balance would append
+    X_new, y_new = smote_samples(X, y, balance_ratio=1.0, random_state=42)
+    X_bal, y_bal = smote_balance(X, y, balance_ratio=1.0, random_state=42,
+                                 shuffle=False)
+    assert X_new.shape == (70, 4)
+    assert_array_almost_equal(X_new, X_bal[80:])
+    assert (y_new == y_bal[80:]).all()
+
+    X_pd = pd.DataFrame.from_records(X, columns=['a', 'b', 'c', 'd'])
+    X_new_pd, _, models = smote_samples(X_pd, y, balance_ratio=1.0,
+                                        random_state=42,
+                                        return_estimators=True)
+    assert_array_almost_equal(X_new_pd.values, X_new)
+    assert X_new_pd.index.tolist() == list(range(70))
+    assert models[0] is None and models[1] is not None
+
+    # nothing to synthesize
+    X_new, y_new = smote_samples(X, y, balance_ratio=0.2, random_state=42)
+    assert X_new.shape == (0, 4)
+    assert y_new.shape == (0,)
@@ -7,7 +7,7 @@
 from __future__ import division, absolute_import, division
 
 from sklearn.datasets import load_iris
-from skoot.balance import under_sample_balance
+from skoot.balance import under_sample_balance, under_sample_indices
 from numpy.testing import assert_array_almost_equal
 
 import numpy as np
@@ -67,3 +67,20 @@ def test_under_pandas():
     assert isinstance(X_bal, pd.DataFrame)
     assert X_bal is not X_pd
     assert X_bal.columns.tolist() == X_pd.columns.tolist()
+
+
+def test_under_indices():
+    # the indices are the rows of the balanced sample
+    idcs = under_sample_indices(y, balance_ratio=1.0, random_state=42)
+    X_bal, y_bal = under_sample_balance(X, y, balance_ratio=1.0,
+                                        random_state=42)
+    assert_array_almost_equal(X_bal, X[idcs])
+    assert (y_bal == y[idcs]).all()
+
+    # as weights, each row is kept once or dropped
+    weights = under_sample_indices(y, balance_ratio=1.0, random_state=42,
+                                   as_weights=True)
+    assert weights.shape == y.shape
+    assert weights.sum() == 50
+    assert (weights[y != 0] == 1).all()
+    assert sorted(np.flatnonzero(weights)) == sorted(idcs)
@@ -6,17 +6,97 @@
 
 from __future__ import division, absolute_import, division
 
+from sklearn.utils import indexable
 from sklearn.utils.validation import check_random_state
 import numpy as np
 
-from .base import _validate_X_y_ratio_classes, _reorder
-from ..utils.dataframe import safe_drop_samples
+from .base import (_validate_y_ratio_classes, _balanced_indices,
+                   _take_samples)
 
 __all__ = [
-    'under_sample_balance'
+    'under_sample_balance',
+    'under_sample_indices'
 ]
 
 
+def under_sample_indices(y, balance_ratio=0.2, random_state=None,
+                         shuffle=True, as_weights=False):
+    """Under sample the majority class to a specified ratio, by index.
+
+    The index-only counterpart of :func:`under_sample_balance`, which
+    draws the same balanced sample, but returns the rows of ``X`` it is
+    made of rather than a copy of them. Indexing ``X`` lazily (or weighting
+    its rows) avoids copying large frames.
+
+    Parameters
+    ----------
+    y : array-like, shape (n_samples,)
+        Training labels corresponding to the samples in ``X``.
+
+    balance_ratio : float, optional (default=0.2)
+        The minimum acceptable ratio of ``$MINORITY_CLASS : $MAJORITY_CLASS``
+        representation, where 0 < ``ratio`` <= 1
+
+    random_state : int, None or numpy RandomState, optional (default=None)
+        The seed to construct the random state to generate random selections.
+
+    shuffle : bool, optional (default=True)
+        Whether to shuffle the indices. Ignored if ``as_weights`` is True.
+
+    as_weights : bool, optional (default=False)
+        Whether to return the balanced sample as weights rather than
+        indices: the number of times each row appears in it (1 for the rows
+        kept, and 0 for the majority rows dropped), which can be passed as
+        a model's ``sample_weight``.
+
+    Returns
+    -------
+    indices : np.ndarray, shape (n_balanced,) or (n_samples,)
+        The rows of ``X`` (and ``y``) in the balanced sample, or their
+        weights if ``as_weights`` is True.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> y = np.array([0] * 8 + [1] * 2)
+    >>> indices = under_sample_indices(y, balance_ratio=0.5, random_state=42)
+    >>> np.bincount(y[indices]).tolist()
+    [4, 2]
+
+    The same sample, as weights:
+
+    >>> weights = under_sample_indices(y, balance_ratio=0.5, random_state=42,
+    ...                                as_weights=True)
+    >>> int(weights.sum())
+    6
+    """
+    random_state = check_random_state(random_state)
+
+    # validate before drawing anything...
+    y, n_classes, present_classes, \
+        counts, majority_label, _ = \
+        _validate_y_ratio_classes(y, balance_ratio)
+    n_samples = y.shape[0]
+    indices = np.arange(n_samples)
+
+    # get the second-most populous count, compute target
+    sorted_counts = np.sort(counts)
+    if sorted_counts[-1] != sorted_counts[-2]:  # else the corner case
+        target_count = max(int(sorted_counts[-2] / balance_ratio), 1)
+
+        # select which rows gotta go...
+        mask = (y == majority_label)  # type: np.ndarray
+        remove = random_state.permutation(
+            indices[mask])[:mask.sum() - target_count]  # sum > target count
+
+        # remove them
+        indices = np.delete(indices, remove)
+
+    # reorder if needed
+    return _balanced_indices(indices, n_samples, random_state, shuffle,
+                             as_weights)
+
+
 def under_sample_balance(X, y, balance_ratio=0.2, random_state=None,
                          shuffle=True):
     """Under sample the majority class to a specified ratio.
@@ -51,6 +131,10 @@ def under_sample_balance(X, y, balance_ratio=0.2, random_state=None,
     shuffle : bool, optional (default=True)
         Whether to shuffle the output.
 
+    See Also
+    --------
+    under_sample_indices : The rows of the balanced sample, without copying
+
     Notes
     -----
     You should only use the under sampling method when you have lots of data
@@ -73,29 +157,8 @@ def under_sample_balance(X, y, balance_ratio=0.2, random_state=None,
 
     >>> assert X_bal.shape[0] < 1000
     """
-    random_state = check_random_state(random_state)
-
-    # validate before copying arrays around...
-    X, y, n_classes, present_classes, \
-        counts, majority_label, _ = \
-        _validate_X_y_ratio_classes(X, y, balance_ratio)
-
-    # get the second-most populous count, compute target
-    sorted_counts = np.sort(counts)
-    if sorted_counts[-1] == sorted_counts[-2]:  # corner case
-        return _reorder(X, y, random_state, shuffle)
-
-    target_count = max(int(sorted_counts[-2] / balance_ratio), 1)
-
-    # select which rows gotta go...
-    idcs = np.arange(X.shape[0])
-    mask = (y == majority_label)  # type: np.ndarray
-    remove = random_state.permutation(
-        idcs[mask])[:mask.sum() - target_count]  # sum is > target count
-
-    # remove them
-    X = safe_drop_samples(X, remove)
-    y = np.delete(y, remove)
-
-    # reorder if needed
-    return _reorder(X, y, random_state, shuffle)
+    X, y = indexable(X, y)  # want to allow pd.DataFrame
+    indices = under_sample_indices(y, balance_ratio=balance_ratio,
+                                   random_state=random_state,
+                                   shuffle=shuffle)
+    return _take_samples(X, y, indices)
@@ -7,28 +7,217 @@ from __future__ import absolute_import, division, print_function
 from sklearn.utils.validation import check_is_fitted
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.externals import six
+from sklearn.externals.joblib import Parallel, delayed, effective_n_jobs
 
 from abc import ABCMeta
+from collections import OrderedDict, namedtuple
+import numpy as np
 import pandas as pd
 
 from .exceptions import DeveloperError
 from .utils.validation import check_dataframe, validate_test_set_columns
-from .utils.iterables import is_iterable
+from .utils.iterables import is_iterable, chunk
 from .utils.compat import xrange
 from .utils.dataframe import dataframe_or_array
+from .cache import cached_fit
 from .utils.metaestimators import timed_instance_method
 
 # namespace import to avoid explicitly protected imports in global namespace
 from .utils import _docstr as dsutils
 
+import os
+import tempfile
 import warnings
-import copy
+from copy import deepcopy
 
 __all__ = [
     'BasePDTransformer'
 ]
 
 
+def _get_column_positions(cols, n_features):
+    # Map column labels to integer positions in a numpy array. When an array
+    # is passed to ``check_dataframe``, it's cast to a frame whose column
+    # labels are simply the integer positions, so the labels ARE the
+    # positions. If any label is not a valid position, returns None.
+    if not is_iterable(cols):
+        cols = [cols]
+
+    positions = []
+    for c in cols:
+        if isinstance(c, bool) or \
+                not isinstance(c, six.integer_types + (np.integer,)) or \
+                not 0 <= c < n_features:
+            return None
+        positions.append(int(c))
+    return positions
+
+
+# Numeric columns at least this large are written once to a shared memory
+# mapped file for process-based backends, rather than pickled to the workers
+_SHARED_MIN_NBYTES = 2 ** 20
+
+# A descriptor of a column in a shared memory-mapped file. This (rather than
+# the column itself) is what gets pickled to the workers
+_SharedColumn = namedtuple("_SharedColumn",
+                           ("filename", "offset", "dtype", "length"))
+
+
+def _shared_folder():
+    # /dev/shm is a RAM-backed filesystem on Linux, so the file is never
+    # written to disk. Otherwise, fall back to the temp dir
+    shm = "/dev/shm"
+    if os.path.isdir(shm) and os.access(shm, os.W_OK):
+        return shm
+    return tempfile.gettempdir()
+
+
+def _share_columns(column_args, min_nbytes=_SHARED_MIN_NBYTES):
+    """Write the large numeric columns into a single memory-mapped file.
+
+    Every 1d numeric array in ``column_args`` with at least ``min_nbytes``
+    bytes is copied once into a memory-mapped file, and replaced by a
+    ``_SharedColumn`` descriptor of its (filename, offset, dtype, length).
+    The workers map the file rather than unpickling a copy of each column.
+
+    Returns the new column args and the name of the file (or None if no
+    column was shared), which the caller must remove when finished.
+    """
+    shareable = [(i, j, arg)
+                 for i, args in enumerate(column_args)
+                 for j, arg in enumerate(args)
+                 if isinstance(arg, np.ndarray) and arg.ndim == 1 and
+                 arg.dtype.kind in "biufcmM" and arg.nbytes >= min_nbytes]
+    if not shareable:
+        return column_args, None
+
+    # align each column to 64 bytes
+    offsets = []
+    total = 0
+    for _, _, arg in shareable:
+        offsets.append(total)
+        total += -(-arg.nbytes // 64) * 64
+
+    fd, filename = tempfile.mkstemp(prefix="skoot-", suffix=".mmap",
+                                    dir=_shared_folder())
+    os.close(fd)
+
+    column_args = [list(args) for args in column_args]
+    buf = np.memmap(filename, dtype=np.uint8, mode="w+", shape=(total,))
+    for (i, j, arg), offset in zip(shareable, offsets):
+        np.ndarray(arg.shape, dtype=arg.dtype, buffer=buf,
+                   offset=offset)[:] = arg
+        column_args[i][j] = _SharedColumn(filename, offset, arg.dtype.str,
+                                          arg.shape[0])
+    buf.flush()
+    del buf
+
+    return [tuple(args) for args in column_args], filename
+
+
+def _load_column(arg):
+    # map a shared column (read-only) in the worker. Other args pass through
+    if isinstance(arg, _SharedColumn):
+        return np.memmap(arg.filename, dtype=np.dtype(arg.dtype), mode="r",
+                         offset=arg.offset, shape=(arg.length,))
+    return arg
+
+
+def _apply_to_shard(func, shard, kwargs):
+    # apply the function to each column's args in a shard of columns
+    return [func(*[_load_column(arg) for arg in args], **kwargs)
+            for args in shard]
+
+
+def _column_parallel(func, column_args, n_jobs=1, backend="threading",
+                     transport="shared", **kwargs):
+    """Apply a function to each column in parallel.
+
+    The shared column-parallel executor for column-independent transformers.
+    The columns are split into one contiguous shard per job (rather than one
+    task per column), so the scheduling overhead doesn't grow with the
+    number of features, and the results are returned in order so the caller
+    can reassemble the frame once.
+
+    Parameters
+    ----------
+    func : callable
+        The function to apply to each column. It is called as
+        ``func(*args, **kwargs)`` for each ``args`` in ``column_args``.
+
+    column_args : list
+        A list of tuples, each of which holds the arguments for one column
+        (typically the column's values and its fitted parameters).
+
+    n_jobs : int, optional (default=1)
+        The number of jobs to run in parallel. If 1, the columns are
+        processed serially without any parallel machinery. If -1, all CPUs
+        are used.
+
+    backend : str or unicode, optional (default="threading")
+        The joblib backend. "threading" suits numpy-heavy work that releases
+        the GIL, and avoids copying the columns at all. "loky" or
+        "multiprocessing" use a process pool.
+
+    transport : str or unicode, optional (default="shared")
+        How columns are sent to a process pool. If "shared", the large
+        numeric column arrays are written once to a shared memory-mapped
+        file, and the workers receive only a small descriptor of each. If
+        "pickle", every column is pickled to the workers. Ignored for the
+        "threading" backend, whose workers share the parent's memory.
+
+    **kwargs : keyword args
+        Keyword arguments shared by every call to ``func``.
+
+    Returns
+    -------
+    results : list
+        The result of ``func`` for each column, in the order of
+        ``column_args``.
+    """
+    if transport not in ("shared", "pickle"):
+        raise ValueError("transport must be one of ('shared', 'pickle'), "
+                         "but got %r" % transport)
+
+    column_args = list(column_args)
+    n_shards = min(effective_n_jobs(n_jobs), len(column_args))
+    if n_shards <= 1:
+        return _apply_to_shard(func, column_args, kwargs)
+
+    filename = None
+    parallel_kwargs = {}
+    if backend != "threading":
+        if transport == "shared":
+            column_args, filename = _share_columns(column_args)
+        else:
+            parallel_kwargs["max_nbytes"] = None  # no auto-memmapping
+
+    try:
+        shards = Parallel(n_jobs=n_shards, backend=backend,
+                          **parallel_kwargs)(
+            delayed(_apply_to_shard)(func, shard, kwargs)
+            for shard in chunk(column_args, n_shards))
+    finally:
+        if filename is not None:
+            try:
+                os.unlink(filename)
+            except OSError:  # still mapped somewhere (i.e., on Windows)
+                pass
+
+    return [result for shard in shards for result in shard]
+
+
+def _nested_n_jobs(n_jobs, n_jobs_outer, n_tasks):
+    # Split the cores between the outer jobs (e.g., over columns) and the
+    # jobs of each task's model, so the two levels of parallelism don't
+    # oversubscribe the CPUs. Returns the number of outer jobs and of jobs
+    # per model.
+    n_outer = min(effective_n_jobs(n_jobs_outer), max(1, n_tasks))
+    if n_outer <= 1:
+        return 1, n_jobs
+    return n_outer, max(1, effective_n_jobs(n_jobs) // n_outer)
+
+
 class BasePDTransformer(six.with_metaclass(ABCMeta, BaseEstimator,
                                            TransformerMixin)):
     __doc__ = """The base class for all Pandas frame transformers.
@@ -42,6 +231,8 @@ class BasePDTransformer(six.with_metaclass(ABCMeta, BaseEstimator,
     
     {_as_df_doc}
 
+    {_copy_doc}
+
     Examples
     --------
     The following is an example of how to subclass a BasePDTransformer:
@@ -53,11 +244,143 @@ class BasePDTransformer(six.with_metaclass(ABCMeta, BaseEstimator,
         ...
         >>> A()
         A(as_df=None, cols=None)
-    """.format(_cols_doc=dsutils._cols_doc, _as_df_doc=dsutils._as_df_doc)
+    """.format(_cols_doc=dsutils._cols_doc, _as_df_doc=dsutils._as_df_doc,
+               _copy_doc=dsutils._copy_doc)
 
-    def __init__(self, cols=None, as_df=True):
-        self.cols = copy.deepcopy(cols)  # do not let be mutable!
+    def __init__(self, cols=None, as_df=True, copy=True):
+        self.cols = deepcopy(cols)  # do not let be mutable!
         self.as_df = as_df
+        self.copy = copy
+
+    def _array_positions(self, X, cols):
+        """Get column positions for the ndarray-native ``transform`` path.
+
+        Casting a numpy array to a DataFrame and back is often more
+        expensive than the transformation itself for small batches.
+        Transformers that can operate directly on an array call this at the
+        head of ``transform``. If ``as_df`` is False and ``X`` is a 2D
+        ndarray containing ``self.cols`` and ``cols``, the integer positions
+        of ``cols`` are returned. Otherwise, returns None and the caller
+        should fall back to the pandas path (which also raises for any
+        invalid columns).
+
+        Parameters
+        ----------
+        X : object
+            The input passed to ``transform``.
+
+        cols : list
+            The column labels (usually ``fit_cols_``) to locate in ``X``.
+        """
+        if self.as_df or not isinstance(X, np.ndarray) or X.ndim != 2:
+            return None
+
+        n_features = X.shape[1]
+        if self.cols is not None and \
+                _get_column_positions(self.cols, n_features) is None:
+            return None
+        return _get_column_positions(cols, n_features)
+
+    def transform_chunks(self, chunks):
+        """Transform an iterable of chunks of a frame.
+
+        Apply the fitted transformation to each chunk of an iterable of
+        frames (e.g., from ``pd.read_csv(..., chunksize=n)``) lazily, so
+        datasets that do not fit in memory can be transformed one chunk at a
+        time. The output columns and dtypes of every chunk are conformed to
+        those of the first transformed chunk, and a ValueError is raised if
+        that cannot be done safely (i.e., an integer column that contains
+        NaNs in a later chunk).
+
+        To stream chunks through a ``Pipeline``, see
+        :func:`skoot.pipeline.transform_chunks`.
+
+        Parameters
+        ----------
+        chunks : iterable
+            An iterable of pd.DataFrames (or arrays), each of which is a
+            chunk of rows to transform.
+
+        Returns
+        -------
+        transformed : generator
+            A generator of the transformed chunks.
+        """
+        return _transform_chunks([self], chunks)
+
+    def to_row_transformer(self):
+        """Compile the fitted transformer for single-row transformations.
+
+        Calling ``transform`` on one record at a time pays for frame
+        construction, validation and concatenation on every call, which can
+        cost far more than the transformation itself. This method returns a
+        lightweight callable that applies the fitted transformation to a
+        single record using lookups precomputed from the fit parameters,
+        without constructing any pandas objects. Its output matches
+        ``transform`` for the corresponding one-row frame.
+
+        To compile a ``Pipeline`` of skoot transformers, see
+        :func:`skoot.pipeline.to_row_transformer`.
+
+        Returns
+        -------
+        row_transformer : callable
+            A function mapping a single record to its transformed output. The
+            record may be a dict keyed by column name (use an ``OrderedDict``
+            to control the order of the output columns) or a 1-D array, whose
+            columns are labelled by position just as ``transform`` would label
+            the columns of a 2-D array. If ``as_df`` is True, the output is an
+            ``OrderedDict`` mapping the output column names to values.
+            Otherwise, it is a 1-D numpy array.
+        """
+        return _RowTransformer([self])
+
+    def _row_transformer(self):
+        """Get a function that transforms a single row.
+
+        Subclasses that support :meth:`to_row_transformer` should override
+        this to return a function that accepts a single row as an
+        ``OrderedDict`` (which it may modify in place) and returns the
+        transformed row as an ``OrderedDict``.
+        """
+        raise NotImplementedError("%s does not support compiled single-row "
+                                  "transformations"
+                                  % self.__class__.__name__)
+
+    def _fused_transformer(self, columns):
+        """Plan a columnar ``transform`` for :class:`FusedPipeline`.
+
+        Subclasses that support fused execution should override this to
+        return a ``_FusedStep`` describing which of the frame's ``columns``
+        the transformation reads, writes and drops, along with the function
+        that computes the written columns. The function accepts an
+        ``OrderedDict`` mapping each of the ``reads`` to its array of values
+        and the set of ``writes`` that are actually needed downstream, and
+        returns a dict mapping (at least) the needed columns to their new
+        values. It must not modify the input arrays in place.
+
+        Written columns already present in the frame (and not dropped) are
+        overwritten in place, while new columns are appended in the order of
+        ``writes``. If that does not describe the output of ``transform``
+        for these ``columns`` (i.e., a new column would duplicate an existing
+        one), raise a NotImplementedError and ``transform`` is used instead.
+
+        Parameters
+        ----------
+        columns : list
+            The columns of the frame the transformation will be applied to.
+        """
+        raise NotImplementedError("%s does not support fused execution"
+                                  % self.__class__.__name__)
+
+    def _fit_cache_columns(self):
+        """Get the columns whose data key a cached ``fit``.
+
+        See :func:`skoot.cache.cached_fit`. By default, this is ``cols``
+        (where None means all of the columns). Subclasses whose ``fit`` reads
+        columns other than ``cols`` should override this.
+        """
+        return self.cols
 
     @timed_instance_method(attribute_name="fit_time_")
     def fit(self, X, y=None):
@@ -121,6 +444,7 @@ class _SelectiveTransformerWrapper(six.with_metaclass(dsutils._WritableDoc,
         self.trans_col_name = trans_col_name
 
     @timed_instance_method(attribute_name="fit_time_")
+    @cached_fit
     def fit(self, X, y=None, **fit_kwargs):
         """Fit the wrapped transformer.
 
@@ -139,8 +463,9 @@ class _SelectiveTransformerWrapper(six.with_metaclass(dsutils._WritableDoc,
             Pass-through for ``sklearn.pipeline.Pipeline``. Even
             if explicitly set, will not change behavior of ``fit``.
         """
-        # check on state of X and cols
-        X, cols = check_dataframe(X, self.cols)
+        # check on state of X and cols. The estimator fits on a column
+        # subset, so X itself is never altered and need not be copied
+        X, cols = check_dataframe(X, self.cols, copy=False)
 
         # fit the estimator in place
         self.estimator_.fit(X[cols], **fit_kwargs)
@@ -168,9 +493,15 @@ class _SelectiveTransformerWrapper(six.with_metaclass(dsutils._WritableDoc,
         """
         check_is_fitted(self, 'fit_cols_')
 
-        # check on state of X and cols
+        # if we can, skip pandas altogether
+        positions = self._array_positions(X, self.fit_cols_)
+        if positions is not None:
+            return self._transform_array(X, positions)
+
+        # check on state of X and cols. We build a new frame from X[cols]
+        # and X[other_nms] below, so there's no need to copy X up front
         X, _, other_nms = check_dataframe(X, cols=self.cols,
-                                          column_diff=True)
+                                          column_diff=True, copy=False)
 
         # validate that the test set columns exist in the fit columns
         cols = self.fit_cols_
@@ -181,19 +512,7 @@ class _SelectiveTransformerWrapper(six.with_metaclass(dsutils._WritableDoc,
         transform = est.transform(X[cols])
 
         # get the transformed column names
-        trans = self.trans_col_name
-        n_trans_cols = transform.shape[1]
-        if is_iterable(trans):
-            if len(trans) != n_trans_cols:
-                raise ValueError("dim mismatch in transformed column names "
-                                 "and transformed column shape! (%i!=%i)"
-                                 % (len(trans), n_trans_cols))
-        # else it's some scalar
-        else:
-            if trans is None:  # default to class name
-                trans = self.estimator_.__class__.__name__
-            # this gets caught if it's None as well:
-            trans = ["%s%i" % (trans, i + 1) for i in xrange(n_trans_cols)]
+        trans = self._get_trans_col_names(transform.shape[1])
 
         # stack the transformed variables onto the RIGHT side
         right = pd.DataFrame.from_records(
@@ -208,6 +527,71 @@ class _SelectiveTransformerWrapper(six.with_metaclass(dsutils._WritableDoc,
         x = pd.concat([X[other_nms], right], axis=1) if other_nms else right
         return dataframe_or_array(x, self.as_df)
 
+    def _get_trans_col_names(self, n_trans_cols):
+        # get the transformed column names, validating the dims
+        trans = self.trans_col_name
+        if is_iterable(trans):
+            if len(trans) != n_trans_cols:
+                raise ValueError("dim mismatch in transformed column names "
+                                 "and transformed column shape! (%i!=%i)"
+                                 % (len(trans), n_trans_cols))
+            return trans
+
+        # else it's some scalar
+        if trans is None:  # default to class name
+            trans = self.estimator_.__class__.__name__
+        # this gets caught if it's None as well:
+        return ["%s%i" % (trans, i + 1) for i in xrange(n_trans_cols)]
+
+    def _transform_array(self, X, positions):
+        # ndarray-native equivalent of ``transform``. As with the pandas
+        # path, the "other" columns are those not in ``cols`` (all columns
+        # are transformed if it's None) and are stacked on the left
+        transform = self.estimator_.transform(X[:, positions])
+        self._get_trans_col_names(transform.shape[1])  # validate dims
+
+        if self.cols is None:
+            return transform
+
+        other = np.ones(X.shape[1], dtype=bool)
+        other[_get_column_positions(self.cols, X.shape[1])] = False
+        if not other.any():
+            return transform
+        return np.hstack((X[:, other], transform))
+
+    def _row_transformer(self):
+        check_is_fitted(self, 'fit_cols_')
+        est = self.estimator_
+        fit_cols = self.fit_cols_
+        cols = self.cols
+        keep_others = cols is not None
+        drop = set(cols if is_iterable(cols) else [cols]) if keep_others \
+            else None
+
+        # we only know the number of output columns once we've transformed
+        trans_col_names = {}
+
+        def _transform_row(row):
+            transform = est.transform(np.array([[row[c] for c in fit_cols]]))
+            transform = transform[0]
+
+            n_trans_cols = transform.shape[0]
+            try:
+                names = trans_col_names[n_trans_cols]
+            except KeyError:
+                names = trans_col_names[n_trans_cols] = \
+                    self._get_trans_col_names(n_trans_cols)
+
+            if keep_others:
+                out = OrderedDict((k, v) for k, v in six.iteritems(row)
+                                  if k not in drop)
+            else:
+                out = OrderedDict()
+            out.update(zip(names, transform))
+            return out
+
+        return _transform_row
+
     @classmethod
     def _get_param_names(cls):
         # so we can get constructor args for grid search
@@ -216,6 +600,235 @@ class _SelectiveTransformerWrapper(six.with_metaclass(dsutils._WritableDoc,
                cls._cls._get_param_names()  # must have _cls!
 
 
+def _conform_chunk(chunk, columns, dtypes):
+    # Make a transformed chunk's columns and dtypes match those of the first
+    # chunk, raising if that cannot be done safely
+    if isinstance(chunk, pd.DataFrame):
+        if not chunk.columns.equals(columns):
+            if set(chunk.columns) != set(columns):
+                raise ValueError("Transformed chunk columns differ from "
+                                 "those of the first chunk. Expected %r, "
+                                 "but got %r" % (columns.tolist(),
+                                                 chunk.columns.tolist()))
+            chunk = chunk[columns]
+
+        casts = {}
+        for col, dtype, expected in zip(columns, chunk.dtypes, dtypes):
+            if dtype != expected:
+                if not _can_cast(dtype, expected):
+                    raise ValueError("Cannot safely cast transformed chunk "
+                                     "column %r from %s to the dtype of the "
+                                     "first chunk (%s)"
+                                     % (col, dtype, expected))
+                casts[col] = expected
+        return chunk.astype(casts) if casts else chunk
+
+    # otherwise it's an array
+    if chunk.shape[1:] != columns:
+        raise ValueError("Transformed chunk shape %r does not match that of "
+                         "the first chunk" % (chunk.shape,))
+    if chunk.dtype != dtypes:
+        if not _can_cast(chunk.dtype, dtypes):
+            raise ValueError("Cannot safely cast transformed chunk from %s "
+                             "to the dtype of the first chunk (%s)"
+                             % (chunk.dtype, dtypes))
+        chunk = chunk.astype(dtypes)
+    return chunk
+
+
+def _can_cast(from_dtype, to_dtype):
+    # pandas extension dtypes (i.e., category) are not understood by numpy
+    try:
+        return np.can_cast(from_dtype, to_dtype)
+    except TypeError:
+        return False
+
+
+def _transform_chunks(transformers, chunks):
+    # Stream each chunk through the fitted transformers, conforming the
+    # columns and dtypes of every output chunk to those of the first
+    columns = dtypes = None
+    for frame in chunks:
+        for transformer in transformers:
+            frame = transformer.transform(frame)
+
+        if columns is None:
+            if isinstance(frame, pd.DataFrame):
+                columns, dtypes = frame.columns, frame.dtypes.tolist()
+            else:
+                columns, dtypes = frame.shape[1:], frame.dtype
+        else:
+            frame = _conform_chunk(frame, columns, dtypes)
+
+        yield frame
+
+
+class _RowTransformer(object):
+    """A compiled chain of fitted skoot transformers for single rows.
+
+    Parameters
+    ----------
+    transformers : list
+        The fitted BasePDTransformer instances to apply, in order.
+    """
+    def __init__(self, transformers):
+        self.transformers = transformers
+
+        # (function, re-key by position?) for each step. A step that returns
+        # an array labels the columns of the next step by position
+        n_steps = len(transformers)
+        self._steps = [(t._row_transformer(),
+                        not t.as_df and i < n_steps - 1)
+                       for i, t in enumerate(transformers)]
+        self._as_df = transformers[-1].as_df
+
+    def __call__(self, row):
+        if isinstance(row, dict):
+            row = OrderedDict(row)  # copy, since steps can modify in place
+        else:
+            row = OrderedDict(enumerate(row))
+
+        for transform_row, by_position in self._steps:
+            row = transform_row(row)
+            if by_position:
+                row = OrderedDict(enumerate(six.itervalues(row)))
+
+        if self._as_df:
+            return row
+
+        # like DataFrame.values, any non-numeric values make this an object
+        # array rather than a string array
+        values = list(six.itervalues(row))
+        array = np.array(values)
+        if array.dtype.kind in "USO":
+            array = np.array(values, dtype=object)
+        return array
+
+
+# A columnar plan of a transformer's ``transform``. See
+# BasePDTransformer._fused_transformer
+_FusedStep = namedtuple("_FusedStep", ("reads", "writes", "drops", "func"))
+
+
+def _check_fused_columns(cols, columns):
+    # If any columns are missing, fall back on ``transform`` so it can raise
+    if cols is None:
+        return
+    if not is_iterable(cols):
+        cols = [cols]
+    present = set(columns)
+    if any(c not in present for c in cols):
+        raise NotImplementedError("Not all columns are present")
+
+
+def _column_values(series):
+    # the values of a column, keeping pandas-specific types (i.e.,
+    # Categorical or tz-aware datetimes) intact
+    if isinstance(series.dtype, np.dtype):
+        return series.values
+    return getattr(series, "array", series)
+
+
+def _columnarize(X):
+    # Split a frame into its columns' values. Returns None if the column
+    # names are not unique, since they could not be told apart
+    if not X.columns.is_unique:
+        return None
+    return OrderedDict((c, _column_values(X[c])) for c in X.columns)
+
+
+def _materialize(store, columns, index):
+    # build a frame from the columns' values. This is the only copy
+    return pd.DataFrame(OrderedDict((c, store[c]) for c in columns),
+                        index=index, columns=columns)
+
+
+def _plan_fused(transformers, columns):
+    # Plan the run of fusable transformers at the head of the list. Returns
+    # a list of (transformer, step, columns after the step), which ends
+    # early at any transformer that returns an array
+    plan = []
+    for transformer in transformers:
+        if not isinstance(transformer, BasePDTransformer):
+            break
+        try:
+            step = transformer._fused_transformer(columns)
+        except NotImplementedError:
+            break
+
+        drops = set(step.drops)
+        kept = [c for c in columns if c not in drops]
+        present = set(kept)
+        columns = kept + [c for c in step.writes if c not in present]
+        plan.append((transformer, step, columns))
+
+        if not transformer.as_df:
+            break
+    return plan
+
+
+def _needed_writes(plan):
+    # Work backwards from the columns output by the run of steps to find
+    # which of each step's writes are actually used. For instance, dummy
+    # columns later dropped by a feature selector need never be computed
+    live = set(plan[-1][2])
+    needed = []
+    for _, step, _ in reversed(plan):
+        needed.append(live.intersection(step.writes))
+        live = live.difference(step.writes).union(step.reads)
+    return needed[::-1]
+
+
+def _fused_transform(transformers, X):
+    # Apply fitted transformers in as few passes over the data as possible.
+    # Runs of transformers that support fused execution operate on a store of
+    # column arrays, each touching only the columns it reads and writes, and
+    # a frame is only built at the end of the run. Any other transformer is
+    # applied to a materialized frame as usual.
+    current = X
+    store = columns = index = None
+    i, n_transformers = 0, len(transformers)
+
+    while i < n_transformers:
+        transformer = transformers[i]
+        if store is None and isinstance(transformer, BasePDTransformer):
+            current, _ = check_dataframe(current, copy=False)
+            store = _columnarize(current)
+            columns, index = current.columns.tolist(), current.index
+
+        plan = _plan_fused(transformers[i:], columns) \
+            if store is not None else []
+
+        # not fusable, so transform a frame
+        if not plan:
+            if current is None:
+                current = _materialize(store, columns, index)
+            current = transformer.transform(current)
+            store = None
+            i += 1
+            continue
+
+        for (_, step, _), needed in zip(plan, _needed_writes(plan)):
+            block = OrderedDict((c, store[c]) for c in step.reads)
+            written = step.func(block, needed)
+            for c in step.drops:
+                store.pop(c, None)
+            store.update(written)
+
+        columns = plan[-1][2]
+        current = None
+        i += len(plan)
+
+        # a transformer that outputs an array ends the run
+        if not plan[-1][0].as_df:
+            current = _materialize(store, columns, index).values
+            store = None
+
+    if store is not None:
+        return _materialize(store, columns, index)
+    return current
+
+
 class _AnonymousPDTransformer(BasePDTransformer):
     """General transformer wrapper used to make a commutative function
     into a Pipeline-able function.
@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+#
+# Author: Taylor Smith <taylor.smith@alkaline-ml.com>
+#
+# An opt-in, content-addressed cache of fitted transformer state
+
+from __future__ import absolute_import, division
+
+from sklearn.externals import six
+from sklearn.externals.joblib import dump, load, hash as joblib_hash
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import wraps
+import hashlib
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from .utils.iterables import is_iterable
+
+try:
+    import cPickle as pickle
+except ImportError:  # Python 3
+    import pickle
+
+__all__ = [
+    'FitCache',
+    'cached_fit',
+    'fit_cache',
+    'get_fit_cache',
+    'set_fit_cache'
+]
+
+# blake2b is much faster than md5, but only exists in Python 3.6+
+_hasher = getattr(hashlib, "blake2b", hashlib.md5)
+
+# The cache (if any) that fits currently use
+_active = {"cache": None}
+
+# The transformers currently being fit through the cache in this thread, so
+# a cached fit that calls a cached super-fit is only cached once
+_fitting = threading.local()
+
+
+class FitCache(object):
+    """A content-addressed cache of fitted transformer state.
+
+    Hyperparameter searches often refit identical upstream transformers on
+    the same cross-validation folds many times over, since only the
+    downstream parameters change. While a ``FitCache`` is active (see
+    :func:`fit_cache`), every cacheable fit is keyed on a fast hash of the
+    transformer's class, its ``get_params()`` and the data of the columns it
+    fits on (along with ``y`` and any fit parameters). A repeated fit with
+    the same key restores the fitted attributes from the cache rather than
+    recomputing them.
+
+    Parameters
+    ----------
+    max_bytes : int or None, optional (default=2 ** 30)
+        The byte budget of the cache. When it is exceeded, the least
+        recently used entries are evicted. If None, the cache is unbounded.
+
+    directory : str or None, optional (default=None)
+        If None, fitted state is pickled in memory. Otherwise, it is dumped
+        to files in this directory (which is created if necessary), from
+        which numpy arrays are memory-mapped (read-only) when restored. A
+        directory can be shared between processes and sessions.
+
+    Attributes
+    ----------
+    hits : int
+        The number of fits restored from the cache.
+
+    misses : int
+        The number of fits computed (and stored) because their key was not
+        in the cache.
+
+    nbytes : int
+        The number of bytes currently held by the cache.
+
+    evictions : int
+        The number of entries evicted to stay within ``max_bytes``.
+
+    Notes
+    -----
+    Fits whose results are not a deterministic function of the key are
+    never cached: if a transformer has a ``random_state`` parameter that is
+    None or a ``RandomState`` instance, it is always fit rather than
+    restored from (or stored in) the cache. Only transformers seeded with an
+    int are cached. The active cache is process-global, so it is not seen by
+    the workers of a process-based parallel search.
+
+    Examples
+    --------
+    >>> from skoot.datasets import load_iris_df
+    >>> from skoot.preprocessing import BoxCoxTransformer
+    >>> X = load_iris_df(include_tgt=False, names=['a', 'b', 'c', 'd'])
+    >>> cache = FitCache(max_bytes=2 ** 20)
+    >>> with fit_cache(cache):
+    ...     bc = BoxCoxTransformer(cols=['a', 'b']).fit(X)
+    ...     bc2 = BoxCoxTransformer(cols=['a', 'b']).fit(X)
+    >>> cache.hits, cache.misses
+    (1, 1)
+    """
+    def __init__(self, max_bytes=2 ** 30, directory=None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+
+        if directory is not None and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        # key -> number of bytes, in least-recently-used order
+        self._entries = OrderedDict()
+        self._store = {}  # key -> pickled state, if in memory
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self.evictions = 0
+
+    def _path(self, key):
+        return os.path.join(self.directory, "%s.pkl" % key)
+
+    def get(self, key):
+        """Get the fitted state stored under a key, or None.
+
+        Counts a hit if the key is in the cache, and a miss otherwise.
+
+        Parameters
+        ----------
+        key : str or unicode
+            The key of the fit.
+        """
+        with self._lock:
+            if key not in self._entries:
+                # another process may have written it to a shared directory
+                if self.directory is None or \
+                        not os.path.exists(self._path(key)):
+                    self.misses += 1
+                    return None
+                self._add_entry(key, os.path.getsize(self._path(key)))
+
+            # mark it as the most recently used
+            self._entries[key] = self._entries.pop(key)
+            self.hits += 1
+
+            if self.directory is not None:
+                return load(self._path(key), mmap_mode="r")
+            data = self._store[key]
+        return pickle.loads(data)
+
+    def put(self, key, state):
+        """Store the fitted state under a key.
+
+        Parameters
+        ----------
+        key : str or unicode
+            The key of the fit.
+
+        state : dict
+            The fitted attributes to store.
+        """
+        if self.directory is None:
+            data = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+            nbytes = len(data)
+        else:
+            path = self._path(key)
+            dump(state, path)
+            nbytes = os.path.getsize(path)
+
+        with self._lock:
+            # an entry larger than the whole budget is never stored
+            if self.max_bytes is not None and nbytes > self.max_bytes:
+                if self.directory is not None:
+                    os.unlink(self._path(key))
+                return
+
+            if self.directory is None:
+                self._store[key] = data
+            self._add_entry(key, nbytes)
+
+    def _add_entry(self, key, nbytes):
+        self.nbytes -= self._entries.pop(key, 0)
+        self._entries[key] = nbytes
+        self.nbytes += nbytes
+
+        # evict the least recently used until we're under budget
+        while self.max_bytes is not None and self.nbytes > self.max_bytes:
+            old, old_nbytes = self._entries.popitem(last=False)
+            self._remove(old)
+            self.nbytes -= old_nbytes
+            self.evictions += 1
+
+    def _remove(self, key):
+        if self.directory is None:
+            self._store.pop(key, None)
+        else:
+            try:
+                os.unlink(self._path(key))
+            except OSError:  # already removed (or still mapped on Windows)
+                pass
+
+    def clear(self):
+        """Remove every entry and reset the counters."""
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+            self._entries.clear()
+            self.hits = self.misses = self.nbytes = self.evictions = 0
+
+
+def get_fit_cache():
+    """Get the active fit cache.
+
+    Returns
+    -------
+    cache : FitCache or None
+        The active cache, or None if fits are not cached.
+    """
+    return _active["cache"]
+
+
+def set_fit_cache(cache):
+    """Set (or unset) the fit cache globally.
+
+    Parameters
+    ----------
+    cache : FitCache or None
+        The cache to use for all subsequent cacheable fits. If None, fits
+        are no longer cached.
+    """
+    if cache is not None and not isinstance(cache, FitCache):
+        raise TypeError("cache must be a FitCache or None, but got type=%s"
+                        % type(cache))
+    _active["cache"] = cache
+
+
+@contextmanager
+def fit_cache(cache):
+    """Cache fits within a context.
+
+    Parameters
+    ----------
+    cache : FitCache
+        The cache to use for every cacheable fit within the context. The
+        previously active cache (if any) is restored on exit.
+    """
+    previous = get_fit_cache()
+    set_fit_cache(cache)
+    try:
+        yield cache
+    finally:
+        set_fit_cache(previous)
+
+
+def _hash_frame(hasher, X, cols):
+    # hash the names, dtypes and values of the columns
+    if not isinstance(X, pd.DataFrame):
+        X = pd.DataFrame.from_records(X)
+    if cols is None:
+        cols = X.columns.tolist()
+    elif not is_iterable(cols):
+        cols = [cols]
+
+    hasher.update(repr((X.shape[0], list(cols))).encode("utf-8"))
+    for c in cols:
+        series = X[c]
+        dtype = series.dtype
+        hasher.update(str(dtype).encode("utf-8"))
+
+        if isinstance(dtype, np.dtype) and dtype.kind in "biufcmM":
+            values = np.ascontiguousarray(series.values)
+        else:
+            values = pd.util.hash_pandas_object(series, index=False).values
+        hasher.update(memoryview(values.view(np.uint8)))
+
+
+def _is_unseeded(estimator):
+    # whether the estimator's fit draws from an unseeded (or shared,
+    # stateful) random number generator, so refitting it would not
+    # reproduce the same fitted state
+    params = estimator.get_params(deep=False)
+    if "random_state" not in params:
+        return False
+    random_state = params["random_state"]
+    return random_state is None or \
+        isinstance(random_state, np.random.RandomState)
+
+
+def _fit_key(estimator, X, y, fit_params):
+    # the content address of a fit
+    hasher = _hasher()
+    cls = estimator.__class__
+    hasher.update(("%s.%s" % (cls.__module__, cls.__name__)).encode("utf-8"))
+    hasher.update(joblib_hash((estimator.get_params(deep=False),
+                               fit_params, y)).encode("utf-8"))
+    _hash_frame(hasher, X, estimator._fit_cache_columns())
+    return hasher.hexdigest()
+
+
+def cached_fit(fit):
+    """Decorate a transformer's ``fit`` to use the active fit cache.
+
+    If a :class:`FitCache` is active, the decorated ``fit`` restores the
+    fitted attributes from the cache when the same transformer (class and
+    parameters) has already been fit on the same data. Otherwise, it fits
+    the transformer and stores every attribute that is not a constructor
+    parameter. The columns whose data key the fit are given by the
+    transformer's ``_fit_cache_columns`` method. Transformers with an
+    unseeded ``random_state`` (None or a ``RandomState`` instance) are
+    never cached.
+
+    Parameters
+    ----------
+    fit : callable
+        The ``fit`` method, with the signature ``fit(self, X, y=None,
+        **fit_params)``.
+    """
+    @wraps(fit)
+    def wrapper(self, X, y=None, **fit_params):
+        cache = get_fit_cache()
+        fitting = getattr(_fitting, "ids", None)
+        if fitting is None:
+            fitting = _fitting.ids = set()
+        if cache is None or id(self) in fitting or _is_unseeded(self):
+            return fit(self, X, y, **fit_params)
+
+        # if we can't hash the data (i.e., missing columns), fit will raise
+        try:
+            key = _fit_key(self, X, y, fit_params)
+        except (KeyError, TypeError, ValueError):
+            return fit(self, X, y, **fit_params)
+
+        state = cache.get(key)
+        if state is not None:
+            self.__dict__.update(state)
+            return self
+
+        fitting.add(id(self))
+        try:
+            result = fit(self, X, y, **fit_params)
+        finally:
+            fitting.discard(id(self))
+
+        # store everything but the constructor parameters
+        params = set(self.get_params(deep=False))
+        try:
+            cache.put(key, {k: v for k, v in six.iteritems(self.__dict__)
+                            if k not in params})
+        except (pickle.PicklingError, AttributeError, TypeError):
+            pass  # some fitted state can't be pickled, so don't cache it
+        return result
+
+    return wrapper
@@ -4,7 +4,8 @@
 
 from __future__ import absolute_import
 
-from ..base import BasePDTransformer
+from ..base import BasePDTransformer, _column_parallel, _FusedStep
+from ..base import _check_fused_columns
 from ..utils.validation import check_dataframe, validate_test_set_columns
 from ..utils.iterables import ensure_iterable
 from ..utils.series import is_datetime_type
@@ -12,6 +13,7 @@ from ..utils.dataframe import dataframe_or_array
 from ..utils.metaestimators import timed_instance_method
 
 from sklearn.utils.validation import check_is_fitted
+from collections import OrderedDict
 from itertools import combinations
 
 import numpy as np
@@ -23,35 +25,55 @@ __all__ = [
 ]
 
 
-def _factorize(X, cols, feature_names, sep):
-    right_side = None
-    for col in cols:
-        series = X[col]
-
-        # Now the real challenge here is that some of the columns passed
-        # may not be datetimes, which is required for this transformer.
-        if not is_datetime_type(series):
-            raise ValueError("The DateFactorizer requires passed columns "
-                             "to be DateTime types. Consider using the "
-                             "skoot.preprocessing.DateTransformer first.")
-
-        # First, just extract each individual component from the date
-        feat = np.asarray(
-            series.apply(
-                lambda d: [getattr(d, f)
-                           for f in feature_names]).values.tolist())
-
-        pd_features = pd.DataFrame.from_records(
-            feat, columns=["%s%s%s" % (col, sep, feature)
-                           for feature in feature_names])
-
-        # Our single feature has just become a matrix. We'll make it into
-        # a pandas frame that keeps getting concatenated together
-        if right_side is None:  # first pass
-            right_side = pd_features
-        else:
-            # No need to reset index here since right_side will be 0, 1, .., N
-            right_side = pd.concat([right_side, pd_features], axis=1)
+def _extract_feature(series, index, feature):
+    # Extract a single component from each date. If the DatetimeIndex
+    # computes the same numeric field as the Timestamp attribute, use its
+    # vectorized version. Otherwise, get the attribute from each Timestamp.
+    if not callable(getattr(pd.Timestamp, feature, None)):
+        values = getattr(index, feature, None)
+        if values is not None and np.asarray(values).dtype.kind in "iuf":
+            return np.asarray(values, dtype=np.float64)
+
+    return np.asarray(
+        series.apply(lambda d: getattr(d, feature)).values.tolist(),
+        dtype=np.float64).reshape(series.shape[0])
+
+
+def _date_features(series, feature_names):
+    # Now the real challenge here is that some of the columns passed
+    # may not be datetimes, which is required for this transformer.
+    if not is_datetime_type(series):
+        raise ValueError("The DateFactorizer requires passed columns "
+                         "to be DateTime types. Consider using the "
+                         "skoot.preprocessing.DateTransformer first.")
+
+    # Extract each individual component from the date. These are always
+    # floats, since any NaT will produce a NaN. Otherwise, the dtypes would
+    # vary depending on whether a NaT is present (i.e., in different chunks
+    # of the same data)
+    index = pd.DatetimeIndex(series.values)
+    return [_extract_feature(series, index, f) for f in feature_names]
+
+
+def _factorize_one(series, col, feature_names, sep):
+    features = _date_features(series, feature_names)
+    feat = np.column_stack(features) if features \
+        else np.empty((series.shape[0], 0))
+
+    # Our single feature has just become a matrix. We'll make it into
+    # a pandas frame to be concatenated with the others
+    return pd.DataFrame(
+        feat, columns=["%s%s%s" % (col, sep, feature)
+                       for feature in feature_names])
+
+
+def _factorize(X, cols, feature_names, sep, n_jobs=1, backend="loky"):
+    # factorize each column (in parallel) and concatenate them all at once
+    right_side = pd.concat(
+        _column_parallel(_factorize_one, [(X[col], col) for col in cols],
+                         n_jobs=n_jobs, backend=backend,
+                         feature_names=feature_names, sep=sep),
+        axis=1)
 
     # concat to the original df. we DO need to reset index of right_side here.
     right_side.index = X.index
@@ -92,6 +114,18 @@ class DateFactorizer(BasePDTransformer):
     features : iterable, optional (default=("year", "month", "day", "hour"))
         The features to extract. These are attributes of the DateTime class
         and will raise an AttributeError if an invalid feature is passed.
+        The extracted features are always float64, since missing dates
+        produce NaN values.
+
+    n_jobs : int, optional (default=1)
+        The number of jobs to use to factorize the columns. The columns are
+        split into one shard per job. If -1, all CPUs are used. If 1, no
+        parallel computing code is used at all.
+
+    backend : str or unicode, optional (default="loky")
+        The joblib backend used when ``n_jobs`` is not 1. Since extracting
+        the date features is pure-Python work that holds the GIL, the
+        default is a process pool ("loky").
 
     Examples
     --------
@@ -120,13 +154,16 @@ class DateFactorizer(BasePDTransformer):
         The columns the transformer was fit on.
     """
     def __init__(self, cols=None, as_df=True, drop_original=True, sep="_",
-                 features=("year", "month", "day", "hour")):
+                 features=("year", "month", "day", "hour"), n_jobs=1,
+                 backend="loky"):
         super(DateFactorizer, self).__init__(
             cols=cols, as_df=as_df)
 
         self.drop_original = drop_original
         self.sep = sep
         self.features = features
+        self.n_jobs = n_jobs
+        self.backend = backend
 
     # Don't decorate this one, since it calls fit_transform, which is decorated
     def fit(self, X, y=None):
@@ -179,7 +216,9 @@ class DateFactorizer(BasePDTransformer):
 
         # compute the factorized features and unify with the original DF
         features = ensure_iterable(self.features)
-        X = _factorize(X, cols, features, self.sep)  # type: pd.DataFrame
+        X = _factorize(X, cols, features, self.sep,
+                       n_jobs=self.n_jobs,
+                       backend=self.backend)  # type: pd.DataFrame
 
         # remove the original columns if necessary
         if self.drop_original:
@@ -217,13 +256,47 @@ class DateFactorizer(BasePDTransformer):
 
         # compute the factorized features and unify with the original DF
         X = _factorize(X, cols, ensure_iterable(self.features),
-                       self.sep)  # type: pd.DataFrame
+                       self.sep, n_jobs=self.n_jobs,
+                       backend=self.backend)  # type: pd.DataFrame
 
         # remove the original columns if necessary
         if self.drop_original:
             X = X.drop(cols, axis=1)
         return dataframe_or_array(X, self.as_df)
 
+    def _fused_transformer(self, columns):
+        check_is_fitted(self, "fit_cols_")
+        _check_fused_columns(self.cols, columns)
+
+        cols = self.fit_cols_
+        validate_test_set_columns(cols, columns)
+
+        sep = self.sep
+        features = ensure_iterable(self.features)
+        names = [["%s%s%s" % (col, sep, f) for f in features]
+                 for col in cols]
+        writes = [name for col_names in names for name in col_names]
+        drops = cols if self.drop_original else []
+
+        # a new column that duplicates an existing one cannot be fused
+        kept = set(columns).difference(drops)
+        if len(set(writes)) != len(writes) or kept.intersection(writes):
+            raise NotImplementedError("Factorized feature names are not "
+                                      "unique")
+
+        def _transform_columns(block, needed):
+            written = OrderedDict()
+            for col, col_names in zip(cols, names):
+                series = pd.Series(block[col])
+                wanted = [(f, nm) for f, nm in zip(features, col_names)
+                          if nm in needed]
+                values = _date_features(series, [f for f, _ in wanted])
+                written.update((nm, v) for (_, nm), v in zip(wanted, values))
+            return written
+
+        return _FusedStep(reads=cols, writes=writes, drops=drops,
+                          func=_transform_columns)
+
 
 def _time_between(X, cols, units, absolute, astype, suffix, sep):
     right_side = None
@@ -13,6 +13,7 @@ from ..base import BasePDTransformer
 from ..utils.validation import (check_dataframe, validate_multiple_cols,
                                 validate_test_set_columns)
 from ..utils.dataframe import dataframe_or_array
+from ..utils import _docstr as dsutils
 from ..utils.metaestimators import timed_instance_method
 
 __all__ = [
@@ -21,7 +22,7 @@ __all__ = [
 
 
 class InteractionTermTransformer(BasePDTransformer):
-    """Create interaction terms between predictors.
+    __doc__ = """Create interaction terms between predictors.
 
     This class will compute interaction terms between selected columns.
     An interaction captures some relationship between two independent
@@ -50,6 +51,8 @@ class InteractionTermTransformer(BasePDTransformer):
         The suffix to add to the new feature name in the form of
         <feature_x>_<feature_y>_<suffix>
 
+    %(_copy_doc)s
+
     Attributes
     ----------
     fun_ : callable
@@ -81,12 +84,13 @@ class InteractionTermTransformer(BasePDTransformer):
     3    14.26
     4    18.00
     Name: sepal length (cm)_sepal width (cm)_I, dtype: float64
-    """
+    """ % {"_copy_doc": dsutils._copy_doc.strip()}
+
     def __init__(self, cols=None, as_df=True, interaction_function=None,
-                 name_suffix='I'):
+                 name_suffix='I', copy=True):
 
         super(InteractionTermTransformer, self).__init__(
-            cols=cols, as_df=as_df)
+            cols=cols, as_df=as_df, copy=copy)
 
         self.interaction_function = interaction_function
         self.name_suffix = name_suffix
@@ -105,7 +109,7 @@ class InteractionTermTransformer(BasePDTransformer):
         y : array-like or None, shape=(n_samples,), optional (default=None)
             Pass-through for ``sklearn.pipeline.Pipeline``.
         """
-        X, cols = check_dataframe(X, cols=self.cols)
+        X, cols = check_dataframe(X, cols=self.cols, copy=False)
 
         # validate multiple columns present
         validate_multiple_cols(self.__class__.__name__, cols)
@@ -142,7 +146,7 @@ class InteractionTermTransformer(BasePDTransformer):
             and the result set is returned.
         """
         check_is_fitted(self, 'fun_')
-        X, _ = check_dataframe(X, cols=self.cols)
+        X, _ = check_dataframe(X, cols=self.cols, copy=self.copy)
 
         # get the ones we need to transform, and which are present
         transform_cols = self.fit_cols_
@@ -162,3 +166,21 @@ class InteractionTermTransformer(BasePDTransformer):
 
         # return matrix if needed
         return dataframe_or_array(X, self.as_df)
+
+    def _row_transformer(self):
+        check_is_fitted(self, 'fun_')
+        suff = self.name_suffix
+        fun = self.fun_
+
+        # precompute the pairs and the new feature names
+        pairs = [(name_a, name_b, '%s_%s_%s' % (name_a, name_b, suff))
+                 for name_a, name_b in combinations(self.fit_cols_, 2)]
+
+        def _transform_row(row):
+            # compute all of the terms before assigning any of them
+            terms = [(new_nm, fun(row[name_a], row[name_b]))
+                     for name_a, name_b, new_nm in pairs]
+            row.update(terms)
+            return row
+
+        return _transform_row
@@ -32,6 +32,16 @@ def test_factorize():
     assert trans.equals(fact.transform(df))
 
 
+def test_factorize_dtypes():
+    # the features are floats whether or not there are any NaTs
+    fact = DateFactorizer(cols=['b'], features=("year", "month")).fit(df)
+    for X in (df, df.iloc[:2], df.iloc[4:], df.iloc[:0]):
+        trans = fact.transform(X)
+        assert trans.shape[0] == X.shape[0]
+        assert trans.b_year.dtype == np.float64
+        assert trans.b_month.dtype == np.float64
+
+
 def test_non_date_factorize():
     # Fails since not a date time
     assert_raises(ValueError, DateFactorizer(cols=["a", "b"]).fit, df)
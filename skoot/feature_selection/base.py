@@ -7,11 +7,14 @@ from __future__ import print_function, division, absolute_import
 from sklearn.utils.validation import check_is_fitted
 from sklearn.externals import six
 from abc import ABCMeta
+from collections import OrderedDict
 
-from ..base import BasePDTransformer
+from ..base import BasePDTransformer, _get_column_positions, _FusedStep
+from ..base import _check_fused_columns
 from ..utils.validation import check_dataframe
 from ..utils.dataframe import dataframe_or_array
 
+import numpy as np
 import warnings
 
 __all__ = [
@@ -19,6 +22,16 @@ __all__ = [
 ]
 
 
+def _warn_missing_drops(drops, drop_columns):
+    # what if we don't want to throw this key error for a non-existent
+    # column that we hope to drop anyways? We need to at least inform
+    # the user... for length mismatch, we know there's a missing column
+    if len(drops) != len(drop_columns):
+        warnings.warn('one or more features to drop not contained '
+                      'in input data feature names (drop=%r)'
+                      % drop_columns, UserWarning)
+
+
 class BaseFeatureSelector(six.with_metaclass(ABCMeta, BasePDTransformer)):
     """Base class for feature selectors.
 
@@ -48,11 +61,15 @@ class BaseFeatureSelector(six.with_metaclass(ABCMeta, BasePDTransformer)):
         method. If False, will return a Numpy ``ndarray`` instead. 
         Since most skoot transformers depend on explicitly-named
         ``DataFrame`` features, the ``as_df`` parameter is True by default.
+
+    copy : bool, optional (default=True)
+        Whether to return a copy of the input frame from ``transform`` when
+        there are no features to drop. If False, ``X`` itself is returned.
     """
-    def __init__(self, cols=None, as_df=True):
+    def __init__(self, cols=None, as_df=True, copy=True):
         # simple pass-through for the super constructor call
         super(BaseFeatureSelector, self).__init__(
-            cols=cols, as_df=as_df)
+            cols=cols, as_df=as_df, copy=copy)
 
     def transform(self, X):
         """Transform a test dataframe.
@@ -71,27 +88,70 @@ class BaseFeatureSelector(six.with_metaclass(ABCMeta, BasePDTransformer)):
         """
         check_is_fitted(self, 'drop_')
 
-        # check on state of X and cols
-        X, cols = check_dataframe(X, self.cols)
+        # if we can, skip pandas altogether
+        drop_columns = self.drop_  # type: list
+        if self._array_positions(X, []) is not None:
+            return self._transform_array(X, drop_columns)
+
+        # check on state of X and cols. Dropping columns creates a new frame,
+        # so we only need to copy X if we end up passing it straight through
+        X, cols = check_dataframe(X, self.cols, copy=False)
 
         # if there's nothing to drop
-        drop_columns = self.drop_  # type: list
         if not drop_columns:
-            return X if self.as_df else X.values
+            if not self.as_df:
+                return X.values
+            return X.copy() if self.copy else X
 
         # otherwise, there's something to drop
         else:
-            # what if we don't want to throw this key error for a non-existent
-            # column that we hope to drop anyways? We need to at least inform
-            # the user...
             colset = set(X.columns)
             drops = [x for x in drop_columns if x in colset]
 
-            # for length mismatch, we know there's a missing column
-            if len(drops) != len(drop_columns):
-                warnings.warn('one or more features to drop not contained '
-                              'in input data feature names (drop=%r)'
-                              % drop_columns, UserWarning)
-
+            _warn_missing_drops(drops, drop_columns)
             dropped = X.drop(drops, axis=1)
             return dataframe_or_array(dropped, self.as_df)
+
+    def _transform_array(self, X, drop_columns):
+        # ndarray-native equivalent of ``transform``, where column labels
+        # are integer positions
+        if not drop_columns:
+            return X.copy() if self.copy else X
+
+        n_features = X.shape[1]
+        drops = [c for c in drop_columns
+                 if _get_column_positions([c], n_features) is not None]
+        _warn_missing_drops(drops, drop_columns)
+
+        keep = np.ones(n_features, dtype=bool)
+        keep[drops] = False
+        return X[:, keep]
+
+    def _row_transformer(self):
+        check_is_fitted(self, 'drop_')
+        drop_columns = self.drop_
+        drop_set = set(drop_columns)
+
+        def _transform_row(row):
+            if not drop_set:
+                return row
+
+            _warn_missing_drops([c for c in drop_columns if c in row],
+                                drop_columns)
+            return OrderedDict((k, v) for k, v in six.iteritems(row)
+                               if k not in drop_set)
+
+        return _transform_row
+
+    def _fused_transformer(self, columns):
+        check_is_fitted(self, 'drop_')
+        _check_fused_columns(self.cols, columns)
+
+        # dropping columns touches no data at all
+        drop_columns = self.drop_ or []
+        present = set(columns)
+        drops = [c for c in drop_columns if c in present]
+        _warn_missing_drops(drops, drop_columns)
+
+        return _FusedStep(reads=[], writes=[], drops=drops,
+                          func=lambda block, needed: {})
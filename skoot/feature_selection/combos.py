@@ -11,6 +11,7 @@ from .base import BaseFeatureSelector
 from ..decomposition import QRDecomposition
 from ..utils.validation import check_dataframe, validate_multiple_cols
 from ..utils.iterables import flatten_all
+from ..cache import cached_fit
 from ..utils.metaestimators import timed_instance_method
 
 __all__ = [
@@ -45,6 +46,10 @@ class LinearCombinationFilter(BaseFeatureSelector):
         Since most skoot transformers depend on explicitly-named
         ``DataFrame`` features, the ``as_df`` parameter is True by default.
 
+    copy : bool, optional (default=True)
+        Whether to return a copy of the input frame from ``transform`` when
+        there are no features to drop. If False, ``X`` itself is returned.
+
     Examples
     --------
     An example linear combination filter:
@@ -68,11 +73,12 @@ class LinearCombinationFilter(BaseFeatureSelector):
     .. [1] Caret's filterLinearCombos script - https://bit.ly/2uA6vSX
     """
 
-    def __init__(self, cols=None, as_df=True):
+    def __init__(self, cols=None, as_df=True, copy=True):
         super(LinearCombinationFilter, self).__init__(
-            cols=cols, as_df=as_df)
+            cols=cols, as_df=as_df, copy=copy)
 
     @timed_instance_method(attribute_name="fit_time_")
+    @cached_fit
     def fit(self, X, y=None):
         """Fit the transformer.
 
@@ -89,7 +95,8 @@ class LinearCombinationFilter(BaseFeatureSelector):
             if explicitly set, will not change behavior of ``fit``.
         """
         # check on state of X and cols (must all be finite for fortran)
-        X, cols = check_dataframe(X, cols=self.cols, assert_all_finite=True)
+        X, cols = check_dataframe(X, cols=self.cols, assert_all_finite=True,
+                                  copy=False)
 
         # there must be at least two columns
         validate_multiple_cols(self.__class__.__name__, cols)
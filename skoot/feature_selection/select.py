@@ -7,8 +7,15 @@ from __future__ import print_function, division, absolute_import
 import numpy as np
 import pandas as pd
 
+from collections import OrderedDict
+from sklearn.externals import six
+
 from .base import BaseFeatureSelector
-from ..utils.validation import check_dataframe, validate_multiple_cols
+from ..utils.validation import (check_dataframe, validate_multiple_cols,
+                                validate_test_set_columns)
+from ..utils._sketch import ValueCounts
+from ..utils._missing import MissingIndex
+from ..cache import cached_fit
 from ..utils.metaestimators import timed_instance_method
 
 __all__ = [
@@ -19,6 +26,19 @@ __all__ = [
 ]
 
 
+def _freq_ratio(counts):
+    # the ratio of the two largest counts of a feature's levels
+    n_levels = counts.shape[0]
+
+    # base case 1: vc len is 1 (single value, no variance at all)
+    if n_levels == 1:
+        return np.inf
+
+    # get the first two levels and counts
+    first_two = np.sort(counts)[::-1][:2].astype(float)
+    return first_two[0] / first_two[1]
+
+
 class SparseFeatureFilter(BaseFeatureSelector):
     """Drop overly sparse features.
 
@@ -45,6 +65,10 @@ class SparseFeatureFilter(BaseFeatureSelector):
         Since most skutil transformers depend on explicitly-named
         ``DataFrame`` features, the ``as_df`` parameter is True by default.
 
+    copy : bool, optional (default=True)
+        Whether to return a copy of the input frame from ``transform`` when
+        there are no features to drop. If False, ``X`` itself is returned.
+
     Examples
     --------
     An example of the sparse feature filter:
@@ -75,14 +99,15 @@ class SparseFeatureFilter(BaseFeatureSelector):
         are designated as "bad" and will be dropped in the ``transform``
         method.
     """
-    def __init__(self, cols=None, threshold=0.5, as_df=True):
+    def __init__(self, cols=None, threshold=0.5, as_df=True, copy=True):
 
         super(SparseFeatureFilter, self).__init__(
-            cols=cols, as_df=as_df)
+            cols=cols, as_df=as_df, copy=copy)
 
         self.threshold = threshold
 
     @timed_instance_method(attribute_name="fit_time_")
+    @cached_fit
     def fit(self, X, y=None):
         """Fit the transformer.
 
@@ -98,23 +123,66 @@ class SparseFeatureFilter(BaseFeatureSelector):
             Pass-through for ``sklearn.pipeline.Pipeline``. Even
             if explicitly set, will not change behavior of ``fit``.
         """
-        X, cols = check_dataframe(X, cols=self.cols)
-        thresh = self.threshold
-
-        # validate the threshold
-        if not (isinstance(thresh, float) and (0.0 <= thresh < 1.0)):
-            raise ValueError('thresh must be a float between '
-                             '0 (inclusive) and 1. Got %s' % str(thresh))
+        X, cols = check_dataframe(X, cols=self.cols, copy=False)
+        thresh = self._validate_threshold()
 
-        # assess sparsity
-        subset = X[cols]
-        self.sparsity_ = subset.apply(
-            lambda x: x.isnull().sum() / x.shape[0]).values  # type: np.ndarray
+        # assess sparsity from an index of the missing values, which never
+        # holds more than one column's boolean mask at once
+        missing = MissingIndex(X, cols)
+        self.sparsity_ = missing.counts() / X.shape[0]  # type: np.ndarray
 
         mask = self.sparsity_ > thresh  # numpy boolean array
-        self.drop_ = subset.columns[mask].tolist()
+        self.drop_ = [c for c, drop in zip(cols, mask) if drop]
+
+        # a full fit discards any state accumulated by partial_fit
+        self._partial_stats = None
         return self
 
+    def partial_fit(self, X, y=None):
+        """Incrementally fit the transformer on a chunk of samples.
+
+        This method accumulates the null counts of each feature over
+        successive chunks of a frame too large to fit in memory, and updates
+        ``sparsity_`` and ``drop_`` after each chunk. A single pass over the
+        chunks yields the same ``drop_`` as ``fit`` on the full frame.
+        Calling ``fit`` discards any state accumulated by ``partial_fit``.
+
+        Parameters
+        ----------
+        X : pd.DataFrame, shape=(n_samples, n_features)
+            The chunk of the Pandas frame to fit. Every chunk must contain
+            the columns the first chunk was fit on.
+
+        y : array-like or None, shape=(n_samples,), optional (default=None)
+            Pass-through for ``sklearn.pipeline.Pipeline``.
+        """
+        X, cols = check_dataframe(X, cols=self.cols, copy=False)
+        thresh = self._validate_threshold()
+
+        # the state is the fit columns, their null counts and the n_samples
+        stats = getattr(self, "_partial_stats", None)
+        if stats is None:
+            stats = {"cols": cols, "n_samples": 0,
+                     "n_null": np.zeros(len(cols), dtype=np.int64)}
+            self._partial_stats = stats
+
+        cols = stats["cols"]
+        validate_test_set_columns(cols, X.columns)
+        stats["n_null"] += MissingIndex(X, cols).counts()
+        stats["n_samples"] += X.shape[0]
+
+        self.sparsity_ = stats["n_null"] / stats["n_samples"]
+        self.drop_ = [c for c, drop in zip(cols, self.sparsity_ > thresh)
+                      if drop]
+        return self
+
+    def _validate_threshold(self):
+        thresh = self.threshold
+        if not (isinstance(thresh, float) and (0.0 <= thresh < 1.0)):
+            raise ValueError('thresh must be a float between '
+                             '0 (inclusive) and 1. Got %s' % str(thresh))
+        return thresh
+
 
 class FeatureFilter(BaseFeatureSelector):
     """A simple feature-dropping transformer class.
@@ -140,6 +208,10 @@ class FeatureFilter(BaseFeatureSelector):
         Since most skoot transformers depend on explicitly-named
         ``DataFrame`` features, the ``as_df`` parameter is True by default.
 
+    copy : bool, optional (default=True)
+        Whether to return a copy of the input frame from ``transform`` when
+        there are no features to drop. If False, ``X`` itself is returned.
+
     Examples
     --------
     An example using the FeatureFilter:
@@ -160,14 +232,14 @@ class FeatureFilter(BaseFeatureSelector):
         are designated as "bad" and will be dropped in the ``transform``
         method.
     """
-    def __init__(self, cols=None, as_df=True):
+    def __init__(self, cols=None, as_df=True, copy=True):
         # just a pass-through for super constructor
         super(FeatureFilter, self).__init__(
-            cols=cols, as_df=as_df)
+            cols=cols, as_df=as_df, copy=copy)
 
     def fit(self, X, y=None):
         # check on state of X and cols
-        X, cols = check_dataframe(X, cols=self.cols)
+        X, cols = check_dataframe(X, cols=self.cols, copy=False)
 
         # if the provided self.cols was None, we drop nothing. otherwise
         # we drop the specified columns
@@ -209,6 +281,10 @@ class MultiCorrFilter(BaseFeatureSelector):
         Since most skoot transformers depend on explicitly-named
         ``DataFrame`` features, the ``as_df`` parameter is True by default.
 
+    copy : bool, optional (default=True)
+        Whether to return a copy of the input frame from ``transform`` when
+        there are no features to drop. If False, ``X`` itself is returned.
+
     Examples
     --------
     The following demonstrates a simple multi-correlation filter
@@ -238,14 +314,15 @@ class MultiCorrFilter(BaseFeatureSelector):
     """
 
     def __init__(self, cols=None, threshold=0.85,
-                 method='pearson', as_df=True):
+                 method='pearson', as_df=True, copy=True):
 
         super(MultiCorrFilter, self).__init__(
-            cols=cols, as_df=as_df)
+            cols=cols, as_df=as_df, copy=copy)
 
         self.threshold = threshold
         self.method = method
 
+    @cached_fit
     def fit(self, X, y=None):
         """Fit the multi-collinearity filter.
 
@@ -262,7 +339,8 @@ class MultiCorrFilter(BaseFeatureSelector):
             if explicitly set, will not change behavior of ``fit``.
         """
         # check on state of X and cols. Also need all columns to be finite!
-        X, cols = check_dataframe(X, cols=self.cols, assert_all_finite=True)
+        X, cols = check_dataframe(X, cols=self.cols, assert_all_finite=True,
+                                  copy=False)
 
         # we need to make sure there's more than 1 column!
         validate_multiple_cols(self.__class__.__name__, cols)
@@ -375,6 +453,10 @@ class NearZeroVarianceFilter(BaseFeatureSelector):
         Since most skutil transformers depend on explicitly-named
         ``DataFrame`` features, the ``as_df`` parameter is True by default.
 
+    copy : bool, optional (default=True)
+        Whether to return a copy of the input frame from ``transform`` when
+        there are no features to drop. If False, ``X`` itself is returned.
+
     Examples
     --------
     An example of the near zero variance filter on a completely
@@ -430,13 +512,15 @@ class NearZeroVarianceFilter(BaseFeatureSelector):
     .. [2] Caret (R package) nearZeroVariance R code
            https://bit.ly/2J0ozbM
     """
-    def __init__(self, cols=None, freq_cut=95./5., as_df=True):
+    def __init__(self, cols=None, freq_cut=95./5., as_df=True,
+                 copy=True):
 
         super(NearZeroVarianceFilter, self).__init__(
-            cols=cols, as_df=as_df)
+            cols=cols, as_df=as_df, copy=copy)
 
         self.freq_cut = freq_cut
 
+    @cached_fit
     def fit(self, X, y=None):
         """Fit the near-zero variance filter.
 
@@ -453,15 +537,8 @@ class NearZeroVarianceFilter(BaseFeatureSelector):
             if explicitly set, will not change behavior of ``fit``.
         """
         # check on state of X and cols
-        X, cols = check_dataframe(X, self.cols)
-
-        # get the freq cut and validate it is an appropriate value...
-        freq_cut = self.freq_cut
-        if not (isinstance(freq_cut, (int, float)) and 1. < freq_cut):
-            raise ValueError("freq_cut must be a float > 1.0")
-
-        # make sure it's cast to a float if not already
-        freq_cut = float(freq_cut)
+        X, cols = check_dataframe(X, self.cols, copy=False)
+        freq_cut = self._validate_freq_cut()
 
         # get a mask of which should be dropped
         subset = X[cols]
@@ -469,8 +546,55 @@ class NearZeroVarianceFilter(BaseFeatureSelector):
         self.drop_ = subset.columns[ratios >= freq_cut].tolist()
         self.ratios_ = ratios
 
+        # a full fit discards any state accumulated by partial_fit
+        self._partial_stats = None
+        return self
+
+    def partial_fit(self, X, y=None):
+        """Incrementally fit the near-zero variance filter on a chunk.
+
+        This method accumulates the value counts of each feature over
+        successive chunks of a frame too large to fit in memory, and updates
+        ``ratios_`` and ``drop_`` after each chunk. A single pass over the
+        chunks yields the same ``drop_`` as ``fit`` on the full frame.
+        Calling ``fit`` discards any state accumulated by ``partial_fit``.
+
+        Parameters
+        ----------
+        X : pd.DataFrame, shape=(n_samples, n_features)
+            The chunk of the Pandas frame to fit. Every chunk must contain
+            the columns the first chunk was fit on.
+
+        y : array-like or None, shape=(n_samples,), optional (default=None)
+            Pass-through for ``sklearn.pipeline.Pipeline``.
+        """
+        X, cols = check_dataframe(X, self.cols, copy=False)
+        freq_cut = self._validate_freq_cut()
+
+        stats = getattr(self, "_partial_stats", None)
+        if stats is None:
+            stats = OrderedDict((c, ValueCounts()) for c in cols)
+            self._partial_stats = stats
+
+        cols = list(stats.keys())
+        validate_test_set_columns(cols, X.columns)
+        ratios = np.array([
+            _freq_ratio(counts.update(X[c].values).counts.values)
+            for c, counts in six.iteritems(stats)])
+
+        self.drop_ = [c for c, drop in zip(cols, ratios >= freq_cut) if drop]
+        self.ratios_ = ratios
         return self
 
+    def _validate_freq_cut(self):
+        # get the freq cut and validate it is an appropriate value...
+        freq_cut = self.freq_cut
+        if not (isinstance(freq_cut, (int, float)) and 1. < freq_cut):
+            raise ValueError("freq_cut must be a float > 1.0")
+
+        # make sure it's cast to a float if not already
+        return float(freq_cut)
+
     @staticmethod
     def _filter_freq_cut(series):
         """Filter above a frequency cut.
@@ -487,13 +611,4 @@ class NearZeroVarianceFilter(BaseFeatureSelector):
             most populated class. If there is only one class, will return
             infinity.
         """
-        vc = series.value_counts()
-        n_levels = vc.shape[0]
-
-        # base case 1: vc len is 1 (single value, no variance at all)
-        if n_levels == 1:
-            return np.inf
-
-        # get the first two levels and counts
-        first_two = vc.values[:2].astype(float)
-        return first_two[0] / first_two[1]
+        return _freq_ratio(series.value_counts().values)
@@ -12,6 +12,7 @@ from skoot.utils.testing import assert_raises
 from skoot.feature_selection import (FeatureFilter, SparseFeatureFilter,
                                      MultiCorrFilter, NearZeroVarianceFilter)
 
+from sklearn.base import clone
 from numpy.testing import assert_array_equal, assert_array_almost_equal
 
 # get some datasets defined for use later
@@ -145,3 +146,25 @@ def test_sparse_filter_dense_data():
 
     # assert on values
     assert_array_almost_equal(sps_filter.sparsity_, np.zeros(4))
+
+
+def test_filters_partial_fit():
+    rs = np.random.RandomState(42)
+    X = pd.DataFrame.from_records(rs.randint(0, 3, (200, 4)),
+                                  columns=['a', 'b', 'c', 'd']).astype(float)
+    X.loc[X.index[:150], 'd'] = 0.  # near zero variance
+    X = X.mask(rs.rand(*X.shape) < [0.1, 0.6, 0.3, 0.])  # 'b' is sparse
+    chunks = [X.iloc[i:i + 60] for i in range(0, X.shape[0], 60)]
+
+    for flt, attr in ((SparseFeatureFilter(), "sparsity_"),
+                      (NearZeroVarianceFilter(freq_cut=4.), "ratios_")):
+        for chunk in chunks:
+            flt.partial_fit(chunk)
+
+        fit = clone(flt).fit(X)
+        assert flt.drop_ == fit.drop_, (flt.drop_, fit.drop_)
+        assert flt.drop_  # make sure we are testing something
+        assert_array_almost_equal(getattr(flt, attr), getattr(fit, attr))
+
+    # all chunks must contain the columns of the first
+    assert_raises(ValueError, flt.partial_fit, X[['a', 'b']])
@@ -4,21 +4,41 @@
 
 from __future__ import division, print_function, absolute_import
 
+import numbers
+import time
+import warnings
+
+import numpy as np
 import pandas as pd
 
+from collections import OrderedDict
+
+from sklearn.base import clone
 from sklearn.ensemble import BaggingRegressor, BaggingClassifier
+from sklearn.neighbors import NearestNeighbors
 from sklearn.externals import six
 from sklearn.utils.validation import check_is_fitted
 
-from .base import BasePDTransformer
-from .utils.validation import check_dataframe
+from .cache import cached_fit
+from .base import BasePDTransformer, _column_parallel, _FusedStep
+from .base import _nested_n_jobs
+from .base import _check_fused_columns, _column_values
+from .utils.validation import check_dataframe, validate_test_set_columns
 from .utils.iterables import is_iterable
 from .utils.dataframe import dataframe_or_array
+from .utils import _docstr as dsutils
+from .utils._sketch import (HeavyHitters, QuantileSketch, RunningMoments,
+                            ValueCounts)
+from .utils._missing import MissingIndex
+from .utils._forest import compact_bagging, pickled_nbytes
+from .balance.neighbors import BlockedNearestNeighbors
 
 __all__ = [
     'BaggedRegressorImputer',
     'BaggedClassifierImputer',
-    'SelectiveImputer'
+    'KNNImputer',
+    'SelectiveImputer',
+    'TimeSeriesImputer'
 ]
 
 
@@ -30,6 +50,13 @@ def _get_mask(X, value_to_mask):
         return X == value_to_mask
 
 
+def _is_missing_value(value, value_to_mask):
+    # Scalar equivalent of _get_mask for single-row transformations
+    if value_to_mask == 'NaN':
+        return value is None or value != value  # only NaN/NaT != themselves
+    return value == value_to_mask
+
+
 def _get_callable(strat, valid_strats):
     # Handle lookup of callable for a strategy in valid strategies
     if isinstance(strat, six.string_types):
@@ -69,8 +96,227 @@ def _most_frequent(series, missing_mask):
     return present_values.mode()[0]
 
 
+# The number of values sketched at once by the approximate strategies
+_SKETCH_CHUNK_SIZE = 2 ** 20
+
+
+def _sketch_chunk(values, missing_mask, sketch_class):
+    # sketch the present values of one chunk of a column
+    return sketch_class().update(values[~missing_mask])
+
+
+def _sketch_present_values(series, missing_mask, sketch_class, n_jobs=1,
+                           backend="threading"):
+    # Sketch the present values of a column one chunk at a time (so neither
+    # the column's present values nor a sort of them is ever materialized),
+    # in parallel if n_jobs is not 1, and merge the chunks' sketches
+    values = series.values
+    missing_mask = np.asarray(missing_mask, dtype=bool)
+    if missing_mask.all():
+        raise ValueError("All values in column are missing!")
+
+    size = _SKETCH_CHUNK_SIZE
+    sketches = _column_parallel(
+        _sketch_chunk, [(values[i:i + size], missing_mask[i:i + size])
+                        for i in range(0, values.shape[0], size)],
+        n_jobs=n_jobs, backend=backend, sketch_class=sketch_class)
+
+    sketch = sketches[0]
+    for other in sketches[1:]:
+        sketch.merge(other)
+    return sketch
+
+
+def _approx_median(series, missing_mask):
+    # approximate the median of non missing elements in a pd.Series
+    return _sketch_present_values(series, missing_mask,
+                                  QuantileSketch).median()
+
+
+def _approx_most_frequent(series, missing_mask):
+    # approximate the mode of non missing elements in a pd.Series
+    return _sketch_present_values(series, missing_mask,
+                                  HeavyHitters).mode()
+
+
+# The numpy reduction that computes each built-in strategy over all of the
+# numeric columns of a frame at once (for fit)
+_BLOCK_STRATEGIES = {_mean: np.nanmean, _median: np.nanmedian}
+
+# The most bytes of float64 data reduced at once by _block_statistics
+_BLOCK_BYTES = 2 ** 28
+
+
+def _block_statistics(X, strategy, mask):
+    # Compute the mean and median strategies of the numeric columns in one
+    # vectorized pass over 2-D blocks, rather than copying the present values
+    # of each column into a new Series. The mask may be a boolean frame or a
+    # MissingIndex. Returns the statistics that were computed, so the
+    # remaining columns can use their callables.
+    groups = OrderedDict()
+    for c, strat in six.iteritems(strategy):
+        dtype = X[c].dtype
+        if strat in _BLOCK_STRATEGIES and \
+                (dtype == np.float64 or dtype.kind in "iu"):
+            groups.setdefault(strat, []).append(c)
+
+    statistics = {}
+    n_cols = max(1, _BLOCK_BYTES // (8 * max(1, X.shape[0])))
+    for strat, cols in six.iteritems(groups):
+        reduce_func = _BLOCK_STRATEGIES[strat]
+        for i in range(0, len(cols), n_cols):
+            block_cols = cols[i:i + n_cols]
+            sparse = isinstance(mask, MissingIndex)
+            if sparse:
+                all_missing = any(mask.count(c) == X.shape[0]
+                                  for c in block_cols)
+            else:
+                block_mask = mask[block_cols].values
+                all_missing = block_mask.all(axis=0).any()
+            if all_missing:
+                raise ValueError("All values in column are missing!")
+
+            # missing values are NaN to the nan-reductions, and NaNs that
+            # aren't the missing value are skipped just like pandas does
+            block = X[block_cols].values.astype(np.float64)
+            if sparse:
+                for j, c in enumerate(block_cols):
+                    block[mask.positions(c), j] = np.nan
+            else:
+                block[block_mask] = np.nan
+            with warnings.catch_warnings():
+                # a column of only NaNs has a NaN statistic, as in pandas
+                warnings.simplefilter("ignore", RuntimeWarning)
+                values = reduce_func(block, axis=0)
+
+            statistics.update(zip(block_cols, values))
+
+    return statistics
+
+
+def _impute_column(series, value, missing_values):
+    # fill the missing values in a single column
+    return series.mask(_get_mask(series, missing_values), value)
+
+
+def _fills_in_place(dtype, value):
+    # whether filling a column of this dtype with the value keeps the dtype,
+    # in which case it can be filled as part of a 2-D block
+    if isinstance(value, (bool, np.bool_)) or \
+            not isinstance(value, numbers.Number):
+        return False
+    if dtype == np.float64:
+        return isinstance(value, numbers.Real)
+    return dtype == np.int64 and isinstance(value, numbers.Integral)
+
+
+def _impute_blocks(X, cols, stats, missing_values):
+    # Fill the columns that can be imputed without changing their dtype in
+    # one np.where per same-dtype block, rather than one masked assignment
+    # per column. Returns the columns that must still be filled one by one.
+    blocks = OrderedDict()
+    remaining = []
+    for c in cols:
+        dtype = X[c].dtype
+        if _fills_in_place(dtype, stats[c]):
+            blocks.setdefault(dtype, []).append(c)
+        else:
+            remaining.append(c)
+
+    for dtype, block_cols in six.iteritems(blocks):
+        # a block with a single column gains nothing over the series path
+        if len(block_cols) == 1:
+            remaining.extend(block_cols)
+            continue
+
+        block = X[block_cols].values
+        mask = _get_mask(block, missing_values)
+        if mask.any():
+            fills = np.array([stats[c] for c in block_cols], dtype=dtype)
+            X[block_cols] = np.where(mask, fills, block)
+
+    return remaining
+
+
+def _group_keys(X, group_by):
+    # The group keys of each row of X, as an index that can be looked up in
+    # a table of group statistics
+    if len(group_by) == 1:
+        return X[group_by[0]]
+    return pd.MultiIndex.from_arrays([X[g] for g in group_by])
+
+
+def _present_or_nan(strat):
+    # wrap a strategy to compute the statistic of a group's (NaN-masked)
+    # values, or NaN if all of them are missing
+    def _group_stat(series):
+        mask = pd.isnull(series)
+        if mask.all():
+            return np.nan
+        return strat(series, mask)
+    return _group_stat
+
+
+def _group_modes(series, keys, present):
+    # The most frequent present value of each group (the smallest of any
+    # ties, as in pd.Series.mode), from the count of each (group, value)
+    # pair in a single groupby
+    values = series[present]
+    counts = values.groupby([k[present] for k in keys] + [values]).size()
+    counts = counts.iloc[(-counts.values).argsort(kind="mergesort")]
+
+    groups = counts.index.droplevel(-1)
+    first = ~groups.duplicated()
+    return pd.Series(counts.index.get_level_values(-1)[first],
+                     index=groups[first], name=series.name)
+
+
+def _group_statistics(X, group_by, strategy, mask):
+    # Compute the statistic of every impute column for every group, hashing
+    # the group keys once. Returns a frame indexed by the group keys with a
+    # column per impute column, which is NaN where a group has no present
+    # values in a column.
+    cols = list(strategy.keys())
+    keys = [X[g] for g in group_by]
+    present = X[cols].mask(mask[cols])
+    grouped = present.groupby(keys, sort=False)
+
+    by_strategy = OrderedDict()
+    for c, strat in six.iteritems(strategy):
+        by_strategy.setdefault(strat, []).append(c)
+
+    tables = []
+    for strat, strat_cols in six.iteritems(by_strategy):
+        if strat is _mean:
+            tables.append(grouped[strat_cols].mean())
+        elif strat is _median:
+            tables.append(grouped[strat_cols].median())
+        elif strat is _most_frequent:
+            # the modes are counted from the unmasked values, which keeps
+            # their dtype
+            tables.extend(_group_modes(X[c], keys, ~mask[c])
+                          for c in strat_cols)
+        else:
+            tables.append(grouped[strat_cols].agg(_present_or_nan(strat)))
+
+    return pd.concat(tables, axis=1)[cols]
+
+
+# The mergeable accumulator for each built-in strategy, and the name of the
+# method that computes the statistic from it (for partial_fit)
+_PARTIAL_STRATEGIES = {_mean: (RunningMoments, "mean"),
+                       _median: (QuantileSketch, "median"),
+                       _most_frequent: (ValueCounts, "mode"),
+                       _approx_median: (QuantileSketch, "median"),
+                       _approx_most_frequent: (HeavyHitters, "mode")}
+
+# The approximate strategies, whose chunks are sketched in parallel in fit
+_APPROX_STRATEGIES = {_approx_median: (QuantileSketch, "median"),
+                      _approx_most_frequent: (HeavyHitters, "mode")}
+
+
 class SelectiveImputer(BasePDTransformer):
-    """Imputation transformer for completing missing values.
+    __doc__ = """Imputation transformer for completing missing values.
 
     The selective imputer applies column value imputation for the
     columns specified in ``cols`` at a more granular level than scikit-learn.
@@ -97,6 +343,11 @@ class SelectiveImputer(BasePDTransformer):
           the axis.
         - If "most_frequent", then replace missing using the most frequent
           value along the axis.
+        - If "approx_median", then replace missing values using an
+          approximate median from a mergeable quantile sketch (see Notes).
+        - If "approx_most_frequent", then replace missing values using an
+          approximate mode from a mergeable heavy-hitters summary (see
+          Notes).
         - If an iterable, must match the length of the ``cols`` parameter,
           and may contain strings or respective callables. This allows
           various columns to be imputed with differing strategies.
@@ -119,6 +370,35 @@ class SelectiveImputer(BasePDTransformer):
         Since most skoot transformers depend on explicitly-named
         ``DataFrame`` features, the ``as_df`` parameter is True by default.
 
+    %(_copy_doc)s
+
+    n_jobs : int, optional (default=1)
+        The number of jobs to use to impute the columns in ``transform``.
+        The columns are split into one shard per job. If -1, all CPUs are
+        used. If 1, no parallel computing code is used at all.
+
+    backend : str or unicode, optional (default="threading")
+        The joblib backend used when ``n_jobs`` is not 1. "threading" suits
+        the numpy-heavy work here and avoids copying the columns, while
+        "loky" or "multiprocessing" use a process pool.
+
+    group_by : str, iterable or None, optional (default=None)
+        The name(s) of the column(s) whose values group the rows. If
+        provided, each missing value is filled with the statistic of its
+        row's group (i.e., the median per store), falling back to the global
+        statistic for groups not seen in ``fit``, or with no present values.
+        The group statistics are computed in a single groupby in ``fit``,
+        and stored in a table that ``transform`` looks the groups up in. The
+        group columns are never imputed.
+
+    sparse_mask : bool, optional (default=False)
+        Whether to locate the missing values with a
+        :class:`skoot.utils._missing.MissingIndex` (the positions of the
+        missing values in each column, found in a single scan) rather than a
+        boolean frame the same shape as the imputed columns. On wide frames
+        with few missing values, this avoids materializing a large mask, and
+        ``transform`` writes only the missing positions.
+
     Examples
     --------
     A simple imputation example with varying strategies:
@@ -143,21 +423,74 @@ class SelectiveImputer(BasePDTransformer):
     >>> imputer.statistics_ # doctest: +SKIP
     {'a': 1.55, 'b': -999., 'c': 3.1}
 
+    Notes
+    -----
+    When fit incrementally with ``partial_fit``, the means and modes are
+    exact (up to floating point error). Medians are computed from a
+    mergeable quantile sketch, which is exact as long as a column has no
+    more than 10,000 distinct values. Beyond that, the sketch is compacted,
+    and the median is approximate: its rank is typically within a small
+    fraction of a percent of the number of samples from the true median.
+
+    The approximate strategies avoid sorting or hashing a whole column,
+    which dominates the time and memory of the exact median and mode on
+    very large columns. Each column is sketched in chunks of about a million
+    values (in parallel, if ``n_jobs`` is not 1), and the chunks' sketches
+    are merged. "approx_median" uses the same quantile sketch as
+    ``partial_fit``. "approx_most_frequent" keeps 1,000 counters, so the
+    value it returns occurs at most ``n / 1001`` times fewer than the true
+    mode, where ``n`` is the number of present values. Both strategies can
+    be fit incrementally with ``partial_fit``.
+
     Attributes
     ----------
     statistics_ : dict
         A dictionary of statistics. The keys are the column names, and the
         values are the float results of the ``strategy`` callables.
-    """
+
+    group_statistics_ : pd.DataFrame or None
+        If ``group_by`` is provided, the statistics of each group. The frame
+        is indexed by the group keys and has a column for each of the
+        imputed columns. Otherwise, None.
+    """ % {"_copy_doc": dsutils._copy_doc.strip()}
+
     def __init__(self, cols=None, strategy="mean", missing_values="NaN",
-                 as_df=True):
+                 as_df=True, copy=True, n_jobs=1, backend="threading",
+                 group_by=None, sparse_mask=False):
 
         super(SelectiveImputer, self).__init__(
-            cols=cols, as_df=as_df)
+            cols=cols, as_df=as_df, copy=copy)
 
         self.missing_values = missing_values
         self.strategy = strategy
-
+        self.n_jobs = n_jobs
+        self.backend = backend
+        self.group_by = group_by
+        self.sparse_mask = sparse_mask
+
+    def _missing_mask(self, X, cols):
+        # The mask of the missing values in the columns: either a boolean
+        # frame, or an index of their positions that can stand in for it
+        if self.sparse_mask:
+            return MissingIndex(X, cols, self.missing_values)
+        return _get_mask(X[cols], self.missing_values)
+
+    def _group_by_cols(self):
+        # the group_by columns as a list, or None
+        group_by = self.group_by
+        if group_by is None:
+            return None
+        return list(group_by) if is_iterable(group_by) else [group_by]
+
+    def _fit_cache_columns(self):
+        # the group columns key the fit as well
+        group_by = self._group_by_cols()
+        if self.cols is None or group_by is None:
+            return self.cols
+        cols = self.cols if is_iterable(self.cols) else [self.cols]
+        return list(cols) + group_by
+
+    @cached_fit
     def fit(self, X, y=None):
         """Fit the imputer.
 
@@ -171,14 +504,124 @@ class SelectiveImputer(BasePDTransformer):
         y : array-like or None, shape=(n_samples,), optional (default=None)
             Pass-through for ``sklearn.pipeline.Pipeline``.
         """
-        missing_values = self.missing_values
-        X, cols = check_dataframe(X, cols=self.cols)
+        X, cols = check_dataframe(X, cols=self.cols, copy=False)
+
+        # the group columns are not imputed
+        group_by = self._group_by_cols()
+        if group_by is not None:
+            validate_test_set_columns(group_by, X.columns)
+            if self.cols is None:
+                cols = [c for c in cols if c not in group_by]
+            elif any(c in group_by for c in cols):
+                raise ValueError("The group_by columns cannot be imputed "
+                                 "(group_by=%r, cols=%r)" % (group_by, cols))
+
+        cols, strategy = self._validate_strategy(cols)
+
+        # now we can actually fit! The built-in numeric strategies are
+        # computed in bulk, and only the rest call their strategy
+        mask = self._missing_mask(X, cols)
+        bulk = _block_statistics(X, strategy, mask)
+        self.statistics_ = {
+            colname: bulk[colname] if colname in bulk
+            else self._statistic(X[colname], mask[colname], strat)
+            for colname, strat in six.iteritems(strategy)}
+
+        # the global statistics are the fallback for the group statistics
+        self.group_statistics_ = None
+        if group_by is not None:
+            self.group_statistics_ = _group_statistics(
+                X, group_by, strategy, mask)
+
+        # another fit param we'll want is the amended strategy dict
+        # (although we don't really use this...)
+        self.strategy_ = strategy
+
+        # a full fit discards any state accumulated by partial_fit
+        self._partial_stats = None
+        return self
+
+    def _statistic(self, series, missing_mask, strat):
+        # Compute a single column's statistic. The approximate strategies
+        # sketch the column's chunks using the imputer's jobs
+        if strat not in _APPROX_STRATEGIES:
+            return strat(series, missing_mask)
+
+        sketch_class, method = _APPROX_STRATEGIES[strat]
+        sketch = _sketch_present_values(
+            series, missing_mask, sketch_class,
+            n_jobs=self.n_jobs, backend=self.backend)
+        return getattr(sketch, method)()
+
+    def partial_fit(self, X, y=None):
+        """Incrementally fit the imputer on a chunk of samples.
+
+        This method accumulates mergeable statistics over successive chunks
+        of a frame too large to fit in memory (i.e., one read via
+        ``pd.read_csv(..., chunksize=n)``), and updates ``statistics_``
+        after each chunk, so the imputer may be used to ``transform`` at any
+        point. A single pass over the chunks yields the same ``statistics_``
+        as ``fit`` on the full frame (see Notes). Calling ``fit`` discards
+        any state accumulated by ``partial_fit``.
+
+        Only the built-in strategies are supported, since custom callables
+        cannot be computed incrementally.
+
+        Parameters
+        ----------
+        X : pd.DataFrame, shape=(n_samples, n_features)
+            The chunk of the Pandas frame to fit. Every chunk must contain
+            the columns the first chunk was fit on.
+
+        y : array-like or None, shape=(n_samples,), optional (default=None)
+            Pass-through for ``sklearn.pipeline.Pipeline``.
+        """
+        if self.group_by is not None:
+            raise ValueError("partial_fit does not support group_by")
+
+        X, cols = check_dataframe(X, cols=self.cols, copy=False)
+
+        stats = getattr(self, "_partial_stats", None)
+        if stats is None:
+            cols, strategy = self._validate_strategy(cols)
+            stats = OrderedDict()
+            for col in cols:
+                try:
+                    accumulator, _ = _PARTIAL_STRATEGIES[strategy[col]]
+                except KeyError:
+                    raise ValueError("partial_fit only supports the "
+                                     "built-in strategies, not callables")
+                stats[col] = accumulator()
+
+            self.strategy_ = strategy
+            self._partial_stats = stats
+
+        cols = list(stats.keys())
+        validate_test_set_columns(cols, X.columns)
 
-        # validate the strategy
+        # update the accumulators with the present values in the chunk
+        mask = self._missing_mask(X, cols)
+        for col, accumulator in six.iteritems(stats):
+            accumulator.update(X[col].values[~mask[col].values])
+
+        # columns that have only had missing values so far get a NaN
+        self.statistics_ = {
+            col: getattr(accumulator, _PARTIAL_STRATEGIES[
+                self.strategy_[col]][1])()
+            for col, accumulator in six.iteritems(stats)}
+
+        return self
+
+    def _validate_strategy(self, cols):
+        # Map each column to the callable that computes its statistic. If
+        # the strategy is a dict and no cols were provided, its keys are the
+        # columns, so cols is returned as well.
         strategy = self.strategy
         valid_strategies = {"mean": _mean,
                             "median": _median,
-                            "most_frequent": _most_frequent}
+                            "most_frequent": _most_frequent,
+                            "approx_median": _approx_median,
+                            "approx_most_frequent": _approx_most_frequent}
 
         if isinstance(strategy, six.string_types):
             # if it's a string, map it into a dictionary for each col
@@ -235,17 +678,7 @@ class SelectiveImputer(BasePDTransformer):
                             "iterable. %r (type=%s) is not a valid strategy."
                             % (strategy, type(strategy)))
 
-        # now we can actually fit!
-        mask = _get_mask(X[cols], missing_values)
-        self.statistics_ = {
-            colname: strat(X[colname], mask[colname])
-            for colname, strat in six.iteritems(strategy)}
-
-        # another fit param we'll want is the amended strategy dict
-        # (although we don't really use this...)
-        self.strategy_ = strategy
-
-        return self
+        return cols, strategy
 
     def transform(self, X):
         """Apply the imputation to a dataframe.
@@ -273,24 +706,204 @@ class SelectiveImputer(BasePDTransformer):
         # in X.
         stats = self.statistics_
         cols = list(stats.keys())
-        X, _ = check_dataframe(X, cols=cols)
 
-        # now apply the stats to the X
-        mask = _get_mask(X[cols], self.missing_values)
-        for colname in cols:
-            X.loc[mask[colname], colname] = stats[colname]
+        # if we can, skip pandas altogether
+        group_by = self._group_by_cols()
+        positions = None if group_by is not None \
+            else self._array_positions(X, cols)
+        if positions is not None and X.dtype.kind == "f" and \
+                all(isinstance(stats[c], numbers.Number) for c in cols):
+            return self._transform_array(
+                X, positions, [stats[c] for c in cols])
+
+        X, _ = check_dataframe(X, cols=cols, copy=self.copy)
+        missing_values = self.missing_values
+
+        if group_by is not None:
+            return self._transform_groups(X, cols, group_by)
+
+        # write only the missing positions
+        if self.sparse_mask:
+            MissingIndex(X, cols, missing_values).fill(X, stats)
+            return dataframe_or_array(X, self.as_df)
+
+        # now apply the stats to the X. Most columns can be filled in bulk,
+        # which avoids thousands of per-column assignments on wide frames
+        cols = _impute_blocks(X, cols, stats, missing_values)
+        filled = _column_parallel(
+            _impute_column, [(X[c], stats[c]) for c in cols],
+            n_jobs=self.n_jobs, backend=self.backend,
+            missing_values=missing_values)
+
+        for colname, series in zip(cols, filled):
+            X[colname] = series
+
+        return dataframe_or_array(X, self.as_df)
+
+    def _transform_groups(self, X, cols, group_by):
+        # Fill each missing value with its group's statistic, taking the
+        # statistics for every row from the table at once
+        validate_test_set_columns(group_by, X.columns)
+        table = self.group_statistics_
+        stats = self.statistics_
+
+        positions = table.index.get_indexer(_group_keys(X, group_by))
+        unseen = positions < 0
+        mask = self._missing_mask(X, cols)
+
+        for c in cols:
+            if not mask[c].values.any():
+                continue
+
+            fills = table[c].values.take(positions)
+            fallback = unseen | pd.isnull(fills)
+            if fallback.any():
+                fills = np.where(fallback, stats[c], fills)
+            X[c] = X[c].mask(mask[c], fills)
 
         return dataframe_or_array(X, self.as_df)
 
+    def _transform_array(self, X, positions, values):
+        # ndarray-native equivalent of ``transform`` for float arrays
+        if self.copy:
+            X = X.copy()
+
+        missing_values = self.missing_values
+        for pos, value in zip(positions, values):
+            col = X[:, pos]
+            col[_get_mask(col, missing_values)] = value
+
+        return X
+
+    def _row_transformer(self):
+        check_is_fitted(self, 'statistics_')
+        stats = list(six.iteritems(self.statistics_))
+        missing_values = self.missing_values
+
+        group_by = self._group_by_cols()
+        if group_by is not None:
+            return self._group_row_transformer(stats, group_by)
+
+        def _transform_row(row):
+            for colname, stat in stats:
+                if _is_missing_value(row[colname], missing_values):
+                    row[colname] = stat
+            return row
+
+        return _transform_row
+
+    def _group_row_transformer(self, stats, group_by):
+        # the single-row equivalent of _transform_groups, which looks the
+        # row's group up in a dict of each group's statistics
+        table = self.group_statistics_
+        missing_values = self.missing_values
+        cols = [c for c, _ in stats]
+        lookup = {key: dict(zip(cols, values))
+                  for key, values in zip(table.index,
+                                         table[cols].values.tolist())}
+        single = len(group_by) == 1
+
+        def _transform_row(row):
+            key = row[group_by[0]] if single \
+                else tuple(row[g] for g in group_by)
+            group_stats = lookup.get(key, {})
+
+            for colname, stat in stats:
+                if _is_missing_value(row[colname], missing_values):
+                    value = group_stats.get(colname)
+                    row[colname] = stat if value is None or \
+                        _is_missing_value(value, "NaN") else value
+            return row
+
+        return _transform_row
+
+    def _fused_transformer(self, columns):
+        check_is_fitted(self, 'statistics_')
+        if self.group_by is not None:
+            raise NotImplementedError("Group-wise imputation does not "
+                                      "support fused execution")
+        stats = self.statistics_
+        cols = list(stats.keys())
+        _check_fused_columns(cols, columns)
+
+        def _transform_columns(block, needed):
+            cols = [c for c in block if c in needed]
+            filled = _column_parallel(
+                _impute_column, [(pd.Series(block[c]), stats[c])
+                                 for c in cols],
+                n_jobs=self.n_jobs, backend=self.backend,
+                missing_values=self.missing_values)
+            return OrderedDict((c, _column_values(series))
+                               for c, series in zip(cols, filled))
+
+        return _FusedStep(reads=cols, writes=cols, drops=[],
+                          func=_transform_columns)
+
+
+def _fit_bagged_model(k, target, test_mask, X, predictors, model):
+    # fit a clone of the model to impute a single target column. The
+    # predictors in X have no missing values (they are filled with the
+    # tmp_fill or imputed), and the test_mask marks the missing rows of
+    # the target, which are left out of the train set
+    k_predictors = [p for p in predictors if p != k]
+    train = X.loc[~test_mask, k_predictors]
+    train_y = target[~test_mask]
+
+    # what if there are no trainable rows??
+    if not train.shape[0]:
+        raise ValueError("No trainable rows for target=%s, "
+                         "predictors=%r. Missing values exist in "
+                         "all predictor rows"
+                         % (k, k_predictors))
+
+    return clone(model).fit(train, train_y)
+
+
+def _predict_bagged_model(k, model, test_mask, X, predictors, tmp_fill):
+    # predict the missing values of a single target column. Returns the
+    # mask of the missing rows and their predictions (or None if there
+    # are no missing rows). If test_mask is None, the rows to predict are
+    # those currently missing in X
+    if test_mask is None:
+        test_mask = pd.isnull(X[k])
+
+    # if there's nothing missing in the test set for this feature, skip
+    if not test_mask.any():
+        return test_mask, None
+
+    # separate out the predictor columns from the target column
+    k_predictors = [p for p in predictors if p != k]
+    test = X.loc[test_mask, k_predictors]
+
+    # make sure to fill in values in the scoring set where there may
+    # be missing values with the tmp_fill
+    test = test.where(~pd.isnull(test), tmp_fill)
+
+    # generate predictions
+    return test_mask, model.predict(test)
+
+
+def _imputation_change(old, new):
+    # The change between two rounds of imputed values: the total absolute
+    # change relative to the total absolute value for numeric values, or
+    # the fraction of values that changed otherwise (i.e., string labels)
+    old = np.asarray(old)
+    new = np.asarray(new)
+    if old.dtype.kind in "fiu" and new.dtype.kind in "fiu":
+        scale = max(np.abs(old).sum(), np.finfo(np.float64).eps)
+        return np.abs(new - old).sum() / scale
+    return np.mean(old != new)
+
 
 class _BaseBaggedImputer(BasePDTransformer):
     def __init__(self, imputer_class, cols, predictors, base_estimator,
                  n_estimators, max_samples, max_features, bootstrap,
                  bootstrap_features, n_jobs, random_state, verbose,
-                 tmp_fill, as_df):
+                 tmp_fill, as_df, copy, n_jobs_columns, max_iter, tol,
+                 compact):
 
         super(_BaseBaggedImputer, self).__init__(
-            cols=cols, as_df=as_df)
+            cols=cols, as_df=as_df, copy=copy)
 
         self.predictors = predictors
         self.imputer_class = imputer_class
@@ -304,7 +917,16 @@ class _BaseBaggedImputer(BasePDTransformer):
         self.random_state = random_state
         self.verbose = verbose
         self.tmp_fill = tmp_fill
+        self.n_jobs_columns = n_jobs_columns
+        self.max_iter = max_iter
+        self.tol = tol
+        self.compact = compact
+
+    def _fit_cache_columns(self):
+        # the models are also fit on the predictors, which may be any column
+        return None
 
+    @cached_fit
     def fit(self, X, y=None, **fit_params):
         """Fit the bagging imputer.
 
@@ -318,8 +940,9 @@ class _BaseBaggedImputer(BasePDTransformer):
         y : array-like or None, shape=(n_samples,), optional (default=None)
             Pass-through for ``sklearn.pipeline.Pipeline``.
         """
-        # validate that the input is a dataframe, get the columns
-        X, cols = check_dataframe(X, cols=self.cols)
+        # validate that the input is a dataframe, get the columns. We only
+        # read from X here, so it does not need to be copied
+        X, cols = check_dataframe(X, cols=self.cols, copy=False)
 
         # create predictors
         predictors = self.predictors
@@ -344,55 +967,129 @@ class _BaseBaggedImputer(BasePDTransformer):
         if not isinstance(tmpfill, (int, float)):
             raise TypeError("tmp_fill must be a float or an int")
 
-        # this dictionary will hold the models
-        models = {}
-
-        # this dictionary maps the impute column name(s) to the vecs
-        targets = {c: X[c] for c in cols}
-
-        # iterate the column names and the target columns
-        for k, target in six.iteritems(targets):
-            # separate out the predictor columns from the target column
-            k_predictors = [p for p in predictors if p != k]
-            subset = X[k_predictors]
-
-            # split X row-wise into train/test where test is the missing
-            # rows in the target
-            test_mask = pd.isnull(target)
-
-            # make sure to fill in values in the train set where there may
-            # be missing values with the tmp_fill
-            subset = subset.where(~pd.isnull(subset), tmpfill)
-
-            train = subset.loc[~test_mask]  # only includes k_predictors
-            train_y = target[~test_mask]
-
-            # what if there are no trainable rows??
-            if not train.shape[0]:
-                raise ValueError("No trainable rows for target=%s, "
-                                 "predictors=%r. Missing values exist in "
-                                 "all predictor rows"
-                                 % (k, k_predictors))
-
-            # fit the regressor
-            models[k] = self.imputer_class(
-                    base_estimator=self.base_estimator,
-                    n_estimators=self.n_estimators,
-                    max_samples=self.max_samples,
-                    max_features=self.max_features,
-                    bootstrap=self.bootstrap,
-                    bootstrap_features=self.bootstrap_features,
-                    n_jobs=self.n_jobs,
-                    random_state=self.random_state,
-                    verbose=self.verbose, oob_score=False,
-                    warm_start=False, **fit_params)\
-                .fit(train, train_y)
+        max_iter = self.max_iter
+        if not isinstance(max_iter, numbers.Integral) or max_iter < 1:
+            raise ValueError("max_iter must be an int >= 1, but got %r"
+                             % max_iter)
+        start = time.time()
+
+        # fit the target models concurrently, splitting the cores between
+        # the columns and the jobs of each model
+        n_jobs_columns, n_jobs = _nested_n_jobs(
+            self.n_jobs, self.n_jobs_columns, len(cols))
+        model = self.imputer_class(
+            base_estimator=self.base_estimator,
+            n_estimators=self.n_estimators,
+            max_samples=self.max_samples,
+            max_features=self.max_features,
+            bootstrap=self.bootstrap,
+            bootstrap_features=self.bootstrap_features,
+            n_jobs=n_jobs,
+            random_state=self.random_state,
+            verbose=self.verbose, oob_score=False,
+            warm_start=False, **fit_params)
+
+        # index the missing values in a single scan, and fill the missing
+        # predictors with the tmp_fill once rather than for every target
+        needed = list(OrderedDict.fromkeys(list(predictors) + list(cols)))
+        missing = MissingIndex(X, needed)
+        masks = {k: missing.column_mask(k) for k in cols}
+        filled = missing.fill(X[predictors].copy(), tmpfill)
+
+        fitted = _column_parallel(
+            _fit_bagged_model, [(k, X[k], masks[k]) for k in cols],
+            n_jobs=n_jobs_columns, backend="threading",
+            X=filled, predictors=predictors, model=model)
+        del filled
+
+        # this dictionary maps the impute column name(s) to the models
+        models = dict(zip(cols, fitted))
+        iter_times, iter_changes = [], []
+
+        # in iterative mode, cycle over the targets, refitting each model on
+        # the previous round's imputations until they stop changing. The
+        # predictors that aren't imputed keep the tmp_fill
+        if max_iter > 1:
+            work = missing.fill(X[needed].copy(), tmpfill,
+                                cols=[p for p in predictors if p not in cols])
+            self._impute_pass(work, models, predictors)
+            iter_times.append(time.time() - start)
+
+            for _ in range(1, max_iter):
+                start = time.time()
+                fitted = _column_parallel(
+                    _fit_bagged_model, [(k, X[k], masks[k]) for k in cols],
+                    n_jobs=n_jobs_columns, backend="threading",
+                    X=work, predictors=predictors, model=model)
+                models = dict(zip(cols, fitted))
+
+                change = self._refine_pass(work, models, predictors, masks,
+                                           n_jobs_columns)
+                iter_times.append(time.time() - start)
+                iter_changes.append(change)
+                if change < self.tol:
+                    break
+        else:
+            iter_times.append(time.time() - start)
 
         # assign fit params
+        if self.compact:
+            models = self._compact_models(models)
         self.models_ = models
         self.predictors_ = predictors  # will need these to score on later!
+        self.n_iter_ = len(iter_times)
+        self.iter_times_ = iter_times
+        self.iter_changes_ = iter_changes
         return self
 
+    def _compact_models(self, models):
+        # Replace each bagging model with a predict-only copy whose trees
+        # are flattened into array node tables, recording the pickled size
+        # of the models before and after
+        before = sum(pickled_nbytes(m) for m in six.itervalues(models))
+        try:
+            models = {k: compact_bagging(m) for k, m in six.iteritems(models)}
+        except TypeError as e:
+            warnings.warn("The models could not be compacted and will be "
+                          "kept as-is: %s" % e)
+
+        after = sum(pickled_nbytes(m) for m in six.itervalues(models))
+        self.model_nbytes_ = (before, after)
+        return models
+
+    def _impute_pass(self, X, models, predictors):
+        # Impute the missing values of each target column in X in place,
+        # filling the missing predictors with tmp_fill. The columns are
+        # imputed one after another (even when their models were fit
+        # concurrently), so the imputed values are used as predictors for
+        # the later ones, and the result never depends on n_jobs_columns
+        tmpfill = self.tmp_fill
+        for k, model in six.iteritems(models):
+            test_mask, preds = _predict_bagged_model(
+                k, model, None, X, predictors, tmpfill)
+            if preds is not None:
+                X.loc[test_mask, k] = preds
+
+    def _refine_pass(self, X, models, predictors, masks, n_jobs_columns):
+        # Re-predict the originally missing rows of every target from the
+        # current imputations in X, update them in place, and return the
+        # largest change to the imputed values of any column. Every target
+        # is predicted from the same frame, so they can be predicted
+        # concurrently without changing the result
+        keys = list(models.keys())
+        predictions = _column_parallel(
+            _predict_bagged_model, [(k, models[k], masks[k]) for k in keys],
+            n_jobs=n_jobs_columns, backend="threading",
+            X=X, predictors=predictors, tmp_fill=self.tmp_fill)
+
+        change = 0.
+        for k, (test_mask, preds) in zip(keys, predictions):
+            if preds is not None:
+                old = X.loc[test_mask, k].values
+                X.loc[test_mask, k] = preds
+                change = max(change, _imputation_change(old, preds))
+        return change
+
     def transform(self, X):
         """Apply the imputation to a dataframe.
 
@@ -413,43 +1110,64 @@ class _BaseBaggedImputer(BasePDTransformer):
             and the result set is returned.
         """
         check_is_fitted(self, 'models_')
-        X, _ = check_dataframe(X, cols=self.cols)
+        X, _ = check_dataframe(X, cols=self.cols, copy=self.copy)
         predictors = self.predictors_
 
         # fill in the missing
         models = self.models_
+        n_jobs_columns, _ = _nested_n_jobs(
+            self.n_jobs, self.n_jobs_columns, len(models))
+
+        # in iterative mode, refine the imputations for exactly the rounds
+        # it took to converge in fit. The tolerance is not checked again,
+        # so each row is imputed the same way regardless of its batch
+        n_iter = getattr(self, "n_iter_", 1)
+        if n_iter > 1:
+            masks = {k: pd.isnull(X[k]) for k in models}
+
+        self._impute_pass(X, models, predictors)
+        for _ in range(1, n_iter):
+            self._refine_pass(X, models, predictors, masks, n_jobs_columns)
+
+        return dataframe_or_array(X, self.as_df)
+
+    def _row_transformer(self):
+        check_is_fitted(self, 'models_')
+        predictors = self.predictors_
         tmpfill = self.tmp_fill
-        for k, model in six.iteritems(models):
-            target = X[k]
 
-            # separate out the predictor columns from the target column
-            k_predictors = [p for p in predictors if p != k]
-            subset = X[k_predictors]
+        # precompute the predictor columns for each model
+        models = [(k, model, [p for p in predictors if p != k])
+                  for k, model in six.iteritems(self.models_)]
 
-            # split X row-wise into train/test where test is the missing
-            # rows in the target
-            test_mask = pd.isnull(target)
+        n_iter = getattr(self, "n_iter_", 1)
 
-            # if there's nothing missing in the test set for this feature, skip
-            if test_mask.sum() == 0:
-                continue
-            test = subset.loc[test_mask]
+        def _transform_row(row):
+            missing = [(k, model, k_predictors)
+                       for k, model, k_predictors in models
+                       if _is_missing_value(row[k], 'NaN')]
 
-            # make sure to fill in values in the scoring set where there may
-            # be missing values with the tmp_fill
-            test = test.where(~pd.isnull(test), tmpfill)
+            def _predict(model, k_predictors):
+                test = [[tmpfill if _is_missing_value(row[p], 'NaN')
+                         else row[p] for p in k_predictors]]
+                return model.predict(test)[0]
 
-            # generate predictions
-            preds = model.predict(test)
+            for k, model, k_predictors in missing:
+                row[k] = _predict(model, k_predictors)
 
-            # impute!
-            X.loc[test_mask, k] = preds
+            # in iterative mode, re-predict from the current imputations
+            for _ in range(1, n_iter):
+                preds = [_predict(model, k_predictors)
+                         for _, model, k_predictors in missing]
+                for (k, _, _), pred in zip(missing, preds):
+                    row[k] = pred
+            return row
 
-        return dataframe_or_array(X, self.as_df)
+        return _transform_row
 
 
 class BaggedRegressorImputer(_BaseBaggedImputer):
-    """Impute a dataset using BaggingRegressor models.
+    __doc__ = """Impute a dataset using BaggingRegressor models.
 
     Fit bagged regressor models for each of the impute columns in order
     to impute the missing values.
@@ -513,11 +1231,81 @@ class BaggedRegressorImputer(_BaseBaggedImputer):
         method. If False, will return a Numpy ``ndarray`` instead.
         Since most skoot transformers depend on explicitly-named
         ``DataFrame`` features, the ``as_df`` parameter is True by default.
-    """
+
+    %(_copy_doc)s
+
+    n_jobs_columns : int, optional (default=1)
+        The number of target columns whose models are fit concurrently, in
+        threads (as are the refinement rounds of the iterative mode). When
+        not 1, the cores given by ``n_jobs`` are divided between the column
+        jobs, so each model uses ``n_jobs // n_jobs_columns`` jobs (at least
+        1) rather than oversubscribing the CPUs. If -1, all CPUs are used.
+        The imputed values do not depend on ``n_jobs_columns``.
+
+    max_iter : int, optional (default=1)
+        The number of rounds of imputation. If 1, each model is fit once
+        with ``tmp_fill`` in place of the missing predictors. If greater
+        than 1, the imputer works iteratively (in the manner of chained
+        equations): after the first round imputes the missing values, each
+        round refits every model on the previous round's imputations, and
+        re-imputes the missing values, until ``max_iter`` rounds or
+        convergence. ``transform`` repeats exactly the number of rounds
+        taken in ``fit`` (``n_iter_``) with the final models.
+
+    tol : float, optional (default=1e-3)
+        The convergence tolerance of the iterative mode. Iteration stops
+        early when the change to the imputed values of every column is
+        less than ``tol``. The change is the total absolute change relative
+        to the total absolute value of a column's imputations (or the
+        fraction of changed imputations for non-numeric targets).
+
+    compact : bool, optional (default=False)
+        Whether to compact the models after they are fit. Each bagging model
+        of decision trees (the default ``base_estimator``) is replaced in
+        ``models_`` by a predict-only copy that holds all of its trees in
+        flat array node tables, and none of the attributes only needed to
+        fit them. The compacted models make the same predictions (walking
+        every tree at once), but pickle (and load) in a fraction of the
+        size. Models of other base estimators are kept as-is, with a
+        warning.
+
+    Notes
+    -----
+    The first round of imputation (in ``fit`` and ``transform``) imputes
+    the columns one after another, so the values imputed in one column are
+    used as predictors for the columns after it, whatever the value of
+    ``n_jobs_columns``. Only the model fits are run concurrently. The
+    refinement rounds of the iterative mode predict every column from the
+    previous round, so the columns are predicted concurrently there.
+
+    Attributes
+    ----------
+    models_ : dict
+        The fitted bagging model for each of the impute columns (from the
+        final round, in iterative mode), or its compact copy if ``compact``
+        is True.
+
+    n_iter_ : int
+        The number of rounds of imputation run in ``fit``.
+
+    iter_times_ : list
+        The time (in seconds) each round of ``fit`` took.
+
+    iter_changes_ : list
+        The largest change to any column's imputed values in each round
+        after the first (see ``tol``).
+
+    model_nbytes_ : tuple
+        The pickled size of the models, in bytes, before and after they were
+        compacted. Only present if ``compact`` is True.
+    """ % {"_copy_doc": dsutils._copy_doc.strip()}
+
     def __init__(self, cols=None, predictors=None, base_estimator=None,
                  n_estimators=10, max_samples=1.0, max_features=1.0,
                  bootstrap=True, bootstrap_features=False, n_jobs=1,
-                 random_state=None, verbose=0, tmp_fill=-999., as_df=True):
+                 random_state=None, verbose=0, tmp_fill=-999., as_df=True,
+                 copy=True, n_jobs_columns=1, max_iter=1, tol=1e-3,
+                 compact=False):
 
         super(BaggedRegressorImputer, self).__init__(
             imputer_class=BaggingRegressor, cols=cols, predictors=predictors,
@@ -525,11 +1313,13 @@ class BaggedRegressorImputer(_BaseBaggedImputer):
             max_samples=max_samples, max_features=max_features,
             bootstrap=bootstrap, bootstrap_features=bootstrap_features,
             n_jobs=n_jobs, random_state=random_state, verbose=verbose,
-            tmp_fill=tmp_fill, as_df=as_df)
+            tmp_fill=tmp_fill, as_df=as_df, copy=copy,
+            n_jobs_columns=n_jobs_columns, max_iter=max_iter, tol=tol,
+            compact=compact)
 
 
 class BaggedClassifierImputer(_BaseBaggedImputer):
-    """Impute a dataset using BaggingClassifier models.
+    __doc__ = """Impute a dataset using BaggingClassifier models.
 
     Fit bagged classifier models for each of the impute columns in order
     to impute the missing values.
@@ -593,11 +1383,81 @@ class BaggedClassifierImputer(_BaseBaggedImputer):
         method. If False, will return a Numpy ``ndarray`` instead.
         Since most skoot transformers depend on explicitly-named
         ``DataFrame`` features, the ``as_df`` parameter is True by default.
-    """
+
+    %(_copy_doc)s
+
+    n_jobs_columns : int, optional (default=1)
+        The number of target columns whose models are fit concurrently, in
+        threads (as are the refinement rounds of the iterative mode). When
+        not 1, the cores given by ``n_jobs`` are divided between the column
+        jobs, so each model uses ``n_jobs // n_jobs_columns`` jobs (at least
+        1) rather than oversubscribing the CPUs. If -1, all CPUs are used.
+        The imputed values do not depend on ``n_jobs_columns``.
+
+    max_iter : int, optional (default=1)
+        The number of rounds of imputation. If 1, each model is fit once
+        with ``tmp_fill`` in place of the missing predictors. If greater
+        than 1, the imputer works iteratively (in the manner of chained
+        equations): after the first round imputes the missing values, each
+        round refits every model on the previous round's imputations, and
+        re-imputes the missing values, until ``max_iter`` rounds or
+        convergence. ``transform`` repeats exactly the number of rounds
+        taken in ``fit`` (``n_iter_``) with the final models.
+
+    tol : float, optional (default=1e-3)
+        The convergence tolerance of the iterative mode. Iteration stops
+        early when the change to the imputed values of every column is
+        less than ``tol``. The change is the total absolute change relative
+        to the total absolute value of a column's imputations (or the
+        fraction of changed imputations for non-numeric targets).
+
+    compact : bool, optional (default=False)
+        Whether to compact the models after they are fit. Each bagging model
+        of decision trees (the default ``base_estimator``) is replaced in
+        ``models_`` by a predict-only copy that holds all of its trees in
+        flat array node tables, and none of the attributes only needed to
+        fit them. The compacted models make the same predictions (walking
+        every tree at once), but pickle (and load) in a fraction of the
+        size. Models of other base estimators are kept as-is, with a
+        warning.
+
+    Notes
+    -----
+    The first round of imputation (in ``fit`` and ``transform``) imputes
+    the columns one after another, so the values imputed in one column are
+    used as predictors for the columns after it, whatever the value of
+    ``n_jobs_columns``. Only the model fits are run concurrently. The
+    refinement rounds of the iterative mode predict every column from the
+    previous round, so the columns are predicted concurrently there.
+
+    Attributes
+    ----------
+    models_ : dict
+        The fitted bagging model for each of the impute columns (from the
+        final round, in iterative mode), or its compact copy if ``compact``
+        is True.
+
+    n_iter_ : int
+        The number of rounds of imputation run in ``fit``.
+
+    iter_times_ : list
+        The time (in seconds) each round of ``fit`` took.
+
+    iter_changes_ : list
+        The largest change to any column's imputed values in each round
+        after the first (see ``tol``).
+
+    model_nbytes_ : tuple
+        The pickled size of the models, in bytes, before and after they were
+        compacted. Only present if ``compact`` is True.
+    """ % {"_copy_doc": dsutils._copy_doc.strip()}
+
     def __init__(self, cols=None, predictors=None, base_estimator=None,
                  n_estimators=10, max_samples=1.0, max_features=1.0,
                  bootstrap=True, bootstrap_features=False, n_jobs=1,
-                 random_state=None, verbose=0, tmp_fill=-999., as_df=True):
+                 random_state=None, verbose=0, tmp_fill=-999., as_df=True,
+                 copy=True, n_jobs_columns=1, max_iter=1, tol=1e-3,
+                 compact=False):
 
         super(BaggedClassifierImputer, self).__init__(
             imputer_class=BaggingClassifier, cols=cols, predictors=predictors,
@@ -605,4 +1465,537 @@ class BaggedClassifierImputer(_BaseBaggedImputer):
             max_samples=max_samples, max_features=max_features,
             bootstrap=bootstrap, bootstrap_features=bootstrap_features,
             n_jobs=n_jobs, random_state=random_state, verbose=verbose,
-            tmp_fill=tmp_fill, as_df=as_df)
+            tmp_fill=tmp_fill, as_df=as_df, copy=copy,
+            n_jobs_columns=n_jobs_columns, max_iter=max_iter, tol=tol,
+            compact=compact)
+
+
+class KNNImputer(BasePDTransformer):
+    __doc__ = """Impute a dataset using the k-nearest complete neighbors.
+
+    The missing values in each row are filled with the mean value of its
+    ``n_neighbors`` nearest neighbors among the complete rows (those with no
+    missing values) seen in ``fit``. Distances ignore the missing
+    coordinates of the query row, so a row is compared with its neighbors
+    only on the predictors it has.
+
+    The spatial index over the predictors of the complete rows is built once
+    in ``fit``, and serves the rows with all of their predictors present.
+    By default, the predictors are the columns that are not imputed, so
+    every row missing only imputed values uses the index. The other rows to
+    impute are grouped by which of their predictors are missing, and the
+    distances from each group to the complete rows, over only the present
+    predictors, are computed by brute force in bounded blocks (see
+    :class:`skoot.balance.BlockedNearestNeighbors`). No index is kept per
+    pattern of missing predictors, so memory stays bounded however many
+    patterns are seen. Each group is queried in batches of ``batch_size``
+    rows.
+
+    When every column is imputed (e.g., ``cols`` is None), the predictors
+    are the imputed columns themselves, so every row to impute is missing
+    one of them and is searched by brute force.
+
+    Parameters
+    ----------
+    cols : array_like, shape=(n_features,), optional (default=None)
+        The names of the columns on which to apply the transformation.
+        If no column names are provided, the transformer will be ``fit``
+        on the entire frame. Note that the transformation will also only
+        apply to the specified columns, and any other non-specified
+        columns will still be present after transformation.
+
+    predictors : array_like, shape=(n_features,), optional (default=None)
+        The names of the (numeric) columns on which to measure the
+        distances between rows. If not specified, the columns that are not
+        in ``cols`` are used, or all of the columns if ``cols`` is None.
+
+    n_neighbors : int, optional (default=5)
+        The number of neighbors whose values are averaged to impute a
+        missing value.
+
+    weights : str or unicode, optional (default='uniform')
+        How the neighbors' values are averaged. If 'uniform', each neighbor
+        counts equally. If 'distance', each neighbor is weighted by the
+        inverse of its distance.
+
+    algorithm : str or unicode, optional (default='kd_tree')
+        Algorithm used to compute the nearest neighbors of the rows with
+        all of their predictors present. One of {'auto', 'ball_tree',
+        'kd_tree', 'brute'}. This parameter is passed to the
+        ``NearestNeighbors`` model in ``index_``.
+
+    leaf_size : int, optional (default=30)
+        Leaf size passed to ``BallTree`` or ``KDTree``.
+
+    p : int, optional (default=2)
+        Power parameter for the Minkowski metric.
+
+    metric : str or callable, optional (default='minkowski')
+        The distance metric to use for the neighbors queries.
+
+    metric_params : dict, optional (default=None)
+        Additional keyword arguments for the metric function.
+
+    batch_size : int, optional (default=10000)
+        The number of rows to query at once in ``transform``.
+
+    n_jobs : int, optional (default=1)
+        The number of jobs to run in parallel for the neighbors queries.
+        If -1, then the number of jobs is set to the number of cores.
+
+    as_df : bool, optional (default=True)
+        Whether to return a Pandas ``DataFrame`` in the ``transform``
+        method. If False, will return a Numpy ``ndarray`` instead.
+        Since most skoot transformers depend on explicitly-named
+        ``DataFrame`` features, the ``as_df`` parameter is True by default.
+
+    %(_copy_doc)s
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import pandas as pd
+    >>> from skoot.impute import KNNImputer
+    >>>
+    >>> nan = np.nan
+    >>> X = pd.DataFrame.from_records(
+    ...     data=np.array([[1.0,  1.0,  1.0],
+    ...                    [1.1,  nan,  1.2],
+    ...                    [5.0,  5.0,  5.0],
+    ...                    [5.1,  5.2,  nan]]),
+    ...     columns=['a','b','c'])
+    >>> KNNImputer(n_neighbors=1).fit_transform(X)
+         a    b    c
+    0  1.0  1.0  1.0
+    1  1.1  1.0  1.2
+    2  5.0  5.0  5.0
+    3  5.1  5.2  5.0
+
+    Attributes
+    ----------
+    index_ : NearestNeighbors
+        The neighbors model fit on all of the predictors of the complete
+        rows.
+
+    fit_X_ : np.ndarray, shape=(n_complete, n_predictors)
+        The predictors of the complete rows.
+
+    fit_y_ : np.ndarray, shape=(n_complete, n_cols)
+        The impute columns of the complete rows.
+
+    predictors_ : list
+        The predictor columns.
+
+    statistics_ : np.ndarray, shape=(n_cols,)
+        The mean of each impute column over the complete rows, used for
+        rows with none of the predictors present.
+    """ % {"_copy_doc": dsutils._copy_doc.strip()}
+
+    def __init__(self, cols=None, predictors=None, n_neighbors=5,
+                 weights='uniform', algorithm='kd_tree', leaf_size=30, p=2,
+                 metric='minkowski', metric_params=None, batch_size=10000,
+                 n_jobs=1, as_df=True, copy=True):
+
+        super(KNNImputer, self).__init__(
+            cols=cols, as_df=as_df, copy=copy)
+
+        self.predictors = predictors
+        self.n_neighbors = n_neighbors
+        self.weights = weights
+        self.algorithm = algorithm
+        self.leaf_size = leaf_size
+        self.p = p
+        self.metric = metric
+        self.metric_params = metric_params
+        self.batch_size = batch_size
+        self.n_jobs = n_jobs
+
+    def _fit_cache_columns(self):
+        # the distances are measured on the predictors, which may be any
+        # column
+        return None
+
+    def _make_index(self, X):
+        return NearestNeighbors(
+            n_neighbors=self.n_neighbors, algorithm=self.algorithm,
+            leaf_size=self.leaf_size, p=self.p, metric=self.metric,
+            metric_params=self.metric_params, n_jobs=self.n_jobs).fit(X)
+
+    @cached_fit
+    def fit(self, X, y=None):
+        """Fit the KNN imputer.
+
+        Parameters
+        ----------
+        X : pd.DataFrame, shape=(n_samples, n_features)
+            The Pandas frame to fit. The frame will only
+            be fit on the prescribed ``cols`` (see ``__init__``) or
+            all of them if ``cols`` is None.
+
+        y : array-like or None, shape=(n_samples,), optional (default=None)
+            Pass-through for ``sklearn.pipeline.Pipeline``.
+        """
+        # We only read from X here, so it does not need to be copied
+        X, cols = check_dataframe(X, cols=self.cols, copy=False)
+
+        # by default, measure the distances on the columns that aren't
+        # imputed, so the rows missing only imputed values can query the
+        # index. If every column is imputed, all of them are the predictors
+        predictors = self.predictors
+        if predictors is None:
+            predictors = [c for c in X.columns if c not in cols] or \
+                X.columns.tolist()
+        validate_test_set_columns(predictors, X.columns)
+
+        if self.weights not in ("uniform", "distance"):
+            raise ValueError("weights must be one of ('uniform', "
+                             "'distance'), but got %r" % self.weights)
+
+        # the complete rows are those with none of the columns missing
+        fit_X = X[predictors].values.astype(np.float64)
+        fit_y = X[cols].values.astype(np.float64)
+        complete = ~(np.isnan(fit_X).any(axis=1) |
+                     np.isnan(fit_y).any(axis=1))
+        if complete.sum() < self.n_neighbors:
+            raise ValueError("There are fewer complete rows (%i) than "
+                             "n_neighbors (%i)"
+                             % (complete.sum(), self.n_neighbors))
+
+        self.fit_X_ = fit_X[complete]
+        self.fit_y_ = fit_y[complete]
+        self.predictors_ = predictors
+        self.statistics_ = self.fit_y_.mean(axis=0)
+        self.index_ = self._make_index(self.fit_X_)
+        return self
+
+    def _get_search(self, present):
+        # Get the neighbors search over the present predictors: the index
+        # if they're all present, or a blocked brute-force search over the
+        # present columns of the complete rows, which is only held while
+        # its group of rows is imputed
+        if present.all():
+            return self.index_
+        return BlockedNearestNeighbors(
+            n_neighbors=self.n_neighbors, metric=self.metric, p=self.p,
+            metric_params=self.metric_params,
+            n_jobs=self.n_jobs).fit(self.fit_X_[:, present])
+
+    def _impute_group(self, rows, present, search):
+        # Compute the imputations (of every impute column) for a group of
+        # rows that share the same present predictors
+        if not present.any():
+            return np.tile(self.statistics_, (rows.shape[0], 1))
+
+        distances, neighbors = search.kneighbors(rows[:, present])
+        values = self.fit_y_[neighbors]  # (n_rows, n_neighbors, n_cols)
+
+        if self.weights == "uniform":
+            return values.mean(axis=1)
+
+        # an exact match gets all of the weight
+        with np.errstate(divide="ignore"):
+            weights = 1. / distances
+        exact = np.isinf(weights)
+        inexact_rows = ~exact.any(axis=1)
+        weights = np.where(inexact_rows[:, np.newaxis], weights,
+                           exact.astype(np.float64))
+        return (values * weights[:, :, np.newaxis]).sum(axis=1) / \
+            weights.sum(axis=1)[:, np.newaxis]
+
+    def transform(self, X):
+        """Apply the imputation to a dataframe.
+
+        This method will fill in the missing values within a test
+        dataframe with the mean of their nearest complete rows.
+
+        Parameters
+        ----------
+        X : pd.DataFrame, shape=(n_samples, n_features)
+            The Pandas frame to transform. If ``copy`` is True, the
+            missing values are filled in a copy of the input data.
+            Otherwise, they are filled in ``X`` in place.
+
+        Returns
+        -------
+        X : pd.DataFrame or np.ndarray, shape=(n_samples, n_features)
+            The imputed frame.
+        """
+        check_is_fitted(self, 'index_')
+        X, cols = check_dataframe(X, cols=self.cols, copy=self.copy)
+        predictors = self.predictors_
+        validate_test_set_columns(predictors, X.columns)
+
+        targets = X[cols].values.astype(np.float64)
+        missing = np.isnan(targets)
+        to_impute = np.where(missing.any(axis=1))[0]
+        if not to_impute.shape[0]:
+            return dataframe_or_array(X, self.as_df)
+
+        # group the rows by which predictors they have
+        rows = X[predictors].values[to_impute].astype(np.float64)
+        patterns, groups = np.unique(np.isnan(rows), axis=0,
+                                     return_inverse=True)
+
+        batch_size = self.batch_size
+        for g, pattern in enumerate(patterns):
+            present = ~pattern
+            search = self._get_search(present) if present.any() else None
+            members = np.where(groups == g)[0]
+            for i in range(0, members.shape[0], batch_size):
+                batch = members[i:i + batch_size]
+                imputed = self._impute_group(rows[batch], present, search)
+
+                positions = to_impute[batch]
+                targets[positions] = np.where(missing[positions], imputed,
+                                              targets[positions])
+
+        for j, c in enumerate(cols):
+            if missing[:, j].any():
+                X[c] = targets[:, j]
+
+        return dataframe_or_array(X, self.as_df)
+
+
+def _fill_sequence(values, strategy, tail):
+    # Fill the missing values of one time-ordered sequence of values,
+    # continuing from the tail of the previous batches: a tuple of the last
+    # observed value and the number of rows since it was observed (or None).
+    # Returns the filled values (or None if none are missing) and the new
+    # tail.
+    missing = pd.isnull(values)
+    observed = np.flatnonzero(~missing)
+    n_rows = values.shape[0]
+
+    if observed.shape[0]:
+        new_tail = (values[observed[-1]], n_rows - 1 - observed[-1])
+    elif tail is not None:
+        new_tail = (tail[0], tail[1] + n_rows)
+    else:
+        new_tail = None
+
+    if not missing.any():
+        return None, new_tail
+
+    series = pd.Series(values)
+    if strategy == "ffill":
+        filled = series.ffill()
+    elif strategy == "bfill":
+        # the trailing values have nothing to fill backward from yet
+        filled = series.bfill().ffill()
+    else:  # interpolate
+        # the previous value anchors the line before the first observation
+        xp, fp = observed, values[observed].astype(np.float64)
+        if tail is not None:
+            xp = np.concatenate([[-(tail[1] + 1)], xp])
+            fp = np.concatenate([[tail[0]], fp])
+
+        filled = series.astype(np.float64)
+        if xp.shape[0]:
+            positions = np.flatnonzero(missing)
+            interp = np.interp(positions, xp, fp)
+
+            # np.interp extends the first value backward, which pandas
+            # does not
+            interp[positions < xp[0]] = np.nan
+            filled.iloc[positions] = interp
+
+    # anything still missing precedes the batch's first observation
+    if tail is not None:
+        filled = filled.fillna(tail[0])
+    return filled.values, new_tail
+
+
+class TimeSeriesImputer(BasePDTransformer):
+    __doc__ = """Impute time-ordered data from the neighboring observations.
+
+    Unlike the statistics of the :class:`SelectiveImputer`, the values
+    filled here depend on the rows around each missing value, which are
+    assumed to be in time order. To support streaming data arriving in
+    micro-batches, the imputer keeps the tail of every column (its last
+    observed value, and the number of rows since) between calls to
+    ``transform``, optionally for each entity (i.e., each sensor or user).
+    Each batch continues from the tail of the batches before it, so
+    scoring a stream batch by batch reproduces transforming the whole
+    stream at once without reprocessing its history (see Notes).
+
+    Parameters
+    ----------
+    cols : array-like, shape=(n_features,), optional (default=None)
+        The names of the columns on which to apply the transformation.
+        If no column names are provided, the transformer will be ``fit``
+        on the entire frame. Note that the transformation will also only
+        apply to the specified columns, and any other non-specified
+        columns will still be present after transformation.
+
+    strategy : str or unicode, optional (default="ffill")
+        The strategy to use for imputation.
+
+        - If "ffill", fill each missing value with the last observed value
+          (carried over from previous batches).
+        - If "bfill", fill each missing value with the next observed value
+          in the same batch. Missing values after the last observation in a
+          batch are filled forward.
+        - If "interpolate", interpolate linearly (by row) between the
+          previous observed value (which may be carried over from previous
+          batches) and the next observed value. Missing values after the
+          last observation in a batch are filled with it. The columns must
+          be numeric.
+
+    by : str or unicode or None, optional (default=None)
+        The name of a column identifying the entity each row belongs to. If
+        provided, each entity's rows are filled, and their tails kept,
+        separately. The rows whose ``by`` value is missing are treated as
+        one more entity (keyed None in ``tails_``). The ``by`` column is
+        never imputed.
+
+    as_df : bool, optional (default=True)
+        Whether to return a Pandas ``DataFrame`` in the ``transform``
+        method. If False, will return a Numpy ``ndarray`` instead.
+        Since most skoot transformers depend on explicitly-named
+        ``DataFrame`` features, the ``as_df`` parameter is True by default.
+
+    %(_copy_doc)s
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import pandas as pd
+    >>> from skoot.impute import TimeSeriesImputer
+    >>>
+    >>> nan = np.nan
+    >>> imputer = TimeSeriesImputer().fit(pd.DataFrame({'a': [1.]}))
+    >>> imputer.transform(pd.DataFrame({'a': [1., nan]}))
+         a
+    0  1.0
+    1  1.0
+    >>> imputer.transform(pd.DataFrame({'a': [nan, 3.]}))
+         a
+    0  1.0
+    1  3.0
+
+    Notes
+    -----
+    The first value of a stream has no previous value to fill forward from,
+    so missing values before an entity's first observation remain missing
+    under the "ffill" and "interpolate" strategies. Forward fill reproduces
+    the whole-stream result exactly. Backward fill and interpolation cannot
+    look ahead of the current batch. So a run of missing values that
+    crosses the end of a batch is filled forward (with the last observed
+    value) up to the end of the batch, where transforming the whole stream
+    would have filled it from the next observation.
+
+    Attributes
+    ----------
+    cols_ : list
+        The imputed columns.
+
+    tails_ : dict
+        The tail of each column: its last observed value and the number of
+        rows since, or None if no value has been observed. If ``by`` is
+        provided, each column maps to a dict of the tail of each entity.
+        ``fit`` resets the tails, and each ``transform`` updates them.
+    """ % {"_copy_doc": dsutils._copy_doc.strip()}
+
+    def __init__(self, cols=None, strategy="ffill", by=None, as_df=True,
+                 copy=True):
+
+        super(TimeSeriesImputer, self).__init__(
+            cols=cols, as_df=as_df, copy=copy)
+
+        self.strategy = strategy
+        self.by = by
+
+    def fit(self, X, y=None):
+        """Fit the imputer.
+
+        Validates the columns and resets the tails, so the next call to
+        ``transform`` starts a new stream.
+
+        Parameters
+        ----------
+        X : pd.DataFrame, shape=(n_samples, n_features)
+            The Pandas frame to fit. The frame will only
+            be fit on the prescribed ``cols`` (see ``__init__``) or
+            all of them if ``cols`` is None.
+
+        y : array-like or None, shape=(n_samples,), optional (default=None)
+            Pass-through for ``sklearn.pipeline.Pipeline``.
+        """
+        X, cols = check_dataframe(X, cols=self.cols, copy=False)
+
+        if self.strategy not in ("ffill", "bfill", "interpolate"):
+            raise ValueError("strategy must be one of ('ffill', 'bfill', "
+                             "'interpolate'), but got %r" % self.strategy)
+
+        by = self.by
+        if by is not None:
+            validate_test_set_columns([by], X.columns)
+            if self.cols is None:
+                cols = [c for c in cols if c != by]
+            elif by in cols:
+                raise ValueError("The by column cannot be imputed "
+                                 "(by=%r, cols=%r)" % (by, cols))
+
+        self.cols_ = cols
+        self.tails_ = {c: (None if by is None else {}) for c in cols}
+        return self
+
+    def transform(self, X):
+        """Impute the next batch of a stream.
+
+        The batch continues from the tails of the previous batches (since
+        ``fit``), and its own tails are kept for the next batch.
+
+        Parameters
+        ----------
+        X : pd.DataFrame, shape=(n_samples, n_features)
+            The Pandas frame to transform, in time order. If ``copy`` is
+            True, the missing values are filled in a copy of the input
+            data. Otherwise, they are filled in ``X`` in place.
+
+        Returns
+        -------
+        X : pd.DataFrame or np.ndarray, shape=(n_samples, n_features)
+            The imputed frame.
+        """
+        check_is_fitted(self, 'tails_')
+        cols = self.cols_
+        X, _ = check_dataframe(X, cols=cols, copy=self.copy)
+        strategy = self.strategy
+        by = self.by
+
+        # the row positions of each entity's sequence (in order). groupby
+        # drops the rows with a missing key, so they're an entity of their
+        # own, keyed None
+        if by is None:
+            groups = [(None, np.arange(X.shape[0]))]
+        else:
+            validate_test_set_columns([by], X.columns)
+            groups = list(six.iteritems(X.groupby(by, sort=False).indices))
+            missing_key = pd.isnull(X[by]).values
+            if missing_key.any():
+                groups.append((None, np.flatnonzero(missing_key)))
+
+        for c in cols:
+            values = X[c].values
+            tails = self.tails_[c]
+            filled = None
+
+            for key, rows in groups:
+                tail = tails if by is None else tails.get(key)
+                sequence, tail = _fill_sequence(values[rows], strategy, tail)
+
+                if by is None:
+                    self.tails_[c] = tail
+                elif tail is not None:
+                    tails[key] = tail
+
+                if sequence is not None:
+                    if filled is None:
+                        filled = values.astype(sequence.dtype)
+                    filled[rows] = sequence
+
+            if filled is not None:
+                X[c] = filled
+
+        return dataframe_or_array(X, self.as_df)
@@ -9,10 +9,12 @@
 
 from __future__ import absolute_import
 
-from ..base import BasePDTransformer
-from ..utils.validation import check_dataframe, type_or_iterable_to_col_mapping
+from ..base import BasePDTransformer, _column_parallel
+from ..utils.validation import (check_dataframe, validate_test_set_columns,
+                                type_or_iterable_to_col_mapping)
 from ..utils.dataframe import get_continuous_columns, dataframe_or_array
 from ..utils.metaestimators import timed_instance_method
+from ..utils._sketch import RunningMoments, ValueCounts
 from ..exceptions import ValidationWarning
 
 from sklearn.externals import six
@@ -54,11 +56,13 @@ def _compute_stats(v, continuous):
 
 class _BaseValidator(six.with_metaclass(ABCMeta, BasePDTransformer)):
     """Base validator class."""
-    def __init__(self, cols, as_df, action):
+    def __init__(self, cols, as_df, action, n_jobs, backend):
         super(_BaseValidator, self).__init__(
             cols=cols, as_df=as_df)
 
         self.action = action
+        self.n_jobs = n_jobs
+        self.backend = backend
 
     @abstractmethod
     def _is_as_expected(self, index, feature_name, feature):
@@ -92,11 +96,14 @@ class _BaseValidator(six.with_metaclass(ABCMeta, BasePDTransformer)):
         X, _ = check_dataframe(X, cols=self.cols)  # X is a copy now
         cols = self.fit_cols_  # assigned in the "fit" method
 
-        for i, c in enumerate(cols):
-            v = X[c].values  # get the feature
+        # determine whether each feature is valid (in parallel)
+        as_expected = _column_parallel(
+            self._is_as_expected,
+            [(i, c, X[c].values) for i, c in enumerate(cols)],
+            n_jobs=self.n_jobs, backend=self.backend)
 
-            # determine whether it's valid
-            if not self._is_as_expected(i, c, v):
+        for c, valid in zip(cols, as_expected):
+            if not valid:
                 msg = "Feature %s does not match expectation as set by %s" \
                       % (c, self.__class__.__name__)
 
@@ -146,6 +153,16 @@ class CustomValidator(_BaseValidator):
         "warn", "raise" or "ignore". If ``action`` is "raise", will raise a
         ValueError if mismatched.
 
+    n_jobs : int, optional (default=1)
+        The number of jobs to use to validate the features in ``transform``.
+        The columns are split into one shard per job. If -1, all CPUs are
+        used. If 1, no parallel computing code is used at all.
+
+    backend : str or unicode, optional (default="threading")
+        The joblib backend used when ``n_jobs`` is not 1. Note that the
+        process-based backends ("loky" or "multiprocessing") must be able
+        to pickle ``func``.
+
     Attributes
     ----------
     func_dict_ : dict
@@ -157,9 +174,11 @@ class CustomValidator(_BaseValidator):
         is used to validate the presence of the features in the test set
         during the ``transform`` stage.
     """
-    def __init__(self, cols=None, as_df=True, func=None, action="warn"):
+    def __init__(self, cols=None, as_df=True, func=None, action="warn",
+                 n_jobs=1, backend="threading"):
         super(CustomValidator, self).__init__(
-            cols=cols, as_df=as_df, action=action)
+            cols=cols, as_df=as_df, action=action, n_jobs=n_jobs,
+            backend=backend)
 
         self.func = func
 
@@ -255,6 +274,17 @@ class DistHypothesisValidator(_BaseValidator):
         samples in the feature within an absolute tolerance of ``alpha``.
         If None, will not perform validation on categorical features.
 
+    n_jobs : int, optional (default=1)
+        The number of jobs to use to compute the statistics in ``fit`` and
+        to validate the features in ``transform``. The columns are split
+        into one shard per job. If -1, all CPUs are used. If 1, no parallel
+        computing code is used at all.
+
+    backend : str or unicode, optional (default="threading")
+        The joblib backend used when ``n_jobs`` is not 1. "threading" suits
+        the numpy-heavy work here and avoids copying the columns, while
+        "loky" or "multiprocessing" use a process pool.
+
     Notes
     -----
     This class is NaN-safe, meaning if it is used early in your pipeline
@@ -279,9 +309,10 @@ class DistHypothesisValidator(_BaseValidator):
         during the ``transform`` stage.
     """
     def __init__(self, cols=None, as_df=True, alpha=0.05, action="warn",
-                 categorical_strategy="ratio"):
+                 categorical_strategy="ratio", n_jobs=1, backend="threading"):
         super(DistHypothesisValidator, self).__init__(
-            cols=cols, as_df=as_df, action=action)
+            cols=cols, as_df=as_df, action=action, n_jobs=n_jobs,
+            backend=backend)
 
         self.alpha = alpha
         self.categorical_strategy = categorical_strategy
@@ -308,14 +339,71 @@ class DistHypothesisValidator(_BaseValidator):
         float_cols = set(get_continuous_columns(X).columns.tolist())
 
         # fit the test statistics over each column
-        self.statistics_ = [
-            _compute_stats(X[col].values, continuous=col in float_cols)
-            for col in cols
-        ]
+        self.statistics_ = _column_parallel(
+            _compute_stats,
+            [(X[col].values, col in float_cols) for col in cols],
+            n_jobs=self.n_jobs, backend=self.backend)
 
         self.fit_cols_ = cols
         self.continuous_ = float_cols
 
+        # a full fit discards any state accumulated by partial_fit
+        self._partial_stats = None
+        return self
+
+    def partial_fit(self, X, y=None):
+        """Incrementally fit the transformer on a chunk of samples.
+
+        This method accumulates the running moments of the continuous
+        features and the level counts of the categorical features over
+        successive chunks of a frame too large to fit in memory, and updates
+        ``statistics_`` after each chunk. A single pass over the chunks
+        yields the same ``statistics_`` as ``fit`` on the full frame (up to
+        floating point error). Whether a feature is continuous is determined
+        from the first chunk. Calling ``fit`` discards any state accumulated
+        by ``partial_fit``.
+
+        Parameters
+        ----------
+        X : pd.DataFrame, shape=(n_samples, n_features)
+            The chunk of the Pandas frame to fit. Every chunk must contain
+            the columns the first chunk was fit on.
+
+        y : array-like or None, shape=(n_samples,), optional (default=None)
+            Pass-through for ``sklearn.pipeline.Pipeline``.
+        """
+        X, cols = check_dataframe(X, cols=self.cols, assert_all_finite=False,
+                                  copy=False)
+
+        stats = getattr(self, "_partial_stats", None)
+        if stats is None:
+            float_cols = set(get_continuous_columns(X).columns.tolist())
+            stats = collections.OrderedDict(
+                (col, [RunningMoments() if col in float_cols
+                       else ValueCounts(), 0])
+                for col in cols)
+
+            self.fit_cols_ = cols
+            self.continuous_ = float_cols
+            self._partial_stats = stats
+
+        validate_test_set_columns(self.fit_cols_, X.columns)
+
+        statistics = []
+        for col, state in six.iteritems(stats):
+            accumulator = state[0]
+            v = X[col].values
+            state[1] += v.shape[0]  # n_obs includes the missing values
+
+            if col in self.continuous_:
+                accumulator.update(v[~np.isnan(v)])
+                statistics.append((accumulator.mean(), accumulator.std(),
+                                   state[1]))
+            else:
+                levels, counts = accumulator.update(v).sorted_counts()
+                statistics.append((levels, counts, state[1]))
+
+        self.statistics_ = statistics
         return self
 
     def _is_as_expected(self, index, feature_name, feature):
@@ -6,6 +6,9 @@ from skoot.model_validation import DistHypothesisValidator, CustomValidator
 from skoot.utils.testing import assert_raises
 
 import numpy as np
+import pandas as pd
+
+from numpy.testing import assert_array_almost_equal
 
 
 X = np.random.rand(100, 5)
@@ -64,3 +67,19 @@ def test_chi2_validator():
     # ratio, we would pass
     val.categorical_strategy = None
     val.transform(t2)
+
+
+def test_hypothesis_validator_partial_fit():
+    X_mixed = pd.DataFrame.from_records(X)
+    X_mixed.iloc[::7, 0] = np.nan
+    X_mixed['cat'] = np.arange(X.shape[0]) % 3
+
+    fit = DistHypothesisValidator(cols=[0, 1, 'cat']).fit(X_mixed)
+    validator = DistHypothesisValidator(cols=[0, 1, 'cat'])
+    for i in range(0, X.shape[0], 30):
+        validator.partial_fit(X_mixed.iloc[i:i + 30])
+
+    assert validator.continuous_ == fit.continuous_
+    for stats, expected in zip(validator.statistics_, fit.statistics_):
+        for stat, exp in zip(stats, expected):
+            assert_array_almost_equal(stat, exp)
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+#
+# Author: Taylor Smith <taylor.smith@alkaline-ml.com>
+#
+# Utilities for applying fitted pipelines of skoot transformers
+
+from __future__ import absolute_import
+
+from sklearn.pipeline import Pipeline
+
+from .base import BasePDTransformer, _RowTransformer, _transform_chunks
+from .base import _fused_transform
+
+__all__ = [
+    'FusedPipeline',
+    'to_row_transformer',
+    'transform_chunks'
+]
+
+
+def _get_steps(estimator):
+    # get the (non-None) steps of a Pipeline, or the estimator itself
+    if isinstance(estimator, Pipeline):
+        steps = [est for _, est in estimator.steps if est is not None]
+    else:
+        steps = [estimator]
+
+    if not steps:
+        raise ValueError("The Pipeline has no steps")
+    return steps
+
+
+class FusedPipeline(Pipeline):
+    """A Pipeline that fuses the transformations of its skoot steps.
+
+    Applying a ``Pipeline`` of skoot transformers materializes a full
+    intermediate DataFrame after every step, often copying it, concatenating
+    new columns onto it or dropping columns from it along the way. Given
+    the columns of the input frame, the ``FusedPipeline`` plans which
+    columns each fitted step reads, writes and drops, and applies the steps
+    to a store of column arrays instead. Each step touches only its own
+    columns, columns that are never transformed are passed through without
+    being copied, and the output frame is built only once, at the end.
+
+    The output of ``transform`` is identical to that of an equivalent
+    ``sklearn.pipeline.Pipeline``. Fitting is exactly as in a ``Pipeline``.
+
+    Parameters
+    ----------
+    steps : list
+        List of (name, transform) tuples (implementing fit/transform) that
+        are chained, in the order in which they are chained, with the last
+        object an estimator.
+
+    memory : None, str or object with the joblib.Memory interface, optional
+        Used to cache the fitted transformers of the pipeline. See
+        ``sklearn.pipeline.Pipeline``.
+
+    Notes
+    -----
+    * Steps that do not support fused execution (including any non-skoot
+      transformers), as well as steps whose output would contain duplicate
+      column names, are applied to a materialized frame via ``transform``,
+      and fusing resumes with the following step.
+
+    * A step that returns an array (``as_df=False``) ends a fused run of
+      steps, since its output is materialized as an array.
+
+    * Columns that are dropped later in the pipeline (i.e., dummy levels
+      removed by a feature selector) are never computed at all. Errors or
+      warnings that would only arise from computing them are not raised.
+
+    Examples
+    --------
+    >>> from skoot.datasets import load_iris_df
+    >>> from skoot.feature_selection import FeatureFilter
+    >>> from skoot.impute import SelectiveImputer
+    >>> X = load_iris_df(include_tgt=False, names=['a', 'b', 'c', 'd'])
+    >>> pipe = FusedPipeline([
+    ...     ('impute', SelectiveImputer(cols=['a', 'b'])),
+    ...     ('select', FeatureFilter(cols=['c']))
+    ... ]).fit(X)
+    >>> pipe.transform(X).columns.tolist()
+    ['a', 'b', 'd']
+    """
+    def _transform(self, X):
+        steps = [est for _, est in self.steps if est is not None]
+        return _fused_transform(steps, X)
+
+
+def to_row_transformer(estimator):
+    """Compile a fitted transformer or Pipeline for single-row transformations.
+
+    In online inference, records are often transformed one at a time. Each
+    call to ``transform`` re-validates the input and builds intermediate
+    frames, which can cost far more than the transformations themselves. This
+    function compiles a fitted skoot transformer (or a ``Pipeline`` composed
+    only of them) into a lightweight callable that transforms a single record
+    using lookups precomputed from the fit parameters, without constructing
+    any pandas objects. Its output matches ``transform`` for the
+    corresponding one-row frame.
+
+    Parameters
+    ----------
+    estimator : BasePDTransformer or Pipeline
+        The fitted skoot transformer, or the fitted ``Pipeline`` of skoot
+        transformers to compile.
+
+    Returns
+    -------
+    row_transformer : callable
+        A function mapping a single record to its transformed output. The
+        record may be a dict keyed by column name (use an ``OrderedDict`` to
+        control the order of the output columns) or a 1-D array, whose
+        columns are labelled by position just as ``transform`` would label
+        the columns of a 2-D array. If the last step's ``as_df`` is True,
+        the output is an ``OrderedDict`` mapping the output column names to
+        values. Otherwise, it is a 1-D numpy array.
+
+    Notes
+    -----
+    Not every transformer supports compilation. Transformers that do not
+    will raise a NotImplementedError when compiled.
+
+    Examples
+    --------
+    >>> from sklearn.pipeline import Pipeline
+    >>> from skoot.datasets import load_iris_df
+    >>> from skoot.impute import SelectiveImputer
+    >>> from skoot.preprocessing import SelectiveStandardScaler
+    >>> X = load_iris_df(include_tgt=False, names=['a', 'b', 'c', 'd'])
+    >>> pipe = Pipeline([
+    ...     ('impute', SelectiveImputer()),
+    ...     ('scale', SelectiveStandardScaler(cols=['a', 'b'], as_df=False))
+    ... ]).fit(X)
+    >>> score_row = to_row_transformer(pipe)
+    >>> score_row({'a': 5.1, 'b': 3.5, 'c': 1.4, 'd': 0.2})  # doctest: +SKIP
+    array([ 1.4       ,  0.2       , -0.90068117,  1.01900435])
+    """
+    steps = _get_steps(estimator)
+    for est in steps:
+        if not isinstance(est, BasePDTransformer):
+            raise TypeError("All steps must be skoot transformers, but got "
+                            "type=%s" % type(est))
+    return _RowTransformer(steps)
+
+
+def transform_chunks(estimator, chunks):
+    """Stream chunks of a frame through a fitted transformer or Pipeline.
+
+    Datasets that are too large to fit in memory are often read in chunks
+    (e.g., via ``pd.read_csv(..., chunksize=n)``, or one Parquet row group at
+    a time). This function lazily applies every step of a fitted ``Pipeline``
+    to one chunk at a time, so only a single chunk (and its intermediate
+    transformations) is ever held in memory. The output columns and dtypes of
+    every chunk are conformed to those of the first transformed chunk, and a
+    ValueError is raised if that cannot be done safely (i.e., an integer
+    column that contains NaNs in a later chunk).
+
+    Parameters
+    ----------
+    estimator : BasePDTransformer or Pipeline
+        The fitted transformer, or the fitted ``Pipeline`` of transformers.
+        Every step must implement ``transform``.
+
+    chunks : iterable
+        An iterable of pd.DataFrames (or arrays), each of which is a chunk
+        of rows to transform.
+
+    Returns
+    -------
+    transformed : generator
+        A generator of the transformed chunks.
+
+    Examples
+    --------
+    >>> from sklearn.pipeline import Pipeline
+    >>> from skoot.datasets import load_iris_df
+    >>> from skoot.preprocessing import SelectiveStandardScaler
+    >>> X = load_iris_df(include_tgt=False, names=['a', 'b', 'c', 'd'])
+    >>> pipe = Pipeline([
+    ...     ('scale', SelectiveStandardScaler(cols=['a', 'b']))
+    ... ]).fit(X)
+    >>> chunks = (X.iloc[i:i + 50] for i in range(0, X.shape[0], 50))
+    >>> [chunk.shape for chunk in transform_chunks(pipe, chunks)]
+    [(50, 4), (50, 4), (50, 4)]
+    """
+    steps = _get_steps(estimator)
+    for est in steps:
+        if not hasattr(est, "transform"):
+            raise TypeError("All steps must implement transform, but got "
+                            "type=%s" % type(est))
+    return _transform_chunks(steps, chunks)
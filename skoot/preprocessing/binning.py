@@ -12,12 +12,15 @@ from sklearn.utils.validation import check_is_fitted
 import numpy as np
 import pandas as pd
 
-from ..base import BasePDTransformer
+from ..cache import cached_fit
+from ..base import BasePDTransformer, _column_parallel
 from ..utils.iterables import chunk
 from ..utils.dataframe import dataframe_or_array
+from ..utils import _docstr as dsutils
 from ..utils.validation import (check_dataframe, validate_test_set_columns,
                                 type_or_iterable_to_col_mapping)
 from ..utils.metaestimators import timed_instance_method
+from ..utils._sketch import QuantileSketch
 
 __all__ = [
     'BinningTransformer'
@@ -53,9 +56,42 @@ def _percentile(x, n):
     return _Bins(list(zip(bins[:-1], bins[1:])))
 
 
+def _uniform_from_sketch(sketch, n):
+    # the sketch holds the distinct values, so while it's exact this is the
+    # same as _uniform. Otherwise, cut at the approximate ranks at which each
+    # chunk of unique values would start
+    if sketch.exact:
+        return _uniform(sketch.values, n)
+
+    n_unique = int(round(sketch.count))
+    if n_unique < n:
+        raise ValueError("Fewer unique values than bins!")
+
+    k, m = divmod(n_unique, n)
+    starts = [i * k + min(i, m) for i in range(n)]
+    return _Bins([[lower] for lower in sketch.value_at_rank(starts)])
+
+
+def _percentile_from_sketch(sketch, n):
+    # the same quantiles pd.qcut computes, but from the sketch
+    bins = sketch.quantile(np.linspace(0, 1, n + 1))
+    if np.unique(bins).shape[0] < bins.shape[0]:
+        raise ValueError("Bin edges must be unique: %r" % bins)
+    return _Bins(list(zip(bins[:-1], bins[1:])))
+
+
+def _assign_bins(v, bins, as_str):
+    # bin a single column (via the _Bins class)
+    return bins.assign(v, as_str)
+
+
 _STRATEGIES = {"uniform": _uniform,
                "percentile": _percentile}
 
+# the equivalent of each strategy for partial_fit
+_SKETCH_STRATEGIES = {"uniform": _uniform_from_sketch,
+                      "percentile": _percentile_from_sketch}
+
 
 class _Bins(object):
     """Binning class that keeps track of upper and lower bounds of bins.
@@ -138,9 +174,21 @@ class _Bins(object):
         # otherwise user just wants the bin level
         return bins
 
+    def assign_one(self, value, as_str):
+        # scalar equivalent of ``assign``. Every lower bound that the value is
+        # not >= decrements the bin (so NaN wraps around to -1, as above)
+        bin_ = self.n_bins - 1
+        for boundary in self.lower_bounds:
+            if not value >= boundary:
+                bin_ -= 1
+
+        if as_str:
+            return self.reprs[bin_]
+        return bin_
+
 
 class BinningTransformer(BasePDTransformer):
-    r"""Bin continuous variables.
+    __doc__ = r"""Bin continuous variables.
 
     The BinningTransformer will create buckets for continuous variables,
     effectively transforming continuous features into categorical features.
@@ -201,11 +249,31 @@ class BinningTransformer(BasePDTransformer):
         False, the output columns will be appended to the right side of
         the frame with "_binned" appended.
 
+    %(_copy_doc)s
+
+    n_jobs : int, optional (default=1)
+        The number of jobs to use to bin the columns in ``transform``.
+        The columns are split into one shard per job. If -1, all CPUs are
+        used. If 1, no parallel computing code is used at all.
+
+    backend : str or unicode, optional (default="threading")
+        The joblib backend used when ``n_jobs`` is not 1. "threading" suits
+        the numpy-heavy work here and avoids copying the columns, while
+        "loky" or "multiprocessing" use a process pool.
+
     Notes
     -----
     If a feature has fewer than ``n_bins`` unique values, it will raise a
     ValueError in the fit procedure.
 
+    When fit incrementally with ``partial_fit``, the bins are computed from
+    a mergeable quantile sketch of each feature. The bins are identical to
+    those computed by ``fit`` as long as a feature has no more than 10,000
+    distinct values. Beyond that, the sketch is compacted and the bin
+    boundaries are approximate: the rank of each boundary is typically
+    within a small fraction of a percent of the number of samples (or, for
+    uniform bins, of the number of distinct values) from the exact one.
+
     Examples
     --------
     Bin two features in iris:
@@ -244,19 +312,24 @@ class BinningTransformer(BasePDTransformer):
     ----------
     .. [1] "Problems Caused by Categorizing Continuous Variables"
            http://biostat.mc.vanderbilt.edu/wiki/Main/CatContinuous
-    """
+    """ % {"_copy_doc": dsutils._copy_doc.strip()}
+
     def __init__(self, cols, as_df=True, n_bins=10, strategy="uniform",
-                 return_bin_label=True, overwrite=True):
+                 return_bin_label=True, overwrite=True, copy=True, n_jobs=1,
+                 backend="threading"):
 
         super(BinningTransformer, self).__init__(
-            cols=cols, as_df=as_df)
+            cols=cols, as_df=as_df, copy=copy)
 
         self.n_bins = n_bins
         self.strategy = strategy
         self.return_bin_label = return_bin_label
         self.overwrite = overwrite
+        self.n_jobs = n_jobs
+        self.backend = backend
 
     @timed_instance_method(attribute_name="fit_time_")
+    @cached_fit
     def fit(self, X, y=None):
         """Fit the transformer.
 
@@ -270,10 +343,71 @@ class BinningTransformer(BasePDTransformer):
         y : array-like or None, shape=(n_samples,), optional (default=None)
             Pass-through for ``sklearn.pipeline.Pipeline``.
         """
-        # validate the input, and get a copy of it
+        # validate the input. We only read from it, so no copy is needed
         X, cols = check_dataframe(X, cols=self.cols,
-                                  assert_all_finite=True)
+                                  assert_all_finite=True, copy=False)
+
+        n_bins, strategy = self._validate_params(cols)
+        binner = _STRATEGIES[strategy]
 
+        # compute the bins for each feature
+        bins = {}
+        for c, n in six.iteritems(n_bins):
+            bins[c] = binner(X[c].values, n)
+
+        # set the instance attribute
+        self.bins_ = bins
+        self.fit_cols_ = cols
+
+        # a full fit discards any state accumulated by partial_fit
+        self._partial_stats = None
+        return self
+
+    def partial_fit(self, X, y=None):
+        """Incrementally fit the transformer on a chunk of samples.
+
+        This method accumulates a mergeable quantile sketch of each feature
+        over successive chunks of a frame too large to fit in memory, and
+        updates ``bins_`` after each chunk. A single pass over the chunks
+        yields the same ``bins_`` as ``fit`` on the full frame, within the
+        tolerance documented in the Notes. Calling ``fit`` discards any
+        state accumulated by ``partial_fit``.
+
+        Parameters
+        ----------
+        X : pd.DataFrame, shape=(n_samples, n_features)
+            The chunk of the Pandas frame to fit. Every chunk must contain
+            the columns the first chunk was fit on.
+
+        y : array-like or None, shape=(n_samples,), optional (default=None)
+            Pass-through for ``sklearn.pipeline.Pipeline``.
+        """
+        X, cols = check_dataframe(X, cols=self.cols,
+                                  assert_all_finite=True, copy=False)
+
+        stats = getattr(self, "_partial_stats", None)
+        if stats is None:
+            n_bins, strategy = self._validate_params(cols)
+
+            # uniform bins are cut over the distinct values of a feature
+            distinct = strategy == "uniform"
+            stats = {c: (QuantileSketch(distinct=distinct), n)
+                     for c, n in six.iteritems(n_bins)}
+
+            self.fit_cols_ = cols
+            self._partial_stats = stats
+
+        validate_test_set_columns(self.fit_cols_, X.columns)
+        binner = _SKETCH_STRATEGIES[self.strategy]
+
+        bins = {}
+        for c, (sketch, n) in six.iteritems(stats):
+            bins[c] = binner(sketch.update(X[c].values), n)
+
+        self.bins_ = bins
+        return self
+
+    def _validate_params(self, cols):
         # validate n_bins...
         n_bins = type_or_iterable_to_col_mapping(cols=cols, param=self.n_bins,
                                                  param_name="n_bins",
@@ -284,23 +418,13 @@ class BinningTransformer(BasePDTransformer):
             if not (isinstance(v, int) and v > 1):
                 raise ValueError("Each n_bin value must be an integer > 1")
 
-        # get and validate the strategy
+        # validate the strategy
         strategy = self.strategy
-        try:
-            binner = _STRATEGIES[strategy]
-        except KeyError:
+        if strategy not in _STRATEGIES:
             raise ValueError("strategy must be one of %r, but got %r"
                              % (str(list(_STRATEGIES.keys())), strategy))
 
-        # compute the bins for each feature
-        bins = {}
-        for c, n in six.iteritems(n_bins):
-            bins[c] = binner(X[c].values, n)
-
-        # set the instance attribute
-        self.bins_ = bins
-        self.fit_cols_ = cols
-        return self
+        return n_bins, strategy
 
     def transform(self, X):
         """Apply the transformation to a dataframe.
@@ -322,7 +446,7 @@ class BinningTransformer(BasePDTransformer):
             and the result set is returned.
         """
         check_is_fitted(self, 'bins_')
-        X, _ = check_dataframe(X, cols=self.cols)  # X is a copy now
+        X, _ = check_dataframe(X, cols=self.cols, copy=self.copy)
 
         # validate that fit cols in test set
         cols = self.fit_cols_
@@ -333,20 +457,34 @@ class BinningTransformer(BasePDTransformer):
 
         # now apply the binning. Rather that use iteritems, iterate the cols
         # themselves so we get the order prescribed by the user
-        for col in cols:
-
-            # get the bin
-            bin_ = bins[col]  # O(1) lookup
-
-            # get the feature from the frame as an array
-            v = X[col].values  # type: np.ndarray
-            binned = bin_.assign(v, self.return_bin_label)  # via _Bins class
+        binned = _column_parallel(
+            _assign_bins, [(X[col].values, bins[col]) for col in cols],
+            n_jobs=self.n_jobs, backend=self.backend,
+            as_str=self.return_bin_label)
 
+        for col, binned_col in zip(cols, binned):
             # if we overwrite, it's easy
             if self.overwrite:
-                X[col] = binned
+                X[col] = binned_col
             # otherwise create a new feature
             else:
-                X["%s_binned" % col] = binned
+                X["%s_binned" % col] = binned_col
 
         return dataframe_or_array(X, self.as_df)
+
+    def _row_transformer(self):
+        check_is_fitted(self, 'bins_')
+        bins = self.bins_
+        as_str = self.return_bin_label
+        overwrite = self.overwrite
+
+        # (input column, output column, bins) in the prescribed order
+        binners = [(col, col if overwrite else "%s_binned" % col, bins[col])
+                   for col in self.fit_cols_]
+
+        def _transform_row(row):
+            for col, out_col, bin_ in binners:
+                row[out_col] = bin_.assign_one(row[col], as_str)
+            return row
+
+        return _transform_row
@@ -7,13 +7,16 @@ from __future__ import absolute_import
 from sklearn.externals import six
 from sklearn.utils.validation import check_is_fitted
 
-from ..base import BasePDTransformer
+from ..base import BasePDTransformer, _FusedStep, _check_fused_columns
+from ..base import _column_values
 from ..utils.validation import type_or_iterable_to_col_mapping
 from ..utils.validation import check_dataframe, validate_test_set_columns
 from ..utils.metaestimators import timed_instance_method
 from ..utils.compat import NoneType
 from ..utils.series import is_datetime_type
 
+from collections import OrderedDict
+
 import pandas as pd
 
 __all__ = [
@@ -21,33 +24,34 @@ __all__ = [
 ]
 
 
-def _cast_to_datetime(X, cols, formats, allowed_types):
+def _cast_one(f, fmt, allowed_types):
     # Now the real challenge here is that some of the columns passed
     # may not be date-parseable... we'll duck type it. If it fails, it
     # cannot be parsed, and we will let Pandas raise for that. No sense
     # policing it if they are already doing that.
-    def cast(f):
-        fmt = formats[f.name]
-
-        # First make sure the type is in allowed types
-        dtype = f.dtype.name
-        if dtype not in allowed_types:
-            raise ValueError("dtype '%s' not in `allowed_types` (%r)"
-                             % (dtype, allowed_types))
-
-        # Now if the format is already a datetime, we can return early.
-        # If the format isn't defined we can infer it, otherwise we can
-        # parse it explicitly
-        if is_datetime_type(f):
-            return f
-        elif fmt is None:
-            return pd.to_datetime(f, infer_datetime_format=True,
-                                  errors='raise')
-        # otherwise the fmt is defined so we'll let it fail out on its own
-        # if it cannot cast it
-        return pd.to_datetime(f, format=fmt)
-
-    casted = X[cols].apply(cast)
+
+    # First make sure the type is in allowed types
+    dtype = f.dtype.name
+    if dtype not in allowed_types:
+        raise ValueError("dtype '%s' not in `allowed_types` (%r)"
+                         % (dtype, allowed_types))
+
+    # Now if the format is already a datetime, we can return early.
+    # If the format isn't defined we can infer it, otherwise we can
+    # parse it explicitly
+    if is_datetime_type(f):
+        return f
+    elif fmt is None:
+        return pd.to_datetime(f, infer_datetime_format=True,
+                              errors='raise')
+    # otherwise the fmt is defined so we'll let it fail out on its own
+    # if it cannot cast it
+    return pd.to_datetime(f, format=fmt)
+
+
+def _cast_to_datetime(X, cols, formats, allowed_types):
+    casted = X[cols].apply(
+        lambda f: _cast_one(f, formats[f.name], allowed_types))
     X[cols] = casted
     return X
 
@@ -221,3 +225,21 @@ class DateTransformer(BasePDTransformer):
 
         # transform
         return _cast_to_datetime(X, cols, self.formats_, self.allowed_types)
+
+    def _fused_transformer(self, columns):
+        check_is_fitted(self, "fit_cols_")
+        _check_fused_columns(self.cols, columns)
+
+        cols = self.fit_cols_
+        validate_test_set_columns(cols, columns)
+        formats = self.formats_
+        allowed_types = self.allowed_types
+
+        def _transform_columns(block, needed):
+            return OrderedDict(
+                (c, _column_values(_cast_one(pd.Series(v), formats[c],
+                                             allowed_types)))
+                for c, v in six.iteritems(block) if c in needed)
+
+        return _FusedStep(reads=cols, writes=cols, drops=[],
+                          func=_transform_columns)
@@ -6,15 +6,19 @@ from __future__ import division, print_function, absolute_import
 
 from sklearn.preprocessing import LabelEncoder, OneHotEncoder
 from sklearn.utils.validation import check_is_fitted
-from sklearn.externals.joblib import Parallel, delayed
+from sklearn.externals import six
 
 import pandas as pd
 import numpy as np
+from collections import OrderedDict
 
-from ..base import BasePDTransformer
+from ..cache import cached_fit
+from ..base import BasePDTransformer, _column_parallel, _FusedStep
+from ..base import _check_fused_columns
 from ..utils.validation import check_dataframe, validate_test_set_columns
 from ..utils.dataframe import dataframe_or_array
 from ..utils.metaestimators import timed_instance_method
+from ..utils._sketch import ValueCounts
 
 import warnings
 
@@ -108,6 +112,12 @@ class DummyEncoder(BasePDTransformer):
        (n_cpus + 1 + n_jobs) are used. Thus for n_jobs = -2, all CPUs but
        one are used.
 
+    backend : str or unicode, optional (default="threading")
+        The joblib backend used when ``n_jobs`` is not 1. "threading" avoids
+        copying the columns, while "loky" or "multiprocessing" use a
+        process pool, to which large numeric columns are passed through a
+        shared memory-mapped file rather than pickled.
+
     Attributes
     ----------
     ohe_ : OneHotEncoder
@@ -123,7 +133,7 @@ class DummyEncoder(BasePDTransformer):
         during the ``transform`` stage.
     """
     def __init__(self, cols, as_df=True, sep='_', drop_one_level=True,
-                 handle_unknown="ignore", n_jobs=1):
+                 handle_unknown="ignore", n_jobs=1, backend="threading"):
 
         super(DummyEncoder, self).__init__(
             cols=cols, as_df=as_df)
@@ -132,8 +142,10 @@ class DummyEncoder(BasePDTransformer):
         self.drop_one_level = drop_one_level
         self.handle_unknown = handle_unknown
         self.n_jobs = n_jobs
+        self.backend = backend
 
     @timed_instance_method(attribute_name="fit_time_")
+    @cached_fit
     def fit(self, X, y=None):
         """Fit the dummy encoder.
 
@@ -147,36 +159,88 @@ class DummyEncoder(BasePDTransformer):
         y : array-like or None, shape=(n_samples,), optional (default=None)
             Pass-through for ``sklearn.pipeline.Pipeline``.
         """
-        # validate the input, and get a copy of it
+        # validate the input. The encoded columns are stacked into a new
+        # array rather than written back into X, so no copy is needed
         X, cols = check_dataframe(X, cols=self.cols,
-                                  assert_all_finite=False)
+                                  assert_all_finite=False, copy=False)
 
         # for each column, fit a label encoder, get the transformation
-        encoded = list(Parallel(n_jobs=self.n_jobs)(
-            delayed(_fit_transform_one_encoder)(col, X[col].values)
-            for col in cols))
+        encoded = _column_parallel(
+            _fit_transform_one_encoder, [(col, X[col].values) for col in cols],
+            n_jobs=self.n_jobs, backend=self.backend)
 
-        # quickly run over the encoded, set the columns in the dataframe
-        # pre-OHE fit and then create a dict of the encoders
+        # quickly run over the encoded, stack the columns pre-OHE fit and
+        # then create a dict of the encoders
         lab_encoders = {}
+        codes = []
         for col, le, trans in encoded:
-            X[col] = trans
+            codes.append(trans)
             lab_encoders[col] = le
 
-        # fit a single OHE on the transformed columns.
-        handle = "ignore" if self.handle_unknown in ("warn", "ignore") \
-            else "error"
-        ohe = OneHotEncoder(
-            sparse=False,
-            handle_unknown=handle).fit(X[cols])
-
         # assign fit params
-        self.ohe_ = ohe
+        self.ohe_ = self._fit_ohe(codes)
         self.le_ = lab_encoders
         self.fit_cols_ = cols
 
+        # a full fit discards any state accumulated by partial_fit
+        self._partial_stats = None
         return self
 
+    def partial_fit(self, X, y=None):
+        """Incrementally fit the dummy encoder on a chunk of samples.
+
+        This method accumulates the levels of each feature over successive
+        chunks of a frame too large to fit in memory, and updates ``le_``
+        and ``ohe_`` after each chunk. A single pass over the chunks yields
+        the same encoding as ``fit`` on the full frame. Calling ``fit``
+        discards any state accumulated by ``partial_fit``.
+
+        Parameters
+        ----------
+        X : pd.DataFrame, shape=(n_samples, n_features)
+            The chunk of the Pandas frame to fit. Every chunk must contain
+            the columns the first chunk was fit on.
+
+        y : array-like or None, shape=(n_samples,), optional (default=None)
+            Pass-through for ``sklearn.pipeline.Pipeline``.
+        """
+        X, cols = check_dataframe(X, cols=self.cols,
+                                  assert_all_finite=False, copy=False)
+
+        stats = getattr(self, "_partial_stats", None)
+        if stats is None:
+            stats = OrderedDict((col, ValueCounts(dropna=False))
+                                for col in cols)
+            self.fit_cols_ = cols
+            self._partial_stats = stats
+
+        validate_test_set_columns(self.fit_cols_, X.columns)
+
+        # the label encoders' classes are the (sorted) levels seen so far
+        lab_encoders = {}
+        for col, counts in six.iteritems(stats):
+            le = LabelEncoder()
+            le.classes_ = counts.update(X[col].values).sorted_counts()[0]
+            lab_encoders[col] = le
+
+        # every code is present in the fit, so fit the OHE on a small matrix
+        # in which each column takes each of its codes at least once
+        n_levels = [lab_encoders[col].classes_.shape[0] for col in stats]
+        codes = np.arange(max(n_levels))
+        self.ohe_ = self._fit_ohe([np.minimum(codes, n - 1)
+                                   for n in n_levels])
+        self.le_ = lab_encoders
+
+        return self
+
+    def _fit_ohe(self, codes):
+        # fit a single OHE on the transformed columns.
+        handle = "ignore" if self.handle_unknown in ("warn", "ignore") \
+            else "error"
+        return OneHotEncoder(
+            sparse=False,
+            handle_unknown=handle).fit(np.column_stack(codes))
+
     def transform(self, X):
         """Apply the encoding to a dataframe.
 
@@ -197,7 +261,10 @@ class DummyEncoder(BasePDTransformer):
             and the result set is returned.
         """
         check_is_fitted(self, 'ohe_')
-        X, _ = check_dataframe(X, cols=self.cols)
+
+        # the original columns are dropped (creating a new frame) rather than
+        # overwritten, so X does not need to be copied
+        X, _ = check_dataframe(X, cols=self.cols, copy=False)
 
         # validate that fit cols in test set
         cols = self.fit_cols_
@@ -210,16 +277,16 @@ class DummyEncoder(BasePDTransformer):
         drop = self.drop_one_level
 
         # Do transformations in parallel
-        transformations = list(Parallel(n_jobs=self.n_jobs)(
-            delayed(_le_transform)(
-                col=col, vec=X[col].values, le=lenc[col],
-                handle=self.handle_unknown, sep=sep)
-            for col in cols))
+        transformations = _column_parallel(
+            _le_transform, [(col, X[col].values, lenc[col]) for col in cols],
+            n_jobs=self.n_jobs, backend=self.backend,
+            handle=self.handle_unknown, sep=sep)
 
         col_order = []
         drops = []
+        codes = []
         for col, vec_trans, classes in transformations:
-            X[col] = vec_trans
+            codes.append(vec_trans)
             col_order.extend(classes)
 
             # if we want to drop one, just drop the last
@@ -227,8 +294,9 @@ class DummyEncoder(BasePDTransformer):
                 drops.append(classes[-1])
 
         # now we can get the transformed OHE
-        ohe_trans = pd.DataFrame.from_records(data=ohe.transform(X[cols]),
-                                              columns=col_order)
+        ohe_trans = pd.DataFrame.from_records(
+            data=ohe.transform(np.column_stack(codes)),
+            columns=col_order)
 
         # set the index to be equal to X's for a smooth concat
         ohe_trans.index = X.index
@@ -248,3 +316,86 @@ class DummyEncoder(BasePDTransformer):
         # otherwise concat the new columns
         X = pd.concat([X, ohe_trans], axis=1)  # type: pd.DataFrame
         return dataframe_or_array(X, self.as_df)
+
+    def _fused_transformer(self, columns):
+        check_is_fitted(self, 'ohe_')
+        _check_fused_columns(self.cols, columns)
+
+        cols = self.fit_cols_
+        validate_test_set_columns(cols, columns)
+        handle = self.handle_unknown
+        sep = self.sep
+        lenc = self.le_
+
+        # the dummy columns of each encoded column, minus the dropped level
+        names = []
+        for col in cols:
+            col_names = ["%s%s%s" % (col, sep, clz)
+                         for clz in lenc[col].classes_.tolist()]
+            if self.drop_one_level and len(col_names) > 1:
+                col_names = col_names[:-1]
+            names.append(col_names)
+        writes = [name for col_names in names for name in col_names]
+
+        # a new column that duplicates an existing one cannot be fused
+        kept = set(columns).difference(cols)
+        if len(set(writes)) != len(writes) or kept.intersection(writes):
+            raise NotImplementedError("Dummy column names are not unique")
+
+        def _transform_columns(block, needed):
+            # each dummy is just an indicator of the level's code. Unknown
+            # levels are coded n_classes, so they're all zeros
+            written = OrderedDict()
+            for col, col_names in zip(cols, names):
+                codes = _le_transform(col, np.asarray(block[col]), lenc[col],
+                                      handle=handle, sep=sep)[1]
+                written.update((name, (codes == i).astype(np.float64))
+                               for i, name in enumerate(col_names)
+                               if name in needed)
+            return written
+
+        return _FusedStep(reads=cols, writes=writes, drops=cols,
+                          func=_transform_columns)
+
+    def _row_transformer(self):
+        check_is_fitted(self, 'ohe_')
+        handle = self.handle_unknown
+        sep = self.sep
+        drop = self.drop_one_level
+        cols = self.fit_cols_
+        colset = set(cols)
+
+        # precompute a level -> index lookup table and the output column
+        # names (minus the dropped level) for each encoded column
+        encoders = []
+        for col in cols:
+            le_clz = self.le_[col].classes_.tolist()
+            lookup = {clz: i for i, clz in enumerate(le_clz)}
+            names = ["%s%s%s" % (col, sep, clz) for clz in le_clz]
+            if drop and len(names) > 1:
+                names = names[:-1]
+            encoders.append((col, lookup, names))
+
+        def _transform_row(row):
+            out = OrderedDict((k, v) for k, v in six.iteritems(row)
+                              if k not in colset)
+
+            for col, lookup, names in encoders:
+                value = row[col]
+                level = lookup.get(value, -1)
+
+                # previously unseen
+                if level < 0:
+                    if handle not in ("ignore", "warn"):
+                        raise ValueError("y contains previously unseen "
+                                         "labels: %r" % [value])
+                    elif handle == "warn":
+                        warnings.warn("Previously unseen level(s) found in "
+                                      "data! %r" % [value])
+
+                for i, name in enumerate(names):
+                    out[name] = 1. if i == level else 0.
+
+            return out
+
+        return _transform_row
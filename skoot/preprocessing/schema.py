@@ -7,9 +7,16 @@ from __future__ import absolute_import
 from sklearn.utils.validation import check_is_fitted
 from sklearn.externals import six
 
-from ..base import BasePDTransformer
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from ..base import BasePDTransformer, _FusedStep, _check_fused_columns
+from ..base import _column_values
 from ..utils.validation import check_dataframe, validate_test_set_columns
 from ..utils.dataframe import dataframe_or_array
+from ..utils import _docstr as dsutils
 from ..utils.metaestimators import timed_instance_method
 
 __all__ = [
@@ -18,7 +25,7 @@ __all__ = [
 
 
 class SchemaNormalizer(BasePDTransformer):
-    r"""Enforce a schema on an input dataframe.
+    __doc__ = r"""Enforce a schema on an input dataframe.
 
     The SchemaNormalizer enforces a schema across incoming train and
     test data. This ensures that all data matches the expected schema.
@@ -38,18 +45,20 @@ class SchemaNormalizer(BasePDTransformer):
         Since most skoot transformers depend on explicitly-named
         ``DataFrame`` features, the ``as_df`` parameter is True by default.
 
+    %(_copy_doc)s
+
     Attributes
     ----------
     fit_cols_ : list
         The list of column names on which the transformer was fit. This
         is used to validate the presence of the features in the test set
         during the ``transform`` stage.
-    """
+    """ % {"_copy_doc": dsutils._copy_doc.strip()}
 
-    def __init__(self, schema, as_df=True):
+    def __init__(self, schema, as_df=True, copy=True):
 
         super(SchemaNormalizer, self).__init__(
-            as_df=as_df, cols=None)
+            as_df=as_df, cols=None, copy=copy)
 
         self.schema = schema
 
@@ -69,7 +78,7 @@ class SchemaNormalizer(BasePDTransformer):
         y : array-like or None, shape=(n_samples,), optional (default=None)
             Pass-through for ``sklearn.pipeline.Pipeline``.
         """
-        _, self.fit_cols_ = check_dataframe(X, cols=self.cols)
+        _, self.fit_cols_ = check_dataframe(X, cols=self.cols, copy=False)
         return self
 
     def transform(self, X):
@@ -89,7 +98,7 @@ class SchemaNormalizer(BasePDTransformer):
             and the result set is returned.
         """
         check_is_fitted(self, "fit_cols_")
-        X, _ = check_dataframe(X, cols=self.cols)
+        X, _ = check_dataframe(X, cols=self.cols, copy=self.copy)
 
         # validate that fit cols in test set
         cols = self.fit_cols_
@@ -100,3 +109,41 @@ class SchemaNormalizer(BasePDTransformer):
             X[k] = X[k].astype(v)
 
         return dataframe_or_array(X, self.as_df)
+
+    def _row_transformer(self):
+        check_is_fitted(self, "fit_cols_")
+
+        # pandas-only types (i.e., "category") cannot be cast without pandas
+        schema = []
+        for k, v in six.iteritems(self.schema):
+            try:
+                schema.append((k, np.dtype(v)))
+            except TypeError:
+                raise NotImplementedError("Cannot compile a single-row "
+                                          "transformation for non-numpy "
+                                          "type %r (column=%r)" % (v, k))
+
+        def _transform_row(row):
+            for k, dtype in schema:
+                row[k] = np.array([row[k]]).astype(dtype)[0]
+            return row
+
+        return _transform_row
+
+    def _fused_transformer(self, columns):
+        check_is_fitted(self, "fit_cols_")
+        _check_fused_columns(self.fit_cols_, columns)
+
+        # the schema may also name columns outside of fit_cols_
+        schema = self.schema
+        cols = list(schema.keys())
+        _check_fused_columns(cols, columns)
+
+        def _transform_columns(block, needed):
+            # cast a Series so the semantics (and errors) match transform
+            return OrderedDict(
+                (k, _column_values(pd.Series(v).astype(schema[k])))
+                for k, v in six.iteritems(block) if k in needed)
+
+        return _FusedStep(reads=cols, writes=cols, drops=[],
+                          func=_transform_columns)
@@ -13,14 +13,15 @@ from scipy import optimize
 from scipy.stats import boxcox
 
 from sklearn.externals import six
-from sklearn.externals.joblib import Parallel, delayed
 from sklearn.utils.validation import check_is_fitted
 
-from ..base import BasePDTransformer
+from ..cache import cached_fit
+from ..base import BasePDTransformer, _column_parallel
 from ..decorators import suppress_warnings as suppress
 from ..utils.validation import (check_dataframe, validate_multiple_rows,
                                 validate_test_set_columns)
 from ..utils.dataframe import dataframe_or_array
+from ..utils import _docstr as dsutils
 from ..utils.metaestimators import timed_instance_method
 
 __all__ = [
@@ -180,30 +181,29 @@ def _yj_transform_y(y, lam, dtype=np.float32):
 
 
 class _BaseSkewnessTransformer(six.with_metaclass(ABCMeta, BasePDTransformer)):
-    def __init__(self, cols, n_jobs, as_df, dtype):
+    def __init__(self, cols, n_jobs, as_df, dtype, copy, backend):
 
         super(_BaseSkewnessTransformer, self).__init__(
-            cols=cols, as_df=as_df)
+            cols=cols, as_df=as_df, copy=copy)
 
         self.n_jobs = n_jobs
         self.dtype = dtype
+        self.backend = backend
 
     def _fit(self, X, estimation_function):
         # check on state of X and cols (all cols need to be finite!)
-        X, cols = check_dataframe(X, cols=self.cols, assert_all_finite=True)
+        X, cols = check_dataframe(X, cols=self.cols, assert_all_finite=True,
+                                  copy=False)
 
         # ensure enough rows
         validate_multiple_rows(self.__class__.__name__, X)
 
         # Now estimate the lambdas in parallel
-        n_jobs = self.n_jobs
         dtype = self.dtype
-        kwargs = self._estimator_kwargs()
-
-        self.lambda_ = list(
-            Parallel(n_jobs=n_jobs)(
-                delayed(estimation_function)(X[i], dtype, **kwargs)
-                for i in cols))
+        self.lambda_ = _column_parallel(
+            estimation_function, [(X[c].values, dtype) for c in cols],
+            n_jobs=self.n_jobs, backend=self.backend,
+            **self._estimator_kwargs())
 
         # set the fit cols
         self.fit_cols_ = cols
@@ -246,7 +246,8 @@ class _BaseSkewnessTransformer(six.with_metaclass(ABCMeta, BasePDTransformer)):
         check_is_fitted(self, 'lambda_')
 
         # check on state of X and cols
-        X, _ = check_dataframe(X, cols=self.cols, assert_all_finite=True)
+        X, _ = check_dataframe(X, cols=self.cols, assert_all_finite=True,
+                               copy=self.copy)
 
         # validate the test columns
         cols = self.fit_cols_
@@ -258,11 +259,33 @@ class _BaseSkewnessTransformer(six.with_metaclass(ABCMeta, BasePDTransformer)):
         lambdas_ = self.lambda_
 
         # do transformations
-        for nm, lam in zip(cols, lambdas_):
-            X[nm] = self._transform_vector(X[nm], lam)
+        transformed = _column_parallel(
+            self._transform_vector,
+            [(X[nm].values, lam) for nm, lam in zip(cols, lambdas_)],
+            n_jobs=self.n_jobs, backend=self.backend)
+
+        for nm, trans in zip(cols, transformed):
+            X[nm] = trans
 
         return dataframe_or_array(X, self.as_df)
 
+    def _row_transformer(self):
+        check_is_fitted(self, 'lambda_')
+        cols_lambdas = list(zip(self.fit_cols_, self.lambda_))
+        transform_vector = self._transform_vector
+
+        def _transform_row(row):
+            for nm, lam in cols_lambdas:
+                value = row[nm]
+                if not np.isfinite(value):
+                    raise ValueError("Expected all entries in specified "
+                                     "columns to be finite, but found "
+                                     "non-finite values in %r" % [nm])
+                row[nm] = transform_vector(np.array([value]), lam)[0]
+            return row
+
+        return _transform_row
+
 
 # A dumb hack bc we cannot pickle functions or instancemethods...
 # so these estimator wrappers simply call the appropriate estimator
@@ -285,7 +308,7 @@ class _YJEstimator(object):
 
 
 class BoxCoxTransformer(_BaseSkewnessTransformer):
-    r"""Apply the Box-Cox transformation to select features in a dataframe.
+    __doc__ = r"""Apply the Box-Cox transformation to features in a dataframe.
 
     Estimate a lambda parameter for each feature, and transform it to a
     distribution more-closely resembling a Gaussian bell using the Box-Cox
@@ -315,7 +338,8 @@ class BoxCoxTransformer(_BaseSkewnessTransformer):
 
     n_jobs : int, 1 by default
        The number of jobs to use for the computation. This works by
-       estimating each of the feature lambdas in parallel.
+       estimating each of the feature lambdas (and, in ``transform``,
+       transforming each of the features) in parallel.
 
        If -1 all CPUs are used. If 1 is given, no parallel computing code
        is used at all, which is useful for debugging. For n_jobs below -1,
@@ -340,6 +364,15 @@ class BoxCoxTransformer(_BaseSkewnessTransformer):
         Whether to suppress warnings in the scipy.stats.boxcox function.
         Default is False.
 
+    %(_copy_doc)s
+
+    backend : str or unicode, optional (default="loky")
+        The joblib backend used when ``n_jobs`` is not 1. Since estimating
+        the lambdas is mostly pure-Python optimization that holds the GIL,
+        the default is a process pool ("loky"), to which large columns are
+        passed as shared memory maps. "threading" avoids copying the
+        columns, and is a good choice when only transforming.
+
     Attributes
     ----------
     lambda_ : list
@@ -349,18 +382,21 @@ class BoxCoxTransformer(_BaseSkewnessTransformer):
         The list of column names on which the transformer was fit. This
         is used to validate the presence of the features in the test set
         during the ``transform`` stage.
-    """
+    """ % {"_copy_doc": dsutils._copy_doc.strip()}
 
     def __init__(self, cols=None, n_jobs=1, as_df=True, min_value=1e-12,
-                 dtype=np.float32, suppress_warnings=False):
+                 dtype=np.float32, suppress_warnings=False, copy=True,
+                 backend="loky"):
 
         super(BoxCoxTransformer, self).__init__(
-            cols=cols, as_df=as_df, n_jobs=n_jobs, dtype=dtype)
+            cols=cols, as_df=as_df, n_jobs=n_jobs, dtype=dtype, copy=copy,
+            backend=backend)
 
         self.min_value = min_value
         self.suppress_warnings = suppress_warnings
 
     @timed_instance_method(attribute_name="fit_time_")
+    @cached_fit
     def fit(self, X, y=None):
         """Fit the transformer.
 
@@ -393,7 +429,7 @@ class BoxCoxTransformer(_BaseSkewnessTransformer):
 
 
 class YeoJohnsonTransformer(_BaseSkewnessTransformer):
-    r"""Apply the Yeo-Johnson transformation to a dataset.
+    __doc__ = r"""Apply the Yeo-Johnson transformation to a dataset.
 
     Estimate a lambda parameter for each feature, and transform
     it to a distribution more-closely resembling a Gaussian bell
@@ -425,7 +461,8 @@ class YeoJohnsonTransformer(_BaseSkewnessTransformer):
 
     n_jobs : int, 1 by default
        The number of jobs to use for the computation. This works by
-       estimating each of the feature lambdas in parallel.
+       estimating each of the feature lambdas (and, in ``transform``,
+       transforming each of the features) in parallel.
 
        If -1 all CPUs are used. If 1 is given, no parallel computing code
        is used at all, which is useful for debugging. For n_jobs below -1,
@@ -449,6 +486,15 @@ class YeoJohnsonTransformer(_BaseSkewnessTransformer):
         The type of float to which to cast the vector. Default is float32
         to avoid overflows.
 
+    %(_copy_doc)s
+
+    backend : str or unicode, optional (default="loky")
+        The joblib backend used when ``n_jobs`` is not 1. Since estimating
+        the lambdas is mostly pure-Python optimization that holds the GIL,
+        the default is a process pool ("loky"), to which large columns are
+        passed as shared memory maps. "threading" avoids copying the
+        columns, and is a good choice when only transforming.
+
     Attributes
     ----------
     lambda_ : list
@@ -458,17 +504,19 @@ class YeoJohnsonTransformer(_BaseSkewnessTransformer):
         The list of column names on which the transformer was fit. This
         is used to validate the presence of the features in the test set
         during the ``transform`` stage.
-    """
+    """ % {"_copy_doc": dsutils._copy_doc.strip()}
+
     def __init__(self, cols=None, n_jobs=1, as_df=True, brack=(-2, 2),
-                 dtype=np.float32):
+                 dtype=np.float32, copy=True, backend="loky"):
 
         super(YeoJohnsonTransformer, self).__init__(
             cols=cols, as_df=as_df, n_jobs=n_jobs,
-            dtype=dtype)
+            dtype=dtype, copy=copy, backend=backend)
 
         self.brack = brack
 
     @timed_instance_method(attribute_name="fit_time_")
+    @cached_fit
     def fit(self, X, y=None):
         """Fit the transformer.
 
@@ -7,7 +7,8 @@ from skoot.datasets import load_iris_df
 from skoot.utils.testing import assert_raises
 
 import numpy as np
-from numpy.testing import assert_array_equal
+import pandas as pd
+from numpy.testing import assert_array_equal, assert_array_almost_equal
 
 iris = load_iris_df(include_tgt=False, names=["a", "b", "c", "d"])
 
@@ -101,3 +102,35 @@ def test_binning_corners():
 
     # this one will fail since strategy is illegal
     f(BinningTransformer(cols=["a"], n_bins=3, strategy="illegal"), ValueError)
+
+
+def test_binning_partial_fit():
+    chunks = [iris.iloc[i:i + 40] for i in range(0, iris.shape[0], 40)]
+
+    for strategy in ("uniform", "percentile"):
+        fit = BinningTransformer(cols=["a", "b"], n_bins=4,
+                                 strategy=strategy).fit(iris)
+        binner = BinningTransformer(cols=["a", "b"], n_bins=4,
+                                    strategy=strategy)
+        for chunk in chunks:
+            binner.partial_fit(chunk)
+
+        for col in ("a", "b"):
+            assert_array_almost_equal(binner.bins_[col].lower_bounds,
+                                      fit.bins_[col].lower_bounds)
+        assert binner.transform(iris).equals(fit.transform(iris))
+
+    # a continuous feature with more distinct values than fit in the sketch
+    rs = np.random.RandomState(42)
+    X = pd.DataFrame.from_records(rs.randn(30000, 1), columns=["x"])
+    for strategy in ("uniform", "percentile"):
+        fit = BinningTransformer(cols=["x"], n_bins=5, strategy=strategy,
+                                 return_bin_label=False).fit(X)
+        binner = BinningTransformer(cols=["x"], n_bins=5, strategy=strategy,
+                                    return_bin_label=False)
+        for i in range(0, X.shape[0], 5000):
+            binner.partial_fit(X.iloc[i:i + 5000])
+
+        # fewer than 0.5% of the samples are assigned a different bin
+        disagree = (binner.transform(X)["x"] != fit.transform(X)["x"])
+        assert disagree.mean() < 0.005, disagree.mean()
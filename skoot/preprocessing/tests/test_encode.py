@@ -82,3 +82,20 @@ def test_dummy_encoder_ignore():
     # show the sum of the "species" columns is zero
     species_cols = trans[trans.columns[trans.columns.str.contains("species")]]
     assert species_cols.sum().sum() == 0
+
+
+def test_dummy_encoder_partial_fit():
+    # the first chunk has only one of the species
+    chunks = [iris.iloc[:50], iris.iloc[50:120], iris.iloc[120:]]
+    fit = DummyEncoder(cols=['species']).fit(iris)
+
+    encoder = DummyEncoder(cols=['species'])
+    encoder.partial_fit(chunks[0])
+    assert encoder.le_['species'].classes_.tolist() == [0]
+
+    for chunk in chunks[1:]:
+        encoder.partial_fit(chunk)
+
+    assert_array_equal(encoder.le_['species'].classes_,
+                       fit.le_['species'].classes_)
+    assert encoder.transform(iris).equals(fit.transform(iris))
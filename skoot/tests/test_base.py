@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from skoot.base import (_get_column_positions, _column_parallel,
+                        _share_columns, _load_column, _SharedColumn)
+from skoot.decomposition import SelectivePCA
+from skoot.preprocessing import (SelectiveStandardScaler, BinningTransformer,
+                                 YeoJohnsonTransformer)
+from skoot.model_validation import DistHypothesisValidator
+from skoot.feature_selection import FeatureFilter, NearZeroVarianceFilter
+from skoot.impute import SelectiveImputer
+from skoot.utils.testing import assert_raises
+
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+rs = np.random.RandomState(42)
+X = rs.rand(25, 4)
+X[[1, 5, 7], [0, 2, 3]] = np.nan
+X_df = pd.DataFrame.from_records(X)  # integer column labels
+
+
+def test_get_column_positions():
+    assert _get_column_positions([0, 2], 3) == [0, 2]
+    assert _get_column_positions(np.array([1]), 3) == [1]
+    assert _get_column_positions(2, 3) == [2]
+
+    # out of bounds or not integers
+    assert _get_column_positions([3], 3) is None
+    assert _get_column_positions([-1], 3) is None
+    assert _get_column_positions(["a"], 3) is None
+    assert _get_column_positions([True], 3) is None
+
+
+def test_array_path_matches_frame_path():
+    X_fill = np.nan_to_num(X)
+
+    for est in (SelectiveStandardScaler(cols=[0, 3], as_df=False),
+                SelectivePCA(cols=[1, 2], n_components=1, as_df=False),
+                SelectivePCA(as_df=False),
+                FeatureFilter(cols=[1], as_df=False),
+                FeatureFilter(as_df=False)):
+
+        est.fit(X_fill)
+        from_array = est.transform(X_fill)
+        from_frame = est.transform(pd.DataFrame.from_records(X_fill))
+
+        assert isinstance(from_array, np.ndarray)
+        assert_array_almost_equal(from_array, from_frame)
+
+
+def test_array_path_imputer():
+    imputer = SelectiveImputer(cols=[0, 2], as_df=False).fit(X)
+    from_array = imputer.transform(X)
+    assert_array_almost_equal(from_array, imputer.transform(X_df))
+
+    # input was not mutated, but it will be if copy=False
+    assert np.isnan(X).any()
+    X_copy = X.copy()
+    imputer.set_params(copy=False)
+    assert imputer.transform(X_copy) is X_copy
+    assert_array_equal(X_copy, from_array)
+
+
+def test_array_path_falls_back():
+    # fit on named columns, so the array doesn't contain the fit cols
+    named = pd.DataFrame.from_records(np.nan_to_num(X),
+                                      columns=list('abcd'))
+    scaler = SelectiveStandardScaler(as_df=False).fit(named)
+    assert_raises(ValueError, scaler.transform, np.nan_to_num(X))
+
+    # selectors warn when dropping names that aren't positions
+    nzv = NearZeroVarianceFilter(freq_cut=1.01, as_df=False)
+    nzv.drop_ = ['a']
+    assert_array_equal(nzv.transform(X), X)
+
+
+def _sum_plus(x, y, z=0.):
+    return np.nansum(x) + y + z
+
+
+def test_column_parallel():
+    args = [(X_df[c].values, c) for c in X_df.columns]
+    expected = [np.nansum(x) + c + 1. for x, c in args]
+
+    # more jobs than columns is fine, too
+    for n_jobs in (1, 2, 3, 8):
+        for backend in ("threading", "loky"):
+            res = _column_parallel(_sum_plus, args, n_jobs=n_jobs,
+                                   backend=backend, z=1.)
+            assert_array_almost_equal(res, expected)
+
+    assert _column_parallel(_sum_plus, [], n_jobs=2) == []
+    assert_raises(ValueError, _column_parallel, _sum_plus, args, n_jobs=2,
+                  transport="bad")
+
+    # columns large enough to be shared with the process workers
+    big = [(rs.rand(2 ** 18), i) for i in range(3)]
+    expected = [x.sum() + i for x, i in big]
+    for transport in ("shared", "pickle"):
+        res = _column_parallel(_sum_plus, big, n_jobs=2, backend="loky",
+                               transport=transport)
+        assert_array_almost_equal(res, expected)
+
+
+def test_share_columns():
+    objects = np.array(['a', 'b'], dtype=object)
+    args = [(X[:, 0], 'x'), (X[:, 1].astype(np.float32), objects),
+            (np.arange(3), 'tiny')]
+
+    shared, filename = _share_columns(args, min_nbytes=50)
+    try:
+        # the strings and the small int array are passed as-is
+        assert isinstance(shared[0][0], _SharedColumn)
+        assert isinstance(shared[1][0], _SharedColumn)
+        assert shared[1][1] is objects
+        assert shared[2][0] is args[2][0]
+
+        for (arg, _), (ref, _) in zip(args, shared):
+            loaded = _load_column(ref)
+            assert loaded.dtype == arg.dtype
+            assert_array_equal(loaded, arg)
+    finally:
+        os.unlink(filename)
+
+    # nothing to share
+    assert _share_columns(args[2:], min_nbytes=50) == (args[2:], None)
+
+
+def test_column_parallel_transformers():
+    X_fill = pd.DataFrame.from_records(np.nan_to_num(X))
+
+    for est, X_fit in ((SelectiveImputer(), X_df),
+                       (BinningTransformer(cols=[0, 1, 2], n_bins=3), X_fill),
+                       (YeoJohnsonTransformer(), X_fill),
+                       (DistHypothesisValidator(), X_df)):
+
+        serial = est.fit(X_fit).transform(X_fit)
+        for backend in ("threading", "loky"):
+            est.set_params(n_jobs=2, backend=backend)
+            parallel = est.fit(X_fit).transform(X_fit)
+            assert parallel.equals(serial)
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from skoot.cache import FitCache, fit_cache, get_fit_cache, set_fit_cache
+from skoot.datasets import load_iris_df
+from skoot.preprocessing import BoxCoxTransformer, DummyEncoder
+from skoot.impute import BaggedRegressorImputer
+from skoot.utils.testing import assert_raises
+
+from numpy.testing import assert_array_equal
+from pandas.util.testing import assert_frame_equal
+
+X = load_iris_df(include_tgt=False, names=['a', 'b', 'c', 'd'])
+
+
+def test_fit_cache_hits():
+    cache = FitCache()
+    with fit_cache(cache):
+        bc = BoxCoxTransformer(cols=['a', 'b']).fit(X)
+        bc2 = BoxCoxTransformer(cols=['a', 'b']).fit(X)
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.nbytes > 0
+
+        # the restored state transforms identically
+        assert_array_equal(bc.lambda_, bc2.lambda_)
+        assert_frame_equal(bc.transform(X), bc2.transform(X))
+
+        # different params, columns or data are misses
+        BoxCoxTransformer(cols=['a', 'b'], min_value=1e-4).fit(X)
+        BoxCoxTransformer(cols=['a', 'c']).fit(X)
+        X2 = X.copy()
+        X2.loc[0, 'a'] += 1.
+        BoxCoxTransformer(cols=['a', 'b']).fit(X2)
+        assert (cache.hits, cache.misses) == (1, 4)
+
+        # but data outside of the columns is not part of the key
+        X2.loc[0, 'd'] += 1.
+        BoxCoxTransformer(cols=['a', 'b']).fit(X2)
+        assert (cache.hits, cache.misses) == (2, 4)
+
+    # no longer active
+    assert get_fit_cache() is None
+    BoxCoxTransformer(cols=['a', 'b']).fit(X)
+    assert (cache.hits, cache.misses) == (2, 4)
+
+    cache.clear()
+    assert (cache.hits, cache.misses, cache.nbytes) == (0, 0, 0)
+
+
+def test_fit_cache_predictors():
+    # the bagged imputers are keyed on every column, since the predictors
+    # are read as well
+    X2 = X.copy()
+    X2.loc[::7, 'a'] = np.nan
+    cache = FitCache()
+    with fit_cache(cache):
+        imp = BaggedRegressorImputer(cols=['a'], random_state=1).fit(X2)
+        imp2 = BaggedRegressorImputer(cols=['a'], random_state=1).fit(X2)
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert_frame_equal(imp.transform(X2), imp2.transform(X2))
+
+        X2.loc[0, 'd'] += 1.
+        BaggedRegressorImputer(cols=['a'], random_state=1).fit(X2)
+        assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_fit_cache_unseeded():
+    # fits with an unseeded random_state are never cached, since a refit
+    # would not reproduce them
+    X2 = X.copy()
+    X2.loc[::7, 'a'] = np.nan
+    cache = FitCache()
+    with fit_cache(cache):
+        for random_state in (None, np.random.RandomState(1)):
+            BaggedRegressorImputer(cols=['a'],
+                                   random_state=random_state).fit(X2)
+            BaggedRegressorImputer(cols=['a'],
+                                   random_state=random_state).fit(X2)
+        assert (cache.hits, cache.misses, cache.nbytes) == (0, 0, 0)
+
+        # but an int seed is
+        BaggedRegressorImputer(cols=['a'], random_state=1).fit(X2)
+        BaggedRegressorImputer(cols=['a'], random_state=1).fit(X2)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_fit_cache_evictions():
+    # only room for one encoder at a time
+    with fit_cache(FitCache(max_bytes=None)) as cache:
+        DummyEncoder(cols=['a']).fit(X)
+    nbytes = cache.nbytes
+
+    cache = FitCache(max_bytes=int(nbytes * 1.5))
+    with fit_cache(cache):
+        DummyEncoder(cols=['a']).fit(X)
+        DummyEncoder(cols=['b']).fit(X)
+        assert cache.evictions == 1
+        assert cache.nbytes <= cache.max_bytes
+
+        # the first was evicted, the second was not
+        DummyEncoder(cols=['b']).fit(X)
+        DummyEncoder(cols=['a']).fit(X)
+        assert (cache.hits, cache.misses) == (1, 3)
+
+    # an entry larger than the budget is never stored
+    cache = FitCache(max_bytes=1)
+    with fit_cache(cache):
+        DummyEncoder(cols=['a']).fit(X)
+        DummyEncoder(cols=['a']).fit(X)
+    assert (cache.hits, cache.misses, cache.nbytes) == (0, 2, 0)
+
+
+def test_fit_cache_directory():
+    directory = tempfile.mkdtemp()
+    try:
+        cache = FitCache(directory=os.path.join(directory, "cache"))
+        with fit_cache(cache):
+            bc = BoxCoxTransformer(cols=['a', 'b']).fit(X)
+        assert len(os.listdir(cache.directory)) == 1
+
+        # a new cache can read the entries written by another
+        cache2 = FitCache(directory=cache.directory)
+        with fit_cache(cache2):
+            bc2 = BoxCoxTransformer(cols=['a', 'b']).fit(X)
+        assert (cache2.hits, cache2.misses) == (1, 0)
+        assert cache2.nbytes == cache.nbytes
+        assert_frame_equal(bc.transform(X), bc2.transform(X))
+
+        cache2.clear()
+        assert not os.listdir(cache.directory)
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_set_fit_cache():
+    assert_raises(TypeError, set_fit_cache, "cache")
+
+    outer, inner = FitCache(), FitCache()
+    with fit_cache(outer):
+        with fit_cache(inner):
+            assert get_fit_cache() is inner
+        assert get_fit_cache() is outer
+    assert get_fit_cache() is None
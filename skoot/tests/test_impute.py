@@ -7,10 +7,12 @@ import pandas as pd
 
 from skoot.utils.testing import assert_raises
 from skoot.impute import (SelectiveImputer, _get_callable, _get_present_values,
-                          _mean, _median, _most_frequent,
-                          BaggedClassifierImputer, BaggedRegressorImputer)
+                          _get_mask, _mean, _median, _most_frequent,
+                          BaggedClassifierImputer, BaggedRegressorImputer,
+                          KNNImputer, TimeSeriesImputer)
 
 from numpy.testing import assert_array_equal, assert_array_almost_equal
+from pandas.util.testing import assert_frame_equal
 
 nan = np.nan
 X = pd.DataFrame.from_records(
@@ -132,6 +134,23 @@ def test_selective_imputer_dict_strategies():
     assert len(imputer.strategy_) == 1
 
 
+def test_selective_imputer_no_copy():
+    X_copy = X.copy()
+    imputer = SelectiveImputer(copy=False).fit(X_copy)
+    trans = imputer.transform(X_copy)
+
+    # show the imputation happened in place
+    assert trans is X_copy
+    assert not pd.isnull(X_copy).values.any()
+    assert_array_almost_equal(trans.values,
+                              np.array([[1., 2.2, 3.1],
+                                        [1.55, 2.3, 3.1],
+                                        [2.1, 2.1, 3.1]]))
+
+    # and that the default left the original alone
+    assert pd.isnull(X).values.any()
+
+
 def test_bagged_regressor_imputer():
     imputer = BaggedRegressorImputer(random_state=42)
     trans = imputer.fit_transform(X)
@@ -180,3 +199,501 @@ def test_bagged_classifier_continuous():
 
     # fails on continuous data!
     assert_raises(ValueError, imputer.fit, X)
+
+
+def test_selective_imputer_partial_fit():
+    rs = np.random.RandomState(42)
+    X_big = pd.DataFrame.from_records(rs.randint(0, 50, (300, 3)) * 1.,
+                                      columns=['a', 'b', 'c'])
+    X_big = X_big.mask(rs.rand(*X_big.shape) < 0.1)
+    chunks = [X_big.iloc[i:i + 70] for i in range(0, 300, 70)]
+
+    for strategy in ('mean', 'median', 'most_frequent',
+                     ('median', 'mean', 'most_frequent')):
+        fit = SelectiveImputer(strategy=strategy).fit(X_big)
+        imputer = SelectiveImputer(strategy=strategy)
+        for chunk in chunks:
+            imputer.partial_fit(chunk)
+
+        for col in ('a', 'b', 'c'):
+            assert_array_almost_equal(imputer.statistics_[col],
+                                      fit.statistics_[col])
+
+        # and it can transform the same way
+        assert_array_almost_equal(imputer.transform(X_big),
+                                  fit.transform(X_big))
+
+    # a column that's entirely missing so far gets a NaN statistic
+    imputer = SelectiveImputer().partial_fit(X.iloc[[1]])
+    assert np.isnan(imputer.statistics_['a'])
+    imputer.partial_fit(X.iloc[[0]])
+    assert imputer.statistics_['a'] == 1.
+
+    # custom callables cannot be fit incrementally
+    assert_raises(ValueError,
+                  SelectiveImputer(strategy=(lambda *args: 1.)).partial_fit,
+                  X)
+
+    # fit discards the partial state
+    imputer.fit(X)
+    imputer.partial_fit(X.iloc[[2]])
+    assert imputer.statistics_['a'] == 2.1
+
+
+def test_selective_imputer_blocks():
+    # the bulk path must match imputing each column separately
+    rs = np.random.RandomState(42)
+    X_mixed = pd.DataFrame.from_records(rs.rand(50, 4),
+                                        columns=['a', 'b', 'c', 'd'])
+    X_mixed = X_mixed.mask(rs.rand(*X_mixed.shape) < 0.2)
+    X_mixed['e'] = rs.randint(0, 5, 50)
+    X_mixed['f'] = rs.randint(0, 5, 50)
+    X_mixed['g'] = X_mixed['a'].astype(np.float32)
+    X_mixed['h'] = list('abcde') * 10
+
+    for strategy, missing_values in (('mean', 'NaN'),
+                                     ('most_frequent', 'NaN'),
+                                     ('most_frequent', 0)):
+        cols = ['a', 'b', 'c', 'd', 'e', 'f', 'g']
+        imputer = SelectiveImputer(cols=cols, strategy=strategy,
+                                   missing_values=missing_values).fit(X_mixed)
+        trans = imputer.transform(X_mixed)
+
+        expected = X_mixed.copy()
+        for c in cols:
+            expected[c] = expected[c].mask(
+                _get_mask(expected[c], missing_values),
+                imputer.statistics_[c])
+
+        assert_frame_equal(trans, expected)
+
+
+def test_selective_imputer_block_statistics():
+    # the bulk statistics must match calling each strategy on its column
+    rs = np.random.RandomState(42)
+    X_mixed = pd.DataFrame.from_records(rs.rand(50, 3),
+                                        columns=['a', 'b', 'c'])
+    X_mixed = X_mixed.mask(rs.rand(*X_mixed.shape) < 0.2)
+    X_mixed['d'] = rs.randint(0, 5, 50)
+
+    for strategy, missing_values in (('mean', 'NaN'), ('median', 'NaN'),
+                                     ('mean', 0), ('median', 0),
+                                     (('mean', 'median', _mean, 'median'),
+                                      'NaN')):
+        imputer = SelectiveImputer(strategy=strategy,
+                                   missing_values=missing_values).fit(X_mixed)
+        mask = _get_mask(X_mixed, missing_values)
+        for c in X_mixed.columns:
+            expected = imputer.strategy_[c](X_mixed[c], mask[c])
+            assert_array_almost_equal(imputer.statistics_[c], expected)
+
+    # a column with only missing values still fails
+    X_missing = X_mixed.copy()
+    X_missing['a'] = nan
+    assert_raises(ValueError, SelectiveImputer().fit, X_missing)
+
+
+def test_bagged_imputer_parallel_columns():
+    rs = np.random.RandomState(42)
+    X_big = pd.DataFrame.from_records(rs.rand(100, 4),
+                                      columns=['a', 'b', 'c', 'd'])
+
+    # at most one missing value per row, so the order of imputation
+    # doesn't matter
+    for i, c in enumerate(X_big.columns):
+        X_big.loc[i::8, c] = nan
+
+    serial = BaggedRegressorImputer(random_state=42, n_jobs=2).fit(X_big)
+    parallel = BaggedRegressorImputer(random_state=42, n_jobs=2,
+                                      n_jobs_columns=2).fit(X_big)
+
+    # the cores are split between the column jobs
+    assert all(m.n_jobs == 2 for m in serial.models_.values())
+    assert all(m.n_jobs == 1 for m in parallel.models_.values())
+
+    assert_frame_equal(serial.transform(X_big), parallel.transform(X_big))
+
+    # with several missing values per row, the columns are still imputed
+    # in order, so the concurrent fits impute the same values
+    X_big = X_big.mask(rs.rand(*X_big.shape) < 0.3)
+    for max_iter in (1, 3):
+        serial = BaggedRegressorImputer(random_state=42, max_iter=max_iter,
+                                        tol=0.).fit(X_big)
+        parallel = BaggedRegressorImputer(random_state=42, max_iter=max_iter,
+                                          tol=0., n_jobs_columns=2)
+        parallel.fit(X_big)
+        assert_frame_equal(serial.transform(X_big),
+                           parallel.transform(X_big))
+
+
+def test_bagged_imputer_iterative():
+    rs = np.random.RandomState(42)
+    z = rs.rand(200)
+    X_corr = pd.DataFrame.from_records(
+        np.column_stack([z + rs.rand(200) * 0.1 for _ in range(4)]),
+        columns=['a', 'b', 'c', 'd'])
+    X_corr = X_corr.mask(rs.rand(*X_corr.shape) < 0.3)
+
+    single = BaggedRegressorImputer(random_state=42).fit(X_corr)
+    assert single.n_iter_ == 1
+    assert len(single.iter_times_) == 1
+    assert not single.iter_changes_
+
+    imputer = BaggedRegressorImputer(random_state=42, max_iter=5, tol=0.)
+    imputer.fit(X_corr)
+    assert imputer.n_iter_ == 5
+    assert len(imputer.iter_times_) == 5
+    assert len(imputer.iter_changes_) == 4
+    assert all(change >= 0 for change in imputer.iter_changes_)
+
+    trans = imputer.transform(X_corr)
+    assert not pd.isnull(trans).values.any()
+
+    # the present values are left alone
+    present = ~pd.isnull(X_corr).values
+    assert_array_equal(trans.values[present], X_corr.values[present])
+
+    # a loose tolerance stops after the first refinement
+    loose = BaggedRegressorImputer(random_state=42, max_iter=5, tol=np.inf)
+    assert loose.fit(X_corr).n_iter_ == 2
+
+    assert_raises(ValueError,
+                  BaggedRegressorImputer(max_iter=0).fit, X_corr)
+
+
+def test_bagged_imputer_iterative_row_parity():
+    # transform runs exactly n_iter_ - 1 refinements (with no early stop),
+    # so every row imputes the same in a batch, alone, or row-wise
+    rs = np.random.RandomState(42)
+    z = rs.rand(200)
+    X_corr = pd.DataFrame.from_records(
+        np.column_stack([z + rs.rand(200) * 0.1 for _ in range(4)]),
+        columns=['a', 'b', 'c', 'd'])
+    X_corr = X_corr.mask(rs.rand(*X_corr.shape) < 0.3)
+
+    imputer = BaggedRegressorImputer(random_state=42, max_iter=8, tol=0.05)
+    imputer.fit(X_corr)
+    assert imputer.n_iter_ > 1
+
+    batch = imputer.transform(X_corr)
+    transform_row = imputer._row_transformer()
+    for i in np.flatnonzero(pd.isnull(X_corr).any(axis=1).values)[:20]:
+        row = transform_row(X_corr.iloc[i].to_dict())
+        assert_array_almost_equal([row[c] for c in X_corr.columns],
+                                  batch.values[i])
+        assert_array_almost_equal(
+            imputer.transform(X_corr.iloc[[i]]).values[0], batch.values[i])
+
+
+def test_bagged_imputer_compact():
+    rs = np.random.RandomState(42)
+    X_corr = pd.DataFrame.from_records(rs.rand(300, 4),
+                                       columns=['a', 'b', 'c', 'd'])
+    X_corr['e'] = (X_corr['a'] > 0.5).astype(float)
+    X_corr = X_corr.mask(rs.rand(*X_corr.shape) < 0.2)
+
+    for imputer_class, cols in ((BaggedRegressorImputer, ['a', 'b', 'c']),
+                                (BaggedClassifierImputer, ['e'])):
+        full = imputer_class(cols=cols, random_state=42).fit(X_corr)
+        compact = imputer_class(cols=cols, random_state=42,
+                                compact=True).fit(X_corr)
+
+        before, after = compact.model_nbytes_
+        assert after < before
+
+        # the compact models impute the same values
+        assert_array_almost_equal(full.transform(X_corr).values,
+                                  compact.transform(X_corr).values)
+
+        row = X_corr.iloc[np.flatnonzero(
+            pd.isnull(X_corr[cols]).any(axis=1))[0]].to_dict()
+        compact_row = compact._row_transformer()(dict(row))
+        full_row = full._row_transformer()(dict(row))
+        assert_array_almost_equal([compact_row[c] for c in cols],
+                                  [full_row[c] for c in cols])
+
+    # models of other estimators are left alone
+    from sklearn.neighbors import KNeighborsRegressor
+    import warnings
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        knn = BaggedRegressorImputer(base_estimator=KNeighborsRegressor(),
+                                     cols=['a'], compact=True).fit(X_corr)
+    assert any("compacted" in str(warning.message) for warning in w)
+    assert knn.models_['a'].__class__.__name__ == 'BaggingRegressor'
+
+
+def test_knn_imputer():
+    rs = np.random.RandomState(42)
+    X_knn = pd.DataFrame.from_records(rs.rand(100, 4),
+                                      columns=['a', 'b', 'c', 'd'])
+    X_knn = X_knn.mask(rs.rand(*X_knn.shape) < 0.1)
+
+    imputer = KNNImputer(n_neighbors=3).fit(X_knn)
+    trans = imputer.transform(X_knn)
+    assert not pd.isnull(trans).values.any()
+
+    # compare to a brute-force search over the present coordinates
+    values = X_knn.values
+    complete = values[~np.isnan(values).any(axis=1)]
+    for i in np.where(np.isnan(values).any(axis=1))[0]:
+        present = ~np.isnan(values[i])
+        distances = np.sqrt(((complete[:, present] -
+                              values[i, present]) ** 2).sum(axis=1))
+        nearest = complete[np.argsort(distances)[:3]]
+        assert_array_almost_equal(trans.values[i, ~present],
+                                  nearest[:, ~present].mean(axis=0))
+
+    # batching doesn't change anything
+    imputer.set_params(batch_size=2)
+    assert_frame_equal(imputer.transform(X_knn), trans)
+
+    # only the specified columns are imputed
+    trans = KNNImputer(cols=['a'], n_neighbors=3).fit_transform(X_knn)
+    assert not pd.isnull(trans['a']).any()
+    assert_frame_equal(trans[['b', 'c', 'd']], X_knn[['b', 'c', 'd']])
+
+    assert_raises(ValueError, KNNImputer(n_neighbors=1000).fit, X_knn)
+    assert_raises(ValueError, KNNImputer(weights='foo').fit, X_knn)
+
+
+def test_knn_imputer_index():
+    # by default, the predictors are the columns that aren't imputed, so
+    # the rows missing only imputed values are searched with the index
+    rs = np.random.RandomState(42)
+    X_knn = pd.DataFrame.from_records(rs.rand(100, 4),
+                                      columns=['a', 'b', 'c', 'd'])
+    X_knn = X_knn.mask(rs.rand(*X_knn.shape) < 0.1)
+
+    imputer = KNNImputer(cols=['a'], n_neighbors=3).fit(X_knn)
+    assert imputer.predictors_ == ['b', 'c', 'd']
+
+    queried = []
+    kneighbors = imputer.index_.kneighbors
+
+    def _kneighbors(X):
+        queried.append(X.shape[0])
+        return kneighbors(X)
+
+    imputer.index_.kneighbors = _kneighbors
+    trans = imputer.transform(X_knn)
+
+    values = X_knn.values
+    indexed = np.where(np.isnan(values[:, 0]) &
+                       ~np.isnan(values[:, 1:]).any(axis=1))[0]
+    assert indexed.shape[0] > 0
+    assert sum(queried) == indexed.shape[0]
+
+    # the index finds the same neighbors as a brute-force search
+    complete = values[~np.isnan(values).any(axis=1)]
+    for i in indexed:
+        distances = np.sqrt(((complete[:, 1:] - values[i, 1:]) ** 2)
+                            .sum(axis=1))
+        nearest = complete[np.argsort(distances)[:3]]
+        assert_array_almost_equal(trans.values[i, 0], nearest[:, 0].mean())
+
+
+def test_knn_imputer_many_patterns():
+    # many distinct patterns of missing predictors are searched without
+    # keeping any state per pattern
+    rs = np.random.RandomState(42)
+    X_knn = pd.DataFrame.from_records(rs.rand(600, 12))
+    X_knn = X_knn.mask(rs.rand(*X_knn.shape) < 0.1)
+
+    imputer = KNNImputer(n_neighbors=4, weights='distance').fit(X_knn)
+    state = set(vars(imputer))
+    trans = imputer.transform(X_knn)
+    assert set(vars(imputer)) == state
+    assert not pd.isnull(trans).values.any()
+
+    values = X_knn.values
+    incomplete = np.where(np.isnan(values).any(axis=1))[0]
+    assert len(set(tuple(np.isnan(values[i])) for i in incomplete)) > 50
+
+    # compare to a brute-force search over the present coordinates
+    complete = values[~np.isnan(values).any(axis=1)]
+    for i in incomplete:
+        present = ~np.isnan(values[i])
+        distances = np.sqrt(((complete[:, present] -
+                              values[i, present]) ** 2).sum(axis=1))
+        nearest = np.argsort(distances)[:4]
+        weights = 1. / distances[nearest]
+        expected = (complete[nearest][:, ~present] *
+                    weights[:, np.newaxis]).sum(axis=0) / weights.sum()
+        assert_array_almost_equal(trans.values[i, ~present], expected)
+
+
+def test_selective_imputer_group_by():
+    X_groups = pd.DataFrame({
+        'store': ['a', 'a', 'a', 'b', 'b', 'b', 'c'],
+        'region': [1, 1, 2, 1, 1, 1, 2],
+        'sales': [1., 3., nan, 10., nan, 20., nan],
+        'units': [2., 2., 5., nan, 7., 7., 1.]},
+        columns=['store', 'region', 'sales', 'units'])
+
+    imputer = SelectiveImputer(group_by='store', strategy='median')
+    trans = imputer.fit_transform(X_groups)
+
+    # the group columns aren't imputed
+    assert set(imputer.statistics_.keys()) == {'region', 'sales', 'units'}
+    # group c has no present sales, so it falls back to the global median
+    assert_array_almost_equal(trans['sales'].values,
+                              [1., 3., 2., 10., 15., 20., 6.5])
+    assert_array_almost_equal(trans['units'].values,
+                              [2., 2., 5., 7., 7., 7., 1.])
+
+    # groups unseen in fit fall back to the global statistics
+    X_new = pd.DataFrame({'store': ['a', 'z'], 'region': [1, 1],
+                          'sales': [nan, nan], 'units': [nan, nan]},
+                         columns=['store', 'region', 'sales', 'units'])
+    assert_array_almost_equal(imputer.transform(X_new)['sales'].values,
+                              [2., 6.5])
+
+    # and the compiled single rows agree
+    score_row = imputer.to_row_transformer()
+    for i in range(X_new.shape[0]):
+        row = score_row(X_new.iloc[i].to_dict())
+        assert_array_almost_equal([row['sales'], row['units']],
+                                  imputer.transform(X_new)
+                                  [['sales', 'units']].values[i])
+
+    # multiple group columns and the mode
+    imputer = SelectiveImputer(cols=['units'], group_by=['store', 'region'],
+                               strategy='most_frequent').fit(X_groups)
+    assert_array_almost_equal(imputer.transform(X_groups)['units'].values,
+                              [2., 2., 5., 7., 7., 7., 1.])
+
+    # custom callables are applied to each group
+    imputer = SelectiveImputer(cols=['sales'], group_by='store',
+                               strategy=(lambda s, m: s[~m].max()))
+    assert_array_almost_equal(imputer.fit_transform(X_groups)['sales'],
+                              [1., 3., 3., 10., 20., 20., 20.])
+
+    assert_raises(ValueError, SelectiveImputer(
+        cols=['store', 'sales'], group_by='store').fit, X_groups)
+    assert_raises(ValueError, SelectiveImputer(
+        group_by='store').partial_fit, X_groups)
+
+
+def test_selective_imputer_sparse_mask():
+    rs = np.random.RandomState(42)
+    X_wide = pd.DataFrame.from_records(rs.rand(100, 5),
+                                       columns=['a', 'b', 'c', 'd', 'e'])
+    X_wide = X_wide.mask(rs.rand(*X_wide.shape) < 0.05)
+
+    for strategy in ('mean', 'median', 'most_frequent',
+                     (lambda s, m: s[~m].min())):
+        dense = SelectiveImputer(strategy=strategy).fit(X_wide)
+        sparse = SelectiveImputer(strategy=strategy,
+                                  sparse_mask=True).fit(X_wide)
+
+        for c in X_wide.columns:
+            assert_array_almost_equal(sparse.statistics_[c],
+                                      dense.statistics_[c])
+        assert_frame_equal(sparse.transform(X_wide), dense.transform(X_wide))
+
+    # in place, only the holes are written
+    X_copy = X_wide.copy()
+    trans = SelectiveImputer(sparse_mask=True, copy=False).fit_transform(
+        X_copy)
+    assert trans is X_copy
+    assert not pd.isnull(X_copy).values.any()
+
+
+def test_time_series_imputer():
+    rs = np.random.RandomState(42)
+    stream = pd.DataFrame({'entity': rs.randint(0, 3, 200),
+                           'a': rs.rand(200), 'b': rs.rand(200)},
+                          columns=['entity', 'a', 'b'])
+    stream[['a', 'b']] = stream[['a', 'b']].mask(rs.rand(200, 2) < 0.3)
+    batches = [stream.iloc[i:i + 30] for i in range(0, 200, 30)]
+
+    # forward fill streamed in batches matches the whole stream, with or
+    # without entities
+    for by, expected in ((None, stream.ffill()),
+                         ('entity', stream.groupby('entity').ffill())):
+        imputer = TimeSeriesImputer(by=by).fit(stream)
+        streamed = pd.concat([imputer.transform(b) for b in batches])
+        assert_array_almost_equal(streamed[['a', 'b']].values,
+                                  expected[['a', 'b']].values)
+
+    # fit resets the tails
+    imputer.fit(stream)
+    assert imputer.tails_ == {'a': {}, 'b': {}}
+
+    # within a single batch, interpolation matches pandas
+    imputer = TimeSeriesImputer(strategy='interpolate').fit(stream)
+    assert_array_almost_equal(imputer.transform(stream)[['a', 'b']].values,
+                              stream[['a', 'b']].interpolate().values)
+
+    # and the line continues from the previous batch
+    imputer = TimeSeriesImputer(cols=['a'], strategy='interpolate')
+    imputer.fit(stream)
+    first = imputer.transform(pd.DataFrame({'a': [1., nan]}))
+    assert_array_almost_equal(first['a'], [1., 1.])
+    second = imputer.transform(pd.DataFrame({'a': [nan, 4.]}))
+    assert_array_almost_equal(second['a'], [3., 4.])
+
+    # backward fill looks within the batch, and fills the end forward
+    imputer = TimeSeriesImputer(cols=['a'], strategy='bfill').fit(stream)
+    trans = imputer.transform(pd.DataFrame({'a': [nan, 2., nan, 3., nan]}))
+    assert_array_almost_equal(trans['a'], [2., 2., 3., 3., 3.])
+
+    assert_raises(ValueError, TimeSeriesImputer(strategy='foo').fit, stream)
+    assert_raises(ValueError,
+                  TimeSeriesImputer(cols=['a', 'entity'], by='entity').fit,
+                  stream)
+
+
+def test_time_series_imputer_missing_by():
+    # the rows missing an entity are filled (and keep their tails) as an
+    # entity of their own, rather than being dropped by the groupby
+    rs = np.random.RandomState(42)
+    stream = pd.DataFrame({'entity': rs.randint(0, 3, 200) * 1.,
+                           'a': rs.rand(200)}, columns=['entity', 'a'])
+    stream['entity'] = stream['entity'].mask(rs.rand(200) < 0.2)
+    stream['a'] = stream['a'].mask(rs.rand(200) < 0.3)
+    batches = [stream.iloc[i:i + 30] for i in range(0, 200, 30)]
+
+    imputer = TimeSeriesImputer(cols=['a'], by='entity').fit(stream)
+    streamed = pd.concat([imputer.transform(b) for b in batches])
+    expected = stream['a'].groupby(stream['entity'].fillna(-1)).ffill()
+    assert_array_almost_equal(streamed['a'].values, expected.values)
+    assert None in imputer.tails_['a']
+
+
+def test_selective_imputer_approx_strategies():
+    import skoot.impute as impute
+
+    rs = np.random.RandomState(42)
+    X_big = pd.DataFrame.from_records(rs.randint(0, 40, (1000, 2)) * 1.,
+                                      columns=['a', 'b'])
+    X_big = X_big.mask(rs.rand(*X_big.shape) < 0.1)
+
+    exact = SelectiveImputer(strategy=('median', 'most_frequent')).fit(X_big)
+
+    # sketch in many small chunks, serially and in parallel
+    chunk_size = impute._SKETCH_CHUNK_SIZE
+    impute._SKETCH_CHUNK_SIZE = 64
+    try:
+        for n_jobs in (1, 2):
+            approx = SelectiveImputer(
+                strategy=('approx_median', 'approx_most_frequent'),
+                n_jobs=n_jobs).fit(X_big)
+
+            # exact with few distinct values
+            assert approx.statistics_ == exact.statistics_
+    finally:
+        impute._SKETCH_CHUNK_SIZE = chunk_size
+
+    # they can be fit incrementally too
+    imputer = SelectiveImputer(
+        strategy=('approx_median', 'approx_most_frequent'))
+    for chunk in np.array_split(X_big, 4):
+        imputer.partial_fit(chunk)
+    assert imputer.statistics_ == exact.statistics_
+
+    X_missing = X_big.copy()
+    X_missing['a'] = nan
+    assert_raises(ValueError,
+                  SelectiveImputer(strategy='approx_median').fit, X_missing)
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from sklearn.pipeline import Pipeline
+
+from skoot.datasets import load_iris_df
+from skoot.decomposition import SelectivePCA
+from skoot.feature_extraction import (InteractionTermTransformer,
+                                      DateFactorizer)
+from skoot.feature_selection import FeatureFilter, MultiCorrFilter
+from skoot.impute import SelectiveImputer, BaggedRegressorImputer
+from skoot.preprocessing import (BinningTransformer, DateTransformer,
+                                 DummyEncoder, SchemaNormalizer,
+                                 SelectiveStandardScaler,
+                                 YeoJohnsonTransformer)
+from skoot.pipeline import (FusedPipeline, to_row_transformer,
+                            transform_chunks)
+from skoot.utils.testing import assert_raises
+
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+from pandas.util.testing import assert_frame_equal
+
+X = load_iris_df(include_tgt=False, names=['a', 'b', 'c', 'd'])
+X.loc[[3, 17, 42], 'a'] = np.nan
+X.loc[[5, 9], 'c'] = np.nan
+X['e'] = ['x', 'y', 'z'] * 50
+
+
+def _assert_rows_match(est, X_test):
+    compiled = est.to_row_transformer() if hasattr(est, "to_row_transformer") \
+        else to_row_transformer(est)
+
+    for i in range(X_test.shape[0]):
+        row = X_test.iloc[[i]]
+        expected = est.transform(row)
+        out = compiled(OrderedDict(zip(row.columns, row.values[0])))
+
+        if isinstance(expected, pd.DataFrame):
+            assert list(out.keys()) == expected.columns.tolist()
+            expected = expected.values
+            out = np.array(list(out.values()), dtype=expected.dtype)
+
+        expected = expected[0]
+        if expected.dtype.kind in "fc":
+            assert_array_almost_equal(out.astype(float), expected)
+        else:
+            assert_array_equal(out, expected)
+
+
+def test_compiled_transformers():
+    X_num = X[['a', 'b', 'c', 'd']]
+    X_filled = X_num.fillna(0.)
+
+    for est, X_fit in (
+            (SelectiveImputer(), X_num),
+            (SelectiveImputer(strategy="most_frequent", as_df=False), X_num),
+            (BaggedRegressorImputer(random_state=1, n_estimators=3), X_num),
+            (BinningTransformer(cols=['a', 'b'], n_bins=4), X_filled),
+            (BinningTransformer(cols=['a'], overwrite=False,
+                                return_bin_label=False), X_filled),
+            (YeoJohnsonTransformer(cols=['b', 'd']), X_filled),
+            (SelectiveStandardScaler(cols=['a', 'c']), X_filled),
+            (SelectivePCA(n_components=2), X_filled),
+            (FeatureFilter(cols=['b']), X_filled),
+            (InteractionTermTransformer(cols=['a', 'b', 'c']), X_filled),
+            (SchemaNormalizer(schema={'a': int}), X_filled),
+            (DummyEncoder(cols=['e']), X),
+            (DummyEncoder(cols=['e'], drop_one_level=False), X)):
+
+        est.fit(X_fit)
+        _assert_rows_match(est, X_fit.iloc[:20])
+
+
+def test_compiled_pipeline():
+    pipe = Pipeline([
+        ('impute', SelectiveImputer(cols=['a', 'c'])),
+        ('dummy', DummyEncoder(cols=['e'], handle_unknown='ignore')),
+        ('bin', BinningTransformer(cols=['d'], n_bins=3)),
+        ('dummy_bins', DummyEncoder(cols=['d'])),
+        ('scale', SelectiveStandardScaler(cols=['a', 'b'], as_df=False)),
+        ('pca', SelectivePCA(cols=[0, 1, 2], n_components=2, as_df=False))
+    ]).fit(X)
+
+    _assert_rows_match(pipe, X.iloc[:20])
+
+    # an unseen level is ignored, just like in transform
+    unseen = X.iloc[[0]].copy()
+    unseen['e'] = 'new'
+    _assert_rows_match(pipe, unseen)
+
+    # array input is labelled by position
+    X_arr = X[['a', 'b', 'c', 'd']].fillna(0.).values
+    scaler = SelectiveStandardScaler(cols=[1], as_df=False).fit(X_arr)
+    assert_array_almost_equal(scaler.to_row_transformer()(X_arr[0]),
+                              scaler.transform(X_arr[:1])[0])
+
+
+def test_compiled_unsupported():
+    factorizer = DateFactorizer(cols=['a'])
+    assert_raises(NotImplementedError, factorizer.to_row_transformer)
+
+    # not a skoot transformer
+    assert_raises(TypeError, to_row_transformer,
+                  Pipeline([('pca', SelectivePCA().estimator_)]))
+
+
+def test_compiled_dummy_encoder_unknown():
+    encoder = DummyEncoder(cols=['e'], handle_unknown='error').fit(X)
+    compiled = encoder.to_row_transformer()
+    assert_raises(ValueError, compiled, {'e': 'new'})
+    assert compiled({'e': 'x'}) == OrderedDict([('e_x', 1.), ('e_y', 0.)])
+
+
+def test_transform_chunks():
+    X_dates = X.copy()
+    X_dates['f'] = pd.date_range('2018-01-01', periods=X.shape[0])
+    X_dates.loc[[120, 121], 'f'] = pd.NaT  # only in the last chunk
+
+    pipe = Pipeline([
+        ('impute', SelectiveImputer(cols=['a', 'c'])),
+        ('dates', DateFactorizer(cols=['f'], features=("year", "month"))),
+        ('dummy', DummyEncoder(cols=['e'], handle_unknown='ignore'))
+    ]).fit(X_dates)
+
+    # the first chunk only contains one level of 'e' and has no NaTs
+    chunks = [X_dates.iloc[::3].iloc[:25], X_dates.iloc[25:100],
+              X_dates.iloc[100:]]
+    transformed = list(transform_chunks(pipe, chunks))
+    assert len(transformed) == 3
+
+    expected = pipe.transform(X_dates.iloc[::3].iloc[:25])
+    for chunk, trans in zip(chunks, transformed):
+        assert trans.columns.equals(expected.columns)
+        assert trans.dtypes.equals(expected.dtypes)
+        assert_array_almost_equal(trans.values.astype(float),
+                                  pipe.transform(chunk).values.astype(float))
+
+    # the single transformer API is lazy and works the same way
+    encoder = pipe.steps[-1][1]
+    gen = encoder.transform_chunks(iter([]))
+    assert list(gen) == []
+
+
+def test_transform_chunks_unsafe_cast():
+    X_int = pd.DataFrame.from_records([[1, 2], [3, 4]], columns=['a', 'b'])
+    X_nan = pd.DataFrame.from_records([[1., np.nan]], columns=['a', 'b'])
+    ffilter = FeatureFilter().fit(X_int)
+
+    # the int column now has a NaN in it
+    gen = ffilter.transform_chunks([X_int, X_nan])
+    next(gen)
+    assert_raises(ValueError, next, gen)
+
+    # but upcasting is fine
+    X_float = X_int.astype(float)
+    out = list(ffilter.transform_chunks([X_float, X_int]))
+    assert out[1].dtypes.tolist() == [np.float64, np.float64]
+
+
+def test_fused_pipeline():
+    X_dates = X.copy()
+    X_dates['b'] = X_dates['b'].astype(str)
+    X_dates['f'] = pd.date_range('2018-01-01', periods=X.shape[0],
+                                 freq='H').strftime('%Y-%m-%d %H:%M')
+    X_dates.loc[[7, 8], 'f'] = None
+
+    dates = [('schema', SchemaNormalizer(schema={'b': float})),
+             ('to_date', DateTransformer(cols=['f'])),
+             ('dates', DateFactorizer(cols=['f'])),
+             ('impute', SelectiveImputer(cols=['a', 'c', 'f_year',
+                                               'f_month', 'f_day',
+                                               'f_hour']))]
+    for steps in (
+            dates + [('dummy', DummyEncoder(cols=['e'])),
+                     ('corr', MultiCorrFilter(threshold=0.8))],
+
+            # not fusable, so applied to a frame
+            dates + [('scale', SelectiveStandardScaler(cols=['a', 'b'])),
+                     ('dummy', DummyEncoder(cols=['e']))],
+
+            # outputs an array, so the next step gets positional columns
+            dates + [('dummy', DummyEncoder(cols=['e'], as_df=False)),
+                     ('select', FeatureFilter(cols=[0, 1]))],
+            dates + [('dummy', DummyEncoder(cols=['e'], as_df=False))]):
+
+        pipe = Pipeline(steps).fit(X_dates)
+        expected = pipe.transform(X_dates)
+        fused = FusedPipeline(steps).transform(X_dates)
+
+        if isinstance(expected, pd.DataFrame):
+            assert_frame_equal(fused, expected)
+        else:
+            assert_array_equal(fused, expected)
+
+
+def test_fused_pipeline_duplicate_columns():
+    # the dummy column 'e_x' duplicates an existing one, so it's not fused
+    X_dup = X.copy()
+    X_dup['e_x'] = 1.
+    pipe = FusedPipeline([
+        ('dummy', DummyEncoder(cols=['e'])),
+        ('select', FeatureFilter(cols=['a']))
+    ]).fit(X_dup)
+
+    out = pipe.transform(X_dup)
+    assert out.columns.tolist().count('e_x') == 2
+    assert_frame_equal(out, Pipeline(pipe.steps).transform(X_dup))
+
+    # errors are raised just as in transform
+    assert_raises(ValueError, pipe.transform, X_dup.drop('e', axis=1))
@@ -36,6 +36,16 @@ _as_df_doc = "    " + \
         default.
         """
 
+_copy_doc = "    " + \
+    """copy : bool, optional (default=True)
+        Whether to operate on a copy of the input frame in ``transform``.
+        If False, transformers that write to the frame (overwriting or
+        appending columns) will do so in place, mutating the input ``X``.
+        Only set this to False when the caller owns the frame (e.g., for
+        all but the first step of a ``Pipeline``). Transformers that build
+        a new frame are unaffected.
+        """
+
 _trans_col_name_doc = "    " + \
     """trans_col_name : str, unicode or iterable, optional
         The name or list of names to apply to the transformed column(s).
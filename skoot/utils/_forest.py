@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+#
+# Author: Taylor Smith <taylor.smith@alkaline-ml.com>
+#
+# Compact, predict-only copies of fitted bagged tree ensembles. Every tree
+# of a BaggingRegressor or BaggingClassifier is flattened into one set of
+# array-backed node tables, without the estimators, their training-only
+# attributes (impurities, sample counts, bootstrap samples, ...) or the
+# per-object overhead of pickling each tree. Prediction walks all of the
+# trees for all of the samples at once, one level per step.
+
+from __future__ import division, absolute_import
+
+import numpy as np
+
+from sklearn.ensemble import BaggingClassifier, BaggingRegressor
+from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
+from sklearn.externals.six.moves import cPickle as pickle
+
+__all__ = [
+    'CompactBaggingClassifier',
+    'CompactBaggingRegressor',
+    'compact_bagging',
+    'pickled_nbytes'
+]
+
+# The number of samples walked through the trees at once in predict, which
+# bounds the (n_samples, n_trees) arrays of nodes
+PREDICT_BATCH_SIZE = 65536
+
+
+def pickled_nbytes(obj):
+    """The size of an object, in bytes, once pickled."""
+    return len(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _flatten_trees(model, tree_value):
+    # Concatenate the node tables of the model's trees, offsetting the
+    # children of each tree by the number of nodes before it, and mapping
+    # each split's feature from the tree's feature subset to a column of X.
+    # Leaves keep -1 as their children (and 0 as their feature)
+    roots, left, right, feature, threshold, value = [], [], [], [], [], []
+    n_nodes = 0
+
+    for est, features in zip(model.estimators_, model.estimators_features_):
+        tree = est.tree_
+        leaf = tree.children_left == -1
+        roots.append(n_nodes)
+        left.append(np.where(leaf, -1, tree.children_left + n_nodes))
+        right.append(np.where(leaf, -1, tree.children_right + n_nodes))
+        feature.append(np.asarray(features)[np.where(leaf, 0,
+                                                     tree.feature)])
+        threshold.append(tree.threshold)
+        value.append(tree_value(est))
+        n_nodes += tree.node_count
+
+    index_dtype = np.int32 if n_nodes < 2 ** 31 else np.int64
+    return (np.asarray(roots, dtype=index_dtype),
+            np.concatenate(left).astype(index_dtype),
+            np.concatenate(right).astype(index_dtype),
+            np.concatenate(feature).astype(index_dtype),
+            np.concatenate(threshold).astype(np.float64),
+            np.concatenate(value).astype(np.float64))
+
+
+class _CompactBagging(object):
+    def __init__(self, model, tree_value):
+        self.n_features_ = model.n_features_
+        (self.roots_, self.left_, self.right_, self.feature_,
+         self.threshold_, self.value_) = _flatten_trees(model, tree_value)
+
+    @property
+    def n_estimators(self):
+        return self.roots_.shape[0]
+
+    @property
+    def nbytes(self):
+        """The total size of the node tables, in bytes."""
+        return sum(a.nbytes for a in (self.roots_, self.left_, self.right_,
+                                      self.feature_, self.threshold_,
+                                      self.value_))
+
+    def _validate_X(self, X):
+        # Like the trees, compare the features as float32 against the
+        # (float64) thresholds, so the splits go the same way
+        X = np.asarray(X, dtype=np.float64).astype(np.float32)
+        if X.ndim != 2 or X.shape[1] != self.n_features_:
+            raise ValueError("Expected X with %i features, but got shape %r"
+                             % (self.n_features_, X.shape))
+        return X
+
+    def _apply(self, X):
+        # The leaf each sample reaches in each tree, shape
+        # (n_samples, n_trees). All the (sample, tree) pairs descend a
+        # level at a time, and drop out of the walk once they reach a leaf
+        n_samples, n_trees = X.shape[0], self.n_estimators
+        left, right = self.left_, self.right_
+        nodes = np.tile(self.roots_, n_samples)
+        rows = np.repeat(np.arange(n_samples), n_trees)
+
+        active = np.flatnonzero(left[nodes] != -1)
+        while active.shape[0]:
+            node = nodes[active]
+            go_left = X[rows[active], self.feature_[node]] <= \
+                self.threshold_[node]
+            node = np.where(go_left, left[node], right[node])
+            nodes[active] = node
+            active = active[left[node] != -1]
+
+        return nodes.reshape(n_samples, n_trees)
+
+    def apply(self, X):
+        """Get the leaf (in the flat node tables) of each sample in each tree.
+
+        Parameters
+        ----------
+        X : array-like, shape=(n_samples, n_features)
+            The samples.
+
+        Returns
+        -------
+        leaves : np.ndarray, shape=(n_samples, n_estimators)
+            The index of the leaf each sample reaches in each tree.
+        """
+        return self._apply(self._validate_X(X))
+
+    def _mean_value(self, X):
+        # the mean over the trees of the value of each sample's leaves,
+        # computed in batches of samples
+        X = self._validate_X(X)
+        out = np.empty((X.shape[0],) + self.value_.shape[1:],
+                       dtype=np.float64)
+        for i in range(0, X.shape[0], PREDICT_BATCH_SIZE):
+            leaves = self._apply(X[i:i + PREDICT_BATCH_SIZE])
+            out[i:i + PREDICT_BATCH_SIZE] = self.value_[leaves].mean(axis=1)
+        return out
+
+
+class CompactBaggingRegressor(_CompactBagging):
+    """A compact, predict-only copy of a fitted ``BaggingRegressor``.
+
+    The model's decision trees are flattened into a single set of node
+    tables, and its prediction is the mean of the trees' leaf values, as
+    in ``BaggingRegressor.predict``.
+
+    Parameters
+    ----------
+    model : BaggingRegressor
+        The fitted model, whose estimators must be single-output decision
+        trees.
+    """
+    def __init__(self, model):
+        super(CompactBaggingRegressor, self).__init__(
+            model, lambda est: est.tree_.value[:, 0, 0])
+
+    def predict(self, X):
+        """Predict the target of each sample.
+
+        Parameters
+        ----------
+        X : array-like, shape=(n_samples, n_features)
+            The samples.
+
+        Returns
+        -------
+        y : np.ndarray, shape=(n_samples,)
+            The predictions.
+        """
+        return self._mean_value(X)
+
+
+def _tree_proba(n_classes):
+    # The class probabilities of each node of a bagged tree (the fractions
+    # of its weighted samples), mapped into the bagging model's classes,
+    # which a tree fit on a bootstrap sample may not all have seen
+    def _proba(est):
+        counts = est.tree_.value[:, 0, :est.n_classes_]
+        normalizer = counts.sum(axis=1)[:, np.newaxis]
+        normalizer[normalizer == 0.] = 1.
+
+        proba = np.zeros((counts.shape[0], n_classes), dtype=np.float64)
+        proba[:, np.asarray(est.classes_, dtype=np.intp)] = \
+            counts / normalizer
+        return proba
+    return _proba
+
+
+class CompactBaggingClassifier(_CompactBagging):
+    """A compact, predict-only copy of a fitted ``BaggingClassifier``.
+
+    The model's decision trees are flattened into a single set of node
+    tables, each leaf holding the class probabilities of its tree. The
+    predicted class is the one with the highest mean probability over the
+    trees, as in ``BaggingClassifier.predict``.
+
+    Parameters
+    ----------
+    model : BaggingClassifier
+        The fitted model, whose estimators must be single-output decision
+        trees.
+    """
+    def __init__(self, model):
+        self.classes_ = model.classes_
+        super(CompactBaggingClassifier, self).__init__(
+            model, _tree_proba(model.n_classes_))
+
+    def predict_proba(self, X):
+        """Predict the class probabilities of each sample.
+
+        Parameters
+        ----------
+        X : array-like, shape=(n_samples, n_features)
+            The samples.
+
+        Returns
+        -------
+        proba : np.ndarray, shape=(n_samples, n_classes)
+            The mean class probabilities over the trees.
+        """
+        return self._mean_value(X)
+
+    def predict(self, X):
+        """Predict the class of each sample.
+
+        Parameters
+        ----------
+        X : array-like, shape=(n_samples, n_features)
+            The samples.
+
+        Returns
+        -------
+        y : np.ndarray, shape=(n_samples,)
+            The predicted classes.
+        """
+        return self.classes_.take(np.argmax(self.predict_proba(X), axis=1),
+                                  axis=0)
+
+
+_COMPACT_CLASSES = ((BaggingRegressor, DecisionTreeRegressor,
+                     CompactBaggingRegressor),
+                    (BaggingClassifier, DecisionTreeClassifier,
+                     CompactBaggingClassifier))
+
+
+def compact_bagging(model):
+    """Compact a fitted bagged ensemble of decision trees.
+
+    Parameters
+    ----------
+    model : BaggingRegressor or BaggingClassifier
+        The fitted model. Its estimators must be single-output decision
+        trees (the default base estimator).
+
+    Returns
+    -------
+    compact : CompactBaggingRegressor or CompactBaggingClassifier
+        The predict-only copy of the model.
+
+    Raises
+    ------
+    TypeError
+        If the model is not a bagged ensemble of decision trees.
+    """
+    for bagging_class, tree_class, compact_class in _COMPACT_CLASSES:
+        if isinstance(model, bagging_class):
+            if not all(isinstance(est, tree_class) and est.n_outputs_ == 1
+                       for est in model.estimators_):
+                break
+            return compact_class(model)
+
+    raise TypeError("Only bagged ensembles of single-output decision trees "
+                    "can be compacted, but got %s"
+                    % type(model).__name__)
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+#
+# Author: Taylor Smith <taylor.smith@alkaline-ml.com>
+#
+# A compact index of the missing values in a frame. Rather than a boolean
+# frame the same shape as the data, the positions of the missing values in
+# each column are recorded in a single scan, so wide frames with only a few
+# holes can be imputed (or summarized) without densifying a mask.
+
+from __future__ import division, absolute_import
+
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from .iterables import is_iterable
+
+__all__ = [
+    'MissingIndex'
+]
+
+
+def _column_mask(values, missing_values):
+    # the boolean mask of the missing values in a single column's values
+    if missing_values == 'NaN':
+        return pd.isnull(values)
+    return values == missing_values
+
+
+class MissingIndex(object):
+    """The positions of the missing values in each column of a frame.
+
+    The frame is scanned one column at a time, so at most one column's
+    boolean mask exists at once. Columns with few missing values store the
+    (sorted) row positions of their holes, COO-style, while columns where
+    that would be larger than a bitmask store their mask packed into bits.
+    Either way, a column never takes more than one bit per row (or a few
+    bytes per missing value).
+
+    Parameters
+    ----------
+    X : pd.DataFrame, shape=(n_samples, n_features)
+        The frame to index.
+
+    cols : array-like or None, optional (default=None)
+        The columns to index. If None, all of the columns are indexed.
+
+    missing_values : integer or "NaN", optional (default="NaN")
+        The placeholder for the missing values. For missing values encoded
+        as np.nan (or None), use the string value "NaN".
+    """
+    def __init__(self, X, cols=None, missing_values="NaN"):
+        if cols is None:
+            cols = X.columns.tolist()
+        elif not is_iterable(cols):
+            cols = [cols]
+
+        self.index = X.index
+        self.n_samples = n_samples = X.shape[0]
+        self.missing_values = missing_values
+
+        # positions fit in 32 bits unless the frame is enormous
+        dtype = np.int32 if n_samples < 2 ** 31 else np.int64
+        max_positions = (n_samples // 8) // np.dtype(dtype).itemsize
+
+        self._columns = OrderedDict()
+        for c in cols:
+            mask = np.asarray(_column_mask(X[c].values, missing_values),
+                              dtype=bool)
+            count = int(mask.sum())
+            if count <= max_positions:
+                self._columns[c] = (count, np.flatnonzero(mask).astype(dtype))
+            else:
+                self._columns[c] = (count, np.packbits(mask))
+
+    @property
+    def columns(self):
+        """The indexed columns."""
+        return list(self._columns.keys())
+
+    def count(self, col):
+        """The number of missing values in a column."""
+        return self._columns[col][0]
+
+    def counts(self):
+        """The number of missing values in each column, in order."""
+        return np.array([count for count, _ in self._columns.values()],
+                        dtype=np.int64)
+
+    def positions(self, col):
+        """The (sorted) row positions of the missing values in a column."""
+        count, data = self._columns[col]
+        if data.dtype == np.uint8:  # packed bits
+            return np.flatnonzero(self.column_mask(col))
+        return data
+
+    def column_mask(self, col):
+        """The dense boolean mask of the missing values in a column."""
+        count, data = self._columns[col]
+        if data.dtype == np.uint8:
+            return np.unpackbits(data)[:self.n_samples].astype(bool)
+
+        mask = np.zeros(self.n_samples, dtype=bool)
+        mask[data] = True
+        return mask
+
+    def missing_rows(self):
+        """The row positions with a missing value in any column."""
+        positions = [self.positions(c) for c in self._columns
+                     if self.count(c)]
+        if not positions:
+            return np.array([], dtype=np.intp)
+        return np.unique(np.concatenate(positions))
+
+    def __getitem__(self, key):
+        # Densify the mask of a single column (as a Series) or a list of
+        # columns (as a DataFrame), which lets the index stand in for the
+        # frame returned by ``pd.isnull(X[cols])``
+        if is_iterable(key):
+            return pd.DataFrame(OrderedDict(
+                (c, self.column_mask(c)) for c in key),
+                index=self.index, columns=list(key))
+        return pd.Series(self.column_mask(key), index=self.index, name=key)
+
+    def fill(self, X, value, cols=None):
+        """Fill the missing values of the indexed columns in place.
+
+        Only the missing positions are written, so the frame is never
+        masked as a whole.
+
+        Parameters
+        ----------
+        X : pd.DataFrame, shape=(n_samples, n_features)
+            The frame to fill, which must have the rows of the indexed
+            frame (in the same order).
+
+        value : object or dict
+            The fill value, or a dict mapping each column to its fill value.
+
+        cols : array-like or None, optional (default=None)
+            The columns to fill. If None, all of the indexed columns
+            present in ``X`` are filled.
+        """
+        if cols is None:
+            cols = [c for c in self._columns if c in X.columns]
+
+        for c in cols:
+            if not self.count(c):
+                continue
+
+            fill = value[c] if isinstance(value, dict) else value
+            X.iloc[self.positions(c), X.columns.get_loc(c)] = fill
+        return X
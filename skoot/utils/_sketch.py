@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+#
+# Author: Taylor Smith <taylor.smith@alkaline-ml.com>
+#
+# Mergeable sufficient statistics. These let stateful transformers be fit
+# one chunk at a time (``partial_fit``) when the training frame does not fit
+# in memory. Each accumulator can be updated with a new chunk of values or
+# merged with another accumulator built over a different chunk.
+
+from __future__ import division, absolute_import
+
+import numpy as np
+import pandas as pd
+
+__all__ = [
+    'DEFAULT_HEAVY_HITTERS_SIZE',
+    'DEFAULT_SKETCH_SIZE',
+    'HeavyHitters',
+    'QuantileSketch',
+    'RunningMoments',
+    'ValueCounts'
+]
+
+# The default number of (value, weight) pairs a QuantileSketch may hold
+# before it is compacted. Quantiles are exact until then.
+DEFAULT_SKETCH_SIZE = 10000
+
+# The default number of counters a HeavyHitters summary keeps
+DEFAULT_HEAVY_HITTERS_SIZE = 1000
+
+
+class RunningMoments(object):
+    """Running count, mean and variance of a numeric stream.
+
+    Chunks are combined with the pairwise update of Chan et al., so the
+    result does not depend on how the stream is split (up to floating
+    point error).
+    """
+    def __init__(self):
+        self.n = 0
+        self.mu = 0.
+        self.m2 = 0.
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        n = values.shape[0]
+        if n:
+            mu = values.mean()
+            self._combine(n, mu, ((values - mu) ** 2).sum())
+        return self
+
+    def merge(self, other):
+        self._combine(other.n, other.mu, other.m2)
+        return self
+
+    def _combine(self, n, mu, m2):
+        if not n:
+            return
+        total = self.n + n
+        delta = mu - self.mu
+        self.mu += delta * n / total
+        self.m2 += m2 + delta ** 2 * self.n * n / total
+        self.n = total
+
+    def mean(self):
+        return self.mu if self.n else np.nan
+
+    def std(self):
+        # the population (ddof=0) standard deviation, like np.nanstd
+        return np.sqrt(self.m2 / self.n) if self.n else np.nan
+
+
+class QuantileSketch(object):
+    """A mergeable sketch of the distribution of a numeric stream.
+
+    The sketch stores sorted, unique values with their counts (weights), so
+    it is exact for as long as the stream contains no more than ``size``
+    distinct values. Once that is exceeded, the sketch is compacted into
+    ``size // 2`` bins of roughly equal weight, each represented by the
+    value at its middle rank. Every compaction moves the rank of any value
+    by at most about ``2 * n / size`` (where ``n`` is the number of values
+    seen so far), so quantiles are approximate to within a small fraction
+    of a percent of ``n`` in rank for the default size.
+
+    Parameters
+    ----------
+    size : int, optional (default=DEFAULT_SKETCH_SIZE)
+        The maximum number of (value, weight) pairs held before compaction.
+
+    distinct : bool, optional (default=False)
+        Whether to sketch the distribution of the *distinct* values in the
+        stream rather than of all of them. Every value is counted once, no
+        matter how many times or in how many chunks it appears (exactly so
+        until the first compaction).
+    """
+    def __init__(self, size=DEFAULT_SKETCH_SIZE, distinct=False):
+        if size < 2:
+            raise ValueError("size must be an int >= 2")
+
+        self.size = size
+        self.distinct = distinct
+        self.values = np.empty(0, dtype=np.float64)
+        self.weights = np.empty(0, dtype=np.float64)
+        self.exact = True
+
+    @property
+    def count(self):
+        # the (estimated, if distinct) number of values in the stream
+        return self.weights.sum()
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values, counts = np.unique(values[~np.isnan(values)],
+                                   return_counts=True)
+        if self.distinct:
+            counts = np.ones(values.shape[0])
+        return self._insert(values, counts.astype(np.float64), True)
+
+    def merge(self, other):
+        if other.distinct != self.distinct:
+            raise ValueError("Cannot merge a distinct sketch with a "
+                             "non-distinct sketch")
+        return self._insert(other.values, other.weights, other.exact)
+
+    def _insert(self, values, weights, exact):
+        if not values.shape[0]:
+            return self
+
+        merged, inverse = np.unique(np.concatenate([self.values, values]),
+                                    return_inverse=True)
+        all_weights = np.concatenate([self.weights, weights])
+
+        # values present in both are summed, unless we're counting each
+        # distinct value only once
+        if self.distinct:
+            merged_weights = np.zeros(merged.shape[0])
+            np.maximum.at(merged_weights, inverse, all_weights)
+        else:
+            merged_weights = np.bincount(inverse, weights=all_weights)
+
+        self.values = merged
+        self.weights = merged_weights
+        self.exact = self.exact and exact
+
+        if merged.shape[0] > self.size:
+            self._compact()
+        return self
+
+    def _compact(self):
+        values, weights = self.values, self.weights
+        n_bins = self.size // 2
+        cum = np.cumsum(weights)
+        total = cum[-1]
+
+        # assign every value to one of n_bins equal-weight bins by the rank
+        # at which it starts
+        bins = np.minimum(((cum - weights) * n_bins / total).astype(np.intp),
+                          n_bins - 1)
+        starts = np.r_[0, np.flatnonzero(np.diff(bins)) + 1]
+        bin_weights = np.add.reduceat(weights, starts)
+
+        # and represent each bin by the value at its middle rank
+        middles = cum[starts] - weights[starts] + bin_weights / 2.
+        self.values = values[np.searchsorted(cum, middles, side="left")]
+        self.weights = bin_weights
+        self.exact = False
+
+    def value_at_rank(self, rank):
+        # the value at the (0-based) rank(s) in the sorted stream
+        cum = np.cumsum(self.weights)
+        idx = np.searchsorted(cum, rank, side="right")
+        return self.values[np.minimum(idx, self.values.shape[0] - 1)]
+
+    def quantile(self, q):
+        # linear interpolation between the closest ranks, like np.percentile
+        q = np.asarray(q, dtype=np.float64)
+        total = self.count
+        if not total:
+            return np.full(q.shape, np.nan) if q.ndim else np.nan
+
+        h = q * (total - 1)
+        lower = np.floor(h)
+        lo = self.value_at_rank(lower)
+        hi = self.value_at_rank(np.minimum(lower + 1, total - 1))
+        return lo + (hi - lo) * (h - lower)
+
+    def median(self):
+        return float(self.quantile(0.5))
+
+
+class ValueCounts(object):
+    """Streaming counts of the unique values (levels) in a stream.
+
+    Parameters
+    ----------
+    dropna : bool, optional (default=True)
+        Whether to exclude missing values from the counts.
+    """
+    def __init__(self, dropna=True):
+        self.dropna = dropna
+        self.counts = None
+
+    def update(self, values):
+        counts = pd.Series(values).value_counts(dropna=self.dropna)
+        return self._add(counts)
+
+    def merge(self, other):
+        if other.counts is None:
+            return self
+        return self._add(other.counts)
+
+    def _add(self, counts):
+        if self.counts is None:
+            self.counts = counts.copy()
+        else:
+            self.counts = self.counts.add(counts, fill_value=0) \
+                                     .astype(np.int64)
+        return self
+
+    def sorted_counts(self):
+        # the levels and their counts, in the (sorted) order of np.unique
+        if self.counts is None:
+            return np.empty(0), np.empty(0, dtype=np.int64)
+        levels = self.counts.index.values
+        order = np.argsort(levels, kind="mergesort")
+        return levels[order], self.counts.values[order]
+
+    def mode(self):
+        # the most frequent level. Ties go to the smallest level, like
+        # pd.Series.mode
+        if self.counts is None or not self.counts.shape[0]:
+            return np.nan
+        counts = self.counts.values
+        return np.sort(self.counts.index.values[counts == counts.max()])[0]
+
+
+class HeavyHitters(object):
+    """A mergeable summary of the most frequent values in a stream.
+
+    This is the Misra-Gries summary, which keeps at most ``size`` counters.
+    Each chunk of the stream is counted exactly (by hashing) and added to
+    the counters. Whenever there are more than ``size`` counters, the
+    ``size + 1``-th largest count is subtracted from all of them, and those
+    that drop to zero are discarded. Two summaries are merged the same way.
+    This gives a bounded-error guarantee: the count kept for any value
+    (zero if it was discarded) is never more than its true count, and never
+    less than its true count minus ``n / (size + 1)``, where ``n`` is the
+    number of values seen. Any value more frequent than ``n / (size + 1)``
+    is kept, and the mode of the summary occurs at most ``n / (size + 1)``
+    times fewer than the true mode.
+
+    Parameters
+    ----------
+    size : int, optional (default=DEFAULT_HEAVY_HITTERS_SIZE)
+        The maximum number of counters held.
+    """
+    def __init__(self, size=DEFAULT_HEAVY_HITTERS_SIZE):
+        if size < 1:
+            raise ValueError("size must be an int >= 1")
+
+        self.size = size
+        self.n = 0
+        self.counts = None
+
+    @property
+    def error(self):
+        # the most by which any count may be underestimated
+        return self.n / (self.size + 1)
+
+    def update(self, values):
+        counts = pd.Series(values).value_counts(dropna=True)
+        self.n += int(counts.sum())
+        return self._add(counts)
+
+    def merge(self, other):
+        if other.counts is None:
+            return self
+        self.n += other.n
+        return self._add(other.counts)
+
+    def _add(self, counts):
+        if self.counts is not None:
+            counts = self.counts.add(counts, fill_value=0).astype(np.int64)
+
+        size = self.size
+        if counts.shape[0] > size:
+            kth = np.partition(counts.values, -(size + 1))[-(size + 1)]
+            counts = counts[counts > kth] - kth
+
+        self.counts = counts
+        return self
+
+    def mode(self):
+        # the most frequent value kept. Ties go to the smallest value, like
+        # pd.Series.mode
+        if self.counts is None or not self.counts.shape[0]:
+            return np.nan
+        counts = self.counts.values
+        return np.sort(self.counts.index.values[counts == counts.max()])[0]
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+
+from skoot.utils._forest import (CompactBaggingClassifier,
+                                 CompactBaggingRegressor, compact_bagging,
+                                 pickled_nbytes)
+from skoot.utils.testing import assert_raises
+
+import numpy as np
+
+from sklearn.ensemble import BaggingClassifier, BaggingRegressor
+from sklearn.neighbors import KNeighborsRegressor
+
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+rs = np.random.RandomState(42)
+X = rs.rand(500, 6)
+X_test = rs.rand(200, 6)
+
+
+def test_compact_bagging_regressor():
+    y = X[:, 0] * 3 + np.sin(X[:, 1] * 5)
+    model = BaggingRegressor(n_estimators=8, max_features=0.5,
+                             random_state=42).fit(X, y)
+
+    compact = compact_bagging(model)
+    assert isinstance(compact, CompactBaggingRegressor)
+    assert compact.n_estimators == 8
+    assert_array_almost_equal(compact.predict(X_test), model.predict(X_test))
+
+    # each sample ends up in one leaf of each tree
+    leaves = compact.apply(X_test)
+    assert leaves.shape == (200, 8)
+    assert (compact.left_[leaves] == -1).all()
+
+    assert pickled_nbytes(compact) < pickled_nbytes(model)
+    assert compact.predict(X_test[:0]).shape == (0,)
+    assert_raises(ValueError, compact.predict, X_test[:, :3])
+
+
+def test_compact_bagging_classifier():
+    y = np.where(X[:, 0] + X[:, 1] > 1, 'a',
+                 np.where(X[:, 2] > 0.8, 'b', 'c'))
+    model = BaggingClassifier(n_estimators=8, max_samples=0.3,
+                              random_state=42).fit(X, y)
+
+    compact = compact_bagging(model)
+    assert isinstance(compact, CompactBaggingClassifier)
+    assert_array_almost_equal(compact.predict_proba(X_test),
+                              model.predict_proba(X_test))
+    assert_array_equal(compact.predict(X_test), model.predict(X_test))
+
+
+def test_compact_bagging_unsupported():
+    knn = BaggingRegressor(base_estimator=KNeighborsRegressor(),
+                           n_estimators=2).fit(X, X[:, 0])
+    assert_raises(TypeError, compact_bagging, knn)
+    assert_raises(TypeError, compact_bagging, knn.estimators_[0])
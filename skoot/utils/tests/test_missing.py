@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+
+from skoot.utils._missing import MissingIndex
+
+import numpy as np
+import pandas as pd
+
+from numpy.testing import assert_array_equal
+from pandas.util.testing import assert_frame_equal
+
+rs = np.random.RandomState(42)
+X = pd.DataFrame.from_records(rs.rand(1000, 3), columns=['a', 'b', 'c'])
+X.loc[[3, 500], 'a'] = np.nan  # few holes: stored as positions
+X.loc[rs.rand(1000) < 0.5, 'b'] = np.nan  # many holes: stored as bits
+
+
+def test_missing_index():
+    missing = MissingIndex(X)
+    mask = pd.isnull(X)
+
+    assert missing.columns == ['a', 'b', 'c']
+    assert_array_equal(missing.counts(), mask.sum().values)
+    assert missing.count('c') == 0
+    assert_array_equal(missing.positions('a'), [3, 500])
+
+    for c in X.columns:
+        assert_array_equal(missing.column_mask(c), mask[c].values)
+        assert_array_equal(missing.positions(c),
+                           np.flatnonzero(mask[c].values))
+
+    # it can stand in for the boolean frame
+    assert_frame_equal(missing[['a', 'b']], mask[['a', 'b']])
+    assert_array_equal(missing['b'], mask['b'])
+    assert_array_equal(missing.missing_rows(),
+                       np.flatnonzero(mask.values.any(axis=1)))
+
+
+def test_missing_index_fill():
+    filled = MissingIndex(X).fill(X.copy(), {'a': -1., 'b': -2., 'c': -3.})
+    assert_frame_equal(filled, X.fillna({'a': -1., 'b': -2.}))
+
+    # only some of the columns
+    filled = MissingIndex(X).fill(X.copy(), 0., cols=['a'])
+    assert_frame_equal(filled, X.fillna({'a': 0.}))
+
+    # other placeholders
+    X_int = pd.DataFrame({'a': [0, 1, 2, 0], 'b': [1, 1, 1, 1]})
+    missing = MissingIndex(X_int, missing_values=0)
+    assert_array_equal(missing.counts(), [2, 0])
+    assert_array_equal(missing.fill(X_int.copy(), 5)['a'], [5, 1, 2, 5])
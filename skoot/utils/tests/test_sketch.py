@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+
+from skoot.utils._sketch import (HeavyHitters, QuantileSketch,
+                                 RunningMoments, ValueCounts)
+from skoot.utils.testing import assert_raises
+
+import numpy as np
+import pandas as pd
+
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+rs = np.random.RandomState(42)
+x = rs.randn(20000)
+
+
+def test_quantile_sketch_exact():
+    ints = rs.randint(0, 100, 5000).astype(float)
+    sketch = QuantileSketch()
+    for chunk in np.array_split(ints, 7):
+        sketch.update(chunk)
+
+    assert sketch.exact
+    assert sketch.count == ints.shape[0]
+    q = np.linspace(0, 1, 11)
+    assert_array_almost_equal(sketch.quantile(q), np.percentile(ints, q * 100))
+    assert sketch.median() == np.median(ints)
+
+    # a distinct sketch counts each value once
+    distinct = QuantileSketch(distinct=True)
+    for chunk in np.array_split(ints, 7):
+        distinct.update(chunk)
+    assert_array_equal(distinct.values, np.unique(ints))
+    assert distinct.count == np.unique(ints).shape[0]
+
+
+def test_quantile_sketch_approximate():
+    sketch = QuantileSketch(size=500)
+    other = QuantileSketch(size=500)
+    for chunk in np.array_split(x[:10000], 10):
+        sketch.update(chunk)
+    for chunk in np.array_split(x[10000:], 10):
+        other.update(chunk)
+
+    sketch.merge(other)
+    assert not sketch.exact
+    assert sketch.values.shape[0] <= 500
+    assert sketch.count == x.shape[0]
+
+    # the rank of each quantile is close to the truth
+    for q in (0.01, 0.25, 0.5, 0.75, 0.99):
+        rank = (x <= sketch.quantile(q)).mean()
+        assert abs(rank - q) < 0.02, (q, rank)
+
+    # can't merge sketches of different kinds
+    assert_raises(ValueError, sketch.merge, QuantileSketch(distinct=True))
+
+
+def test_running_moments():
+    moments = RunningMoments()
+    assert np.isnan(moments.mean())
+
+    for chunk in np.array_split(x, 9):
+        moments.update(chunk)
+    assert_array_almost_equal([moments.mean(), moments.std()],
+                              [x.mean(), x.std()])
+
+
+def test_value_counts():
+    counts = ValueCounts()
+    assert np.isnan(counts.mode())
+
+    counts.update(np.array(['b', 'a', np.nan], dtype=object))
+    counts.merge(ValueCounts().update(np.array(['c', 'b', 'a'])))
+    levels, cts = counts.sorted_counts()
+    assert levels.tolist() == ['a', 'b', 'c']
+    assert cts.tolist() == [2, 2, 1]
+
+    # ties go to the smallest level, like pandas
+    assert counts.mode() == pd.Series(['b', 'a', 'c', 'b', 'a']).mode()[0]
+
+
+def test_heavy_hitters():
+    # exact while there are no more distinct values than counters
+    ints = rs.randint(0, 50, 5000)
+    hh = HeavyHitters(size=100)
+    for chunk in np.array_split(ints, 7):
+        hh.update(chunk)
+    assert hh.n == ints.shape[0]
+    assert hh.mode() == pd.Series(ints).mode()[0]
+
+    # a skewed stream with many more distinct values than counters
+    skewed = np.concatenate([rs.zipf(1.5, 20000) % 5000,
+                             rs.randint(0, 5000, 20000)])
+    rs.shuffle(skewed)
+    true_counts = pd.Series(skewed).value_counts()
+
+    # build the summary from chunks merged in a tree, as in parallel
+    sketches = [HeavyHitters(size=50).update(chunk)
+                for chunk in np.array_split(skewed, 8)]
+    while len(sketches) > 1:
+        sketches = [a.merge(b) for a, b in zip(sketches[::2], sketches[1::2])]
+    hh = sketches[0]
+
+    assert hh.counts.shape[0] <= 50
+    assert hh.error == skewed.shape[0] / 51.
+
+    # no count is over-estimated, nor under-estimated by more than the error
+    kept = true_counts[hh.counts.index]
+    assert (hh.counts <= kept).all()
+    assert (hh.counts >= kept - hh.error).all()
+    assert true_counts[hh.mode()] >= true_counts.max() - hh.error
+
+    assert np.isnan(HeavyHitters().mode())
+    assert_raises(ValueError, HeavyHitters, 0)
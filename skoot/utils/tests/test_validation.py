@@ -6,12 +6,16 @@ from skoot.utils.testing import assert_raises
 from skoot.utils.validation import (check_dataframe,
                                     validate_test_set_columns,
                                     validate_multiple_rows,
-                                    type_or_iterable_to_col_mapping)
+                                    type_or_iterable_to_col_mapping,
+                                    _assert_all_finite,
+                                    _FINITE_CHECK_BLOCK_SIZE)
 from sklearn.utils.validation import check_random_state
 
 import pandas as pd
 import numpy as np
 
+from numpy.testing import assert_array_equal
+
 # single random state used throughout the tests here
 random_state = check_random_state(42)
 
@@ -37,6 +41,17 @@ def test_check_dataframe_all_cols():
     assert X_copy.columns.tolist() == cols
 
 
+# test that copy=False returns the same frame
+def test_check_dataframe_no_copy():
+    X_same, _ = check_dataframe(X, cols=cols, copy=False)
+    assert X_same is X
+
+    # but an array is always converted to a new frame
+    X_arr, _ = check_dataframe(array, copy=False)
+    assert isinstance(X_arr, pd.DataFrame)
+    assert_array_equal(X_arr.values, array)
+
+
 # test valid assert_all_finite
 def test_check_dataframe_assert_all_finite():
     # a check with all columns present
@@ -137,6 +152,40 @@ def test_check_dataframe_infinite():
                   assert_all_finite=True)
 
 
+def test_assert_all_finite_blocks():
+    X_mixed = X.copy()
+    X_mixed['ints'] = np.arange(X.shape[0])
+    X_mixed['f32'] = X_mixed['col_0'].astype(np.float32)
+
+    # a block size smaller than a column forces one column per block
+    for block_size in (1, 300, _FINITE_CHECK_BLOCK_SIZE):
+        _assert_all_finite(X_mixed, X_mixed.columns.tolist(),
+                           block_size=block_size)
+
+        # put an inf in the last float32 column
+        X_inf = X_mixed.copy()
+        X_inf.loc[10, 'f32'] = np.inf
+        assert_raises(ValueError, _assert_all_finite, X_inf,
+                      X_inf.columns.tolist(), block_size=block_size)
+
+        # but it's fine if we don't check that column
+        _assert_all_finite(X_inf, cols, block_size=block_size)
+
+    # huge values that overflow the sum are still finite
+    X_big = pd.DataFrame.from_records(np.ones((10, 2)) * 1e308)
+    check_dataframe(X_big, assert_all_finite=True)
+
+
+def test_assert_all_finite_non_numeric():
+    X_obj = X.copy()
+    X_obj['strs'] = 'a'
+    assert_raises(TypeError, check_dataframe, X_obj,
+                  assert_all_finite=True)
+
+    # fine if the non-numeric column is not checked
+    check_dataframe(X_obj, cols=cols, assert_all_finite=True)
+
+
 def test_validate_test_cols():
     fit = ['a', 'b', 'c']
     test = ['a', 'b', 'c']
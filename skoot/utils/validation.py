@@ -6,7 +6,7 @@ from __future__ import absolute_import
 
 import pandas as pd
 import numpy as np
-import copy
+from copy import deepcopy
 
 from .iterables import is_iterable
 
@@ -19,7 +19,72 @@ __all__ = [
 ]
 
 
-def check_dataframe(X, cols=None, assert_all_finite=False, column_diff=False):
+# the max number of elements to pull out of a frame at a time when checking
+# for non-finite values. 2 ** 22 float64s is 32MB
+_FINITE_CHECK_BLOCK_SIZE = 2 ** 22
+
+
+def _assert_all_finite(X, cols, block_size=_FINITE_CHECK_BLOCK_SIZE):
+    """Assert that all values in the specified columns of X are finite.
+
+    Rather than checking one Series at a time, the columns are grouped by
+    dtype so each group can be checked over one contiguous block. Integer
+    and boolean columns cannot hold NaN or inf and are skipped entirely.
+    Each float block is checked with a single sum, which is only non-finite
+    if the block contains a NaN or inf (or overflows, in which case we fall
+    back to an element-wise check). Blocks are capped at ``block_size``
+    elements so wide frames never materialize a full copy, and the check
+    stops at the first block containing a non-finite value.
+
+    Parameters
+    ----------
+    X : pd.DataFrame, shape=(n_samples, n_features)
+        The frame to check.
+
+    cols : list
+        The columns in ``X`` to check.
+
+    block_size : int, optional (default=2 ** 22)
+        The max number of elements to check at once.
+    """
+    # group the columns by dtype, validating they're all numeric
+    groups = {}
+    non_numeric = []
+    for c, dtype in zip(cols, X.dtypes.loc[cols]):
+        kind = dtype.kind
+        if kind in "fc":
+            groups.setdefault(dtype, []).append(c)
+        elif kind not in "biu":  # ints and bools are always finite
+            non_numeric.append(c)
+
+    if non_numeric:
+        raise TypeError("Cannot check finiteness of non-numeric column(s): "
+                        "%r. Either encode or exclude them via `cols`."
+                        % non_numeric)
+
+    n_samples = X.shape[0]
+    step = max(1, block_size // max(1, n_samples))
+    for group in groups.values():
+        for i in range(0, len(group), step):
+            block_cols = group[i:i + step]
+            block = X[block_cols].values
+
+            # the sum is only non-finite if there is a NaN/inf in the block
+            # or the sum overflowed. In the latter case, check elementwise
+            with np.errstate(over="ignore"):
+                if np.isfinite(block.sum()):
+                    continue
+            finite = np.isfinite(block).all(axis=0)
+            if not finite.all():
+                raise ValueError("Expected all entries in specified columns "
+                                 "to be finite, but found non-finite values "
+                                 "in %r" % [c for c, f in zip(block_cols,
+                                                              finite)
+                                            if not f])
+
+
+def check_dataframe(X, cols=None, assert_all_finite=False, column_diff=False,
+                    copy=True):
     r"""Check an input dataframe.
 
     Determine whether an input frame is a Pandas dataframe or whether it can
@@ -48,13 +113,21 @@ def check_dataframe(X, cols=None, assert_all_finite=False, column_diff=False):
     assert_all_finite : bool, optional (default=False)
         Whether to assert that all values within the ``X`` frame are
         finite. Note that if ``cols`` is specified, this will only assert
-        all values in the specified columns are finite.
+        all values in the specified columns are finite. If any of the
+        checked columns are non-numeric, a TypeError will be raised.
 
     column_diff : bool, optional (default=False)
         Whether to also get the columns present in ``X`` that are not present
         in ``cols``. This is returned as the third element in the output if
         ``column_diff`` is True.
 
+    copy : bool, optional (default=True)
+        Whether to return a copy of ``X``. If False and ``X`` is already a
+        DataFrame, the frame itself is returned and any subsequent
+        modifications will be applied in place. Note that if ``X`` is not a
+        DataFrame, a new frame is created from it either way and no
+        additional copy is made.
+
     Examples
     --------
     When providing a dataframe and columns, the columns should be present:
@@ -101,7 +174,8 @@ def check_dataframe(X, cols=None, assert_all_finite=False, column_diff=False):
     Returns
     -------
     X_copy : DataFrame
-        A copy of the ``X`` dataframe.
+        A copy of the ``X`` dataframe (or ``X`` itself if ``copy`` is
+        False and ``X`` was passed as a DataFrame).
 
     cols : list
         The list of columns on which to apply a function to this dataframe.
@@ -113,7 +187,8 @@ def check_dataframe(X, cols=None, assert_all_finite=False, column_diff=False):
         tuple the columns that are within ``X`` but NOT present in ``cols``.
     """
     # determine if it's currently a DF or if it needs to be cast as one.
-    if not isinstance(X, pd.DataFrame):
+    is_frame = isinstance(X, pd.DataFrame)
+    if not is_frame:
         if not is_iterable(X):
             raise TypeError("X must be a DataFrame, iterable or np.ndarray, "
                             "but got type=%s" % type(X))
@@ -140,7 +215,7 @@ def check_dataframe(X, cols=None, assert_all_finite=False, column_diff=False):
     present_columns = set(X.columns)
     if cols is not None:
         # ensure iterable, or copy if not
-        cols = copy.deepcopy(cols) if is_iterable(cols) else [cols]
+        cols = deepcopy(cols) if is_iterable(cols) else [cols]
 
         # better to use "any" since it will short circuit!
         if any(c not in present_columns for c in cols):
@@ -159,13 +234,12 @@ def check_dataframe(X, cols=None, assert_all_finite=False, column_diff=False):
         cols = list(cols)
 
     # if specified, check that all values are finite
-    if assert_all_finite and \
-            X[cols].apply(lambda x: (~np.isfinite(x)).sum()).sum() > 0:
-        raise ValueError('Expected all entries in specified columns '
-                         'to be finite')
+    if assert_all_finite:
+        _assert_all_finite(X, cols)
 
-    # get the copy of X to return
-    X_copy = X.copy()
+    # get the copy of X to return. If X was not a frame to begin with, we
+    # already own the frame we just created and there's no need to copy it
+    X_copy = X.copy() if copy and is_frame else X
 
     # if column diff is defined, we need to get it...
     if column_diff: